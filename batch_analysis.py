@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+CS 6010 Data Science Programming - Project 2
+Batch Analysis Script
+
+This script analyzes every graph listed in a manifest (e.g. hundreds of ego
+networks or daily snapshots) across a pool of worker processes and writes
+per-graph metrics plus one consolidated summary table.
+"""
+
+import argparse
+import os
+import sys
+
+# Add src directory to path
+sys.path.append('src')
+
+from batch import read_manifest, run_batch
+from graph_analysis import GraphComparator
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+    """
+    parser = argparse.ArgumentParser(description="Analyze every graph listed in a manifest.")
+    parser.add_argument('manifest',
+                        help="CSV with a 'path' column (optional 'name' and 'directed' "
+                             "columns) or a text file with one graph path per line")
+    parser.add_argument('--output', default='results/batch',
+                        help="output directory (default: results/batch)")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="worker processes, i.e. graphs resident in memory at once (default: 1)")
+    parser.add_argument('--approximate', action='store_true',
+                        help="use the sampling estimators for expensive metrics")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="random seed for approximate mode")
+    parser.add_argument('--cache', default=None, metavar='DIR',
+                        help="persistent metrics cache directory shared across runs")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run the batch analysis described by the command-line options.
+    """
+    args = parse_args(argv)
+    entries = read_manifest(args.manifest)
+    print(f"Analyzing {len(entries)} graphs from {args.manifest} with {args.jobs} worker(s)...")
+    table = run_batch(entries, output_dir=args.output, n_jobs=args.jobs,
+                      approximate=args.approximate, seed=args.seed, cache_dir=args.cache)
+
+    # Rank every graph on every metric across the whole batch
+    comparator = GraphComparator.from_table(table.drop(columns=['path', 'seconds']))
+    rankings_path = os.path.join(args.output, 'rankings.csv')
+    comparator.rankings().to_csv(rankings_path)
+    print(f"Rankings saved to {rankings_path}")
+    
+    print("\nSummary:")
+    print(table.drop(columns=['path']).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ This script performs comprehensive graph analysis on two datasets and generates
 comparative results, visualizations, and reports.
 """
 
+import argparse
 import os
 import sys
 import json
@@ -18,14 +19,34 @@ matplotlib.use('Agg')  # Use non-interactive backend
 sys.path.append('src')
 
 from graph_analysis import GraphAnalyzer, GraphComparator, load_graph_from_file
+from metrics_cache import MetricsCache
 from data_loader import GraphDataLoader, create_sample_data
 from visualization import GraphVisualizer
 
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+    """
+    parser = argparse.ArgumentParser(description="Analyze and compare two graph datasets.")
+    parser.add_argument('--directed', nargs='+', choices=['a', 'b'], default=[], metavar='GRAPH',
+                        help="keep edge direction for these graphs (a and/or b), e.g. "
+                             "'--directed a' for the Bitcoin trust network")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="worker processes for metric computation (default: 1)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="recompute every metric instead of reusing results/cache")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     Main analysis function that orchestrates the entire graph analysis process.
     """
+    args = parse_args(argv)
+    directed_a = 'a' in args.directed
+    directed_b = 'b' in args.directed
+    
     print("=" * 60)
     print("CS 6010 Data Science Programming - Project 2")
     print("Graph Analysis and Network Communities")
@@ -59,7 +80,8 @@ def main():
             if graph_files:
                 graph_a_file = os.path.join(graph_a_dir, graph_files[0])
                 print(f"Loading Graph A from: {graph_a_file}")
-                graph_a = load_graph_from_file(graph_a_file)
+                graph_a = load_graph_from_file(graph_a_file, directed=directed_a,
+                                               snapshot_dir='results/snapshots')
         
         # Look for graph files in data/graph_b/ directory
         graph_b_dir = 'data/graph_b'
@@ -73,29 +95,30 @@ def main():
             if graph_files:
                 graph_b_file = os.path.join(graph_b_dir, graph_files[0])
                 print(f"Loading Graph B from: {graph_b_file}")
-                graph_b = load_graph_from_file(graph_b_file)
+                graph_b = load_graph_from_file(graph_b_file, directed=directed_b,
+                                               snapshot_dir='results/snapshots')
         
         # If graphs not found in subdirectories, try direct files
         if graph_a is None:
             if os.path.exists('data/graph_a.edgelist'):
-                graph_a = load_graph_from_file('data/graph_a.edgelist')
+                graph_a = load_graph_from_file('data/graph_a.edgelist', directed=directed_a)
             elif os.path.exists('data/graph_a.txt'):
-                graph_a = load_graph_from_file('data/graph_a.txt')
+                graph_a = load_graph_from_file('data/graph_a.txt', directed=directed_a)
         
         if graph_b is None:
             if os.path.exists('data/graph_b.edgelist'):
-                graph_b = load_graph_from_file('data/graph_b.edgelist')
+                graph_b = load_graph_from_file('data/graph_b.edgelist', directed=directed_b)
             elif os.path.exists('data/graph_b.txt'):
-                graph_b = load_graph_from_file('data/graph_b.txt')
+                graph_b = load_graph_from_file('data/graph_b.txt', directed=directed_b)
         
         # If still not found, use sample data
         if graph_a is None or graph_b is None:
             print("Downloaded graphs not found. Using sample data...")
             create_sample_data()
             if graph_a is None:
-                graph_a = load_graph_from_file('data/graph_a.edgelist')
+                graph_a = load_graph_from_file('data/graph_a.edgelist', directed=directed_a)
             if graph_b is None:
-                graph_b = load_graph_from_file('data/graph_b.edgelist')
+                graph_b = load_graph_from_file('data/graph_b.edgelist', directed=directed_b)
         
         print(f"✓ Graph A loaded: {graph_a.number_of_nodes()} nodes, {graph_a.number_of_edges()} edges")
         print(f"✓ Graph B loaded: {graph_b.number_of_nodes()} nodes, {graph_b.number_of_edges()} edges")
@@ -111,12 +134,14 @@ def main():
     analyzer_a = GraphAnalyzer(graph_a, "Graph A")
     analyzer_b = GraphAnalyzer(graph_b, "Graph B")
     
-    # Compute all metrics for both graphs
+    # Compute all metrics for both graphs (unchanged graphs reload from the cache)
+    metrics_cache = None if args.no_cache else MetricsCache('results/cache')
+    
     print("Computing metrics for Graph A...")
-    metrics_a = analyzer_a.compute_all_metrics()
+    metrics_a = analyzer_a.compute_all_metrics(n_jobs=args.jobs, cache=metrics_cache)
     
     print("Computing metrics for Graph B...")
-    metrics_b = analyzer_b.compute_all_metrics()
+    metrics_b = analyzer_b.compute_all_metrics(n_jobs=args.jobs, cache=metrics_cache)
     
     # Save metrics to files
     analyzer_a.save_metrics('results/metrics/graph_a_metrics.json')
@@ -166,14 +191,16 @@ def main():
     print("Creating connected components visualization...")
     try:
         visualizer.plot_connected_components(graph_a, "Graph A Connected Components",
-                                           save_path='results/figures/graph_a_components.png')
+                                           save_path='results/figures/graph_a_components.png',
+                                           component_labels=analyzer_a.node_components())
         print("✓ Graph A components plot saved")
     except Exception as e:
         print(f"✗ Error creating Graph A components plot: {e}")
     
     try:
         visualizer.plot_connected_components(graph_b, "Graph B Connected Components",
-                                           save_path='results/figures/graph_b_components.png')
+                                           save_path='results/figures/graph_b_components.png',
+                                           component_labels=analyzer_b.node_components())
         print("✓ Graph B components plot saved")
     except Exception as e:
         print(f"✗ Error creating Graph B components plot: {e}")
@@ -211,6 +238,8 @@ def main():
     # Initialize comparator
     comparator = GraphComparator(analyzer_a, analyzer_b)
     comparison_results = comparator.compare_metrics()
+    # Degree, spectral, NetLSD, graphlet and edge-overlap distances
+    comparator.structural_distances(cache=metrics_cache)
     
     # Save comparison results
     with open('results/metrics/comparison_results.json', 'w') as f:
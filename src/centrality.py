@@ -0,0 +1,262 @@
+"""
+Centrality measures and top-k centrality queries over CSR graphs.
+
+Closeness and harmonic centrality are read off one shared set of per-node
+distance sums from the bit-parallel BFS engine (exactly, from every source,
+or estimated from sampled sources). Eigenvector and Katz centrality use
+sparse power iteration with the same update rules as networkx.
+
+Rankings are selected with np.argpartition (linear-time introselect) rather
+than by sorting or keeping per-node dicts. Top-k closeness avoids running a
+full BFS from every node: candidates are visited in decreasing degree order
+and each BFS stops as soon as a lower bound on the node's farness shows it
+cannot beat the current k-th best closeness, which is kept in a min-heap.
+Full score vectors can be written to and memory-mapped from compact .npy
+arrays.
+"""
+
+import heapq
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from bfs import distance_sums
+from components import component_labels
+from csr_graph import CSRGraph
+
+
+def top_k(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the indices and values of the k largest scores, best first.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=scores.dtype)
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = best[np.argsort(-scores[best], kind='stable')]
+    return best, scores[best]
+
+
+def distance_centralities(graph: CSRGraph, sources: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute closeness and harmonic centrality from one bit-parallel BFS pass.
+
+    Both use distances from other nodes to each node (incoming distances for
+    directed graphs) like networkx; closeness applies the Wasserman-Faust
+    correction for nodes that only part of the graph reaches.
+
+    Args:
+        graph: CSRGraph object
+        sources: Sampled source node indices; per-node sums are scaled by
+                 n / len(sources) to estimate the full sums (all nodes when None)
+
+    Returns:
+        dict: 'closeness', 'harmonic' and 'farthest' (largest distance from
+        any source, an eccentricity lower bound) arrays over node indices
+    """
+    n = graph.number_of_nodes()
+    sums = distance_sums(graph, sources)
+    scale = 1.0 if sources is None else n / max(len(sources), 1)
+    reached = sums['reached'] * scale
+    closeness = np.zeros(n)
+    if n > 1:
+        np.divide(reached * reached, sums['distance_sum'] * scale * (n - 1),
+                  out=closeness, where=sums['distance_sum'] > 0)
+    return {'closeness': closeness, 'harmonic': sums['inverse_distance_sum'] * scale,
+            'farthest': sums['farthest']}
+
+
+def _power_iteration(step, n: int, tol: float, max_iter: int, name: str) -> np.ndarray:
+    """
+    Iterate x <- step(x) from the uniform vector until the L1 change is below
+    n * tol, normalizing each iterate to unit Euclidean length.
+    """
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = x
+        x = step(previous)
+        norm = np.linalg.norm(x)
+        if norm == 0:
+            return x
+        x = x / norm
+        if np.abs(x - previous).sum() < n * tol:
+            return x
+    print(f"Warning: {name} did not converge in {max_iter} iterations")
+    return x
+
+
+def eigenvector_centrality(graph: CSRGraph, tol: float = 1e-6, max_iter: int = 100) -> np.ndarray:
+    """
+    Eigenvector centrality (in-edges for directed graphs), computed as in
+    networkx by power iteration on A^T + I.
+    """
+    n = graph.number_of_nodes()
+    if n == 0:
+        return np.empty(0)
+    transposed = graph.to_scipy().T.tocsr().astype(np.float64)
+    return _power_iteration(lambda x: x + transposed @ x, n, tol, max_iter,
+                            'Eigenvector centrality')
+
+
+def spectral_radius(graph: CSRGraph, eigenvector: Optional[np.ndarray] = None) -> float:
+    """
+    Estimate the adjacency matrix's largest eigenvalue from the eigenvector
+    centrality vector (Rayleigh quotient), computing the vector if not given.
+    """
+    x = eigenvector_centrality(graph) if eigenvector is None else eigenvector
+    if not len(x) or not x.any():
+        return 0.0
+    return float(x @ (graph.to_scipy().T.astype(np.float64) @ x) / (x @ x))
+
+
+def katz_centrality(graph: CSRGraph, alpha: Optional[float] = None, beta: float = 1.0,
+                    tol: float = 1e-6, max_iter: int = 1000) -> np.ndarray:
+    """
+    Katz centrality x = alpha * A^T x + beta, normalized to unit length.
+
+    Args:
+        graph: CSRGraph object
+        alpha: Attenuation factor; it must be below 1 / spectral radius to
+               converge (defaults to 0.9 / spectral radius, or 0.1 when the
+               spectral radius is 0)
+        beta: Weight attributed to the immediate neighbourhood
+        tol: Convergence tolerance (L1 change below n * tol)
+        max_iter: Maximum number of iterations
+
+    Returns:
+        Array of Katz centrality per node index
+    """
+    n = graph.number_of_nodes()
+    if n == 0:
+        return np.empty(0)
+    if alpha is None:
+        radius = spectral_radius(graph)
+        alpha = 0.9 / radius if radius > 1e-9 else 0.1
+    transposed = graph.to_scipy().T.tocsr().astype(np.float64)
+    x = np.zeros(n)
+    for _ in range(max_iter):
+        previous = x
+        x = alpha * (transposed @ previous) + beta
+        if np.abs(x - previous).sum() < n * tol:
+            break
+    else:
+        print(f"Warning: Katz centrality did not converge in {max_iter} iterations")
+    norm = np.linalg.norm(x)
+    return x / norm if norm else x
+
+
+def _neighbourhood(indptr: np.ndarray, indices: np.ndarray, frontier: np.ndarray) -> np.ndarray:
+    """
+    Concatenated neighbour lists of the frontier nodes.
+    """
+    starts, ends = indptr[frontier], indptr[frontier + 1]
+    lengths = ends - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return indices[offsets + np.arange(lengths.sum())]
+
+
+def _pruned_farness(indptr: np.ndarray, indices: np.ndarray, degrees: np.ndarray,
+                    source: int, reach: int, limit: float, visited: np.ndarray) -> Optional[int]:
+    """
+    Farness (sum of distances) of a source within its component, or None as
+    soon as a lower bound on it exceeds limit.
+    """
+    visited[source] = True
+    touched = [np.array([source])]
+    frontier = touched[0]
+    seen, farness, level = 1, 0, 0
+    result = None
+    while True:
+        remaining = reach - seen
+        if remaining == 0:
+            result = farness
+            break
+        # Level d+1 holds at most the frontier's edges that do not lead back
+        # to the previous level; the rest of the component is at least d+2 away
+        next_bound = int(degrees[frontier].sum()) - (len(frontier) if level else 0)
+        close = min(max(next_bound, 0), remaining)
+        if farness + (level + 1) * close + (level + 2) * (remaining - close) > limit:
+            break
+        neighbours = _neighbourhood(indptr, indices, frontier)
+        frontier = np.unique(neighbours[~visited[neighbours]])
+        visited[frontier] = True
+        touched.append(frontier)
+        level += 1
+        seen += len(frontier)
+        farness += level * len(frontier)
+    for nodes in touched:
+        visited[nodes] = False
+    return result
+
+
+def top_k_closeness(graph: CSRGraph, k: int = 10) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Find the k nodes with the highest closeness centrality (networkx
+    definition with the Wasserman-Faust correction for disconnected graphs).
+
+    Args:
+        graph: CSRGraph (directed graphs are measured on their undirected version)
+        k: Number of nodes to return
+
+    Returns:
+        Tuple of (node indices best first, closeness values, number of BFS
+        runs completed without pruning)
+    """
+    graph = graph.to_undirected().without_self_loops()
+    n = graph.number_of_nodes()
+    if n <= 1:
+        return np.arange(n), np.zeros(n), 0
+    indptr, indices = graph.indptr, graph.indices
+    degrees = np.diff(indptr)
+    _, labels = component_labels(graph)
+    reach = np.bincount(labels)[labels]
+
+    heap = []  # (closeness, node) of the best k so far, worst on top
+    visited = np.zeros(n, dtype=bool)
+    completed = 0
+    for source in np.argsort(-degrees, kind='stable'):
+        r = int(reach[source])
+        if r <= 1:
+            continue
+        scale = (r - 1) ** 2 / (n - 1)
+        # closeness = scale / farness, so beating the k-th best needs a small farness
+        limit = scale / heap[0][0] if len(heap) == k and heap[0][0] > 0 else np.inf
+        farness = _pruned_farness(indptr, indices, degrees, int(source), r, limit, visited)
+        if farness is None:
+            continue
+        completed += 1
+        entry = (scale / farness, -int(source))
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    ranked = sorted(heap, reverse=True)
+    nodes = np.array([-node for _, node in ranked], dtype=np.int64)
+    values = np.array([value for value, _ in ranked], dtype=np.float64)
+    if len(nodes) < min(k, n):
+        # Isolated nodes have closeness 0
+        rest = np.setdiff1d(np.arange(n), nodes)[:min(k, n) - len(nodes)]
+        nodes = np.concatenate([nodes, rest])
+        values = np.concatenate([values, np.zeros(len(rest))])
+    return nodes, values, completed
+
+
+def save_vectors(directory: str, vectors: Dict[str, np.ndarray], node_ids: np.ndarray,
+                 dtype=np.float32):
+    """
+    Write full centrality vectors as compact .npy arrays (one per measure,
+    plus node_ids.npy mapping rows to node identifiers).
+    """
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, 'node_ids.npy'), np.asarray(node_ids))
+    for name, values in vectors.items():
+        np.save(os.path.join(directory, f'{name}.npy'), np.asarray(values, dtype=dtype))
+
+
+def load_vector(directory: str, name: str, mmap: bool = True) -> np.ndarray:
+    """
+    Load one saved centrality vector, memory-mapped by default.
+    """
+    return np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r' if mmap else None)
@@ -0,0 +1,490 @@
+"""
+Community detection over CSR graphs: Louvain and Leiden with vectorized moves.
+
+Local moving is synchronous: in every sweep each node's edge weights to the
+communities of its neighbours are aggregated with one sort, the modularity
+gain of every candidate move is evaluated at once and all improving moves
+are applied together. Sweeps that would lower modularity (nodes swapping
+into each other's communities) are retried with a random subset of the
+movers. Communities are then aggregated into a coarse graph and the process
+repeats. The Leiden variant refines every community into its connected parts
+before aggregation, so no reported community is internally disconnected.
+
+resolution_sweep runs a grid of resolutions and seeds in a process pool and
+scores each setting by modularity and by the stability (NMI) of its
+partitions across seeds. Each seed walks the resolutions from high to low and
+resumes from the first-level aggregate of the previous one.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from concurrent.futures import ProcessPoolExecutor
+from scipy.sparse.csgraph import connected_components
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from csr_graph import CSRGraph
+from kcore import leaf_labels
+
+
+COMMUNITY_METHODS = ('louvain', 'leiden')
+SWEEP_METHODS = COMMUNITY_METHODS + ('label_propagation',)
+
+_worker_graph = None
+
+
+def modularity(graph: CSRGraph, labels: np.ndarray, resolution: float = 1.0) -> float:
+    """
+    Modularity of a partition (same definition as networkx.community.modularity).
+
+    Args:
+        graph: CSRGraph (directed graphs use the directed definition)
+        labels: Community label per node index
+        resolution: Resolution parameter (higher favours smaller communities)
+
+    Returns:
+        float: Modularity of the partition
+    """
+    labels = np.unique(labels, return_inverse=True)[1]
+    rows, cols = graph.row_indices(), graph.indices
+    intra = labels[rows] == labels[cols]
+    if graph.is_directed():
+        m = len(cols)
+        if m == 0:
+            return 0.0
+        out_tot = np.bincount(labels, weights=graph.out_degrees())
+        in_tot = np.bincount(labels, weights=graph.in_degrees())
+        return float(np.count_nonzero(intra) / m - resolution * (out_tot @ in_tot) / m ** 2)
+
+    degrees = graph.degrees()
+    two_m = float(degrees.sum())
+    if two_m == 0:
+        return 0.0
+    # Undirected edges are stored twice and self-loops once but count as degree 2
+    internal = np.count_nonzero(intra) + np.count_nonzero(intra & (rows == cols))
+    totals = np.bincount(labels, weights=degrees)
+    return float(internal / two_m - resolution * (totals @ totals) / two_m ** 2)
+
+
+def adjacency_matrix(graph: CSRGraph) -> sp.csr_matrix:
+    """
+    Symmetric weighted adjacency of the undirected graph with self-loops
+    weighted 2, so row sums equal degrees.
+    """
+    n = graph.number_of_nodes()
+    if n == 0 or graph.number_of_edges() == 0:
+        return sp.csr_matrix((n, n), dtype=np.float64)
+    # to_scipy() wraps the graph's read-only arrays
+    adjacency = graph.to_undirected().to_scipy().tocsr().astype(np.float64, copy=True)
+    adjacency.setdiag(adjacency.diagonal() * 2)
+    adjacency.eliminate_zeros()
+    return adjacency
+
+
+def _partition_quality(rows, cols, weights, diagonal, strengths, labels, two_m, resolution):
+    internal = weights[labels[rows] == labels[cols]].sum() + diagonal.sum()
+    totals = np.bincount(labels, weights=strengths)
+    return internal / two_m - resolution * (totals @ totals) / two_m ** 2
+
+
+def _quality_change(neighbours, moved, labels, candidate, strengths, two_m, resolution) -> float:
+    """
+    Modularity change when the moved nodes switch from labels to candidate,
+    evaluated on the edges of the moved nodes only.
+    """
+    sub = neighbours[moved]
+    heads = np.repeat(moved, np.diff(sub.indptr))
+    tails = sub.indices
+    change = ((candidate[heads] == candidate[tails]).astype(np.float64)
+              - (labels[heads] == labels[tails])) * sub.data
+    # Edges to unmoved nodes are also stored in the other direction
+    is_moved = np.zeros(len(labels), dtype=bool)
+    is_moved[moved] = True
+    internal = (change * np.where(is_moved[tails], 1.0, 2.0)).sum()
+
+    old_totals = np.bincount(labels, weights=strengths)
+    new_totals = np.bincount(candidate, weights=strengths)
+    return (internal / two_m
+            - resolution * (new_totals @ new_totals - old_totals @ old_totals) / two_m ** 2)
+
+
+def _move_nodes(adjacency: sp.csr_matrix, labels: np.ndarray, resolution: float,
+                rng: np.random.Generator, max_sweeps: int = 100,
+                tol: float = 1e-7) -> np.ndarray:
+    """
+    Synchronous local moving on a weighted graph, starting from labels.
+
+    After the first sweep only nodes next to a node that moved are
+    reconsidered (as in Leiden's fast local moving). Returns the improved
+    labels (not renumbered).
+    """
+    n = adjacency.shape[0]
+    diagonal = adjacency.diagonal().astype(np.float64)
+    strengths = np.asarray(adjacency.sum(axis=1)).ravel()
+    neighbours = adjacency - sp.diags(diagonal)
+    neighbours.eliminate_zeros()
+    neighbours = neighbours.tocsr()
+    coo = neighbours.tocoo()
+    rows, cols, weights = coo.row, coo.col, coo.data
+    two_m = strengths.sum()
+    if two_m == 0 or len(rows) == 0:
+        return labels
+
+    labels = labels.astype(np.int64).copy()
+    quality = _partition_quality(rows, cols, weights, diagonal, strengths, labels, two_m, resolution)
+    active = np.arange(n)
+    move_fraction = 1.0
+
+    for _ in range(max_sweeps):
+        totals = np.bincount(labels, weights=strengths, minlength=n)
+        sizes = np.bincount(labels, minlength=n)
+
+        # Weight from every active node to each neighbouring community: relabel
+        # the columns of its adjacency rows and let SciPy merge duplicates
+        sub = neighbours[active]
+        links = sp.csr_matrix((sub.data, labels[sub.indices], sub.indptr), shape=(len(active), n))
+        links.sum_duplicates()
+        counts = np.diff(links.indptr)
+        node = np.repeat(active, counts)
+        target = links.indices.astype(np.int64)
+        link = links.data
+
+        own = labels[node] == target
+        target_totals = totals[target] - own * strengths[node]
+        score = link - resolution * strengths[node] * target_totals / two_m
+
+        # Staying put scores the weight to the own community (0 if none)
+        stay = -resolution * strengths * (totals[labels] - strengths) / two_m
+        stay[node[own]] = score[own]
+
+        # Best candidate per node (first community among equal scores)
+        starts = links.indptr[:-1][counts > 0]
+        if not len(starts):
+            break
+        best_score = np.maximum.reduceat(score, starts)
+        positions = np.where(score == np.repeat(best_score, counts[counts > 0]),
+                             np.arange(len(node)), len(node))
+        first = np.minimum.reduceat(positions, starts)
+        best_node, best_target = node[first], target[first]
+
+        improving = (best_score > stay[best_node] + 1e-12) & (best_target != labels[best_node])
+        # Two singletons may only merge towards the smaller label, so they cannot swap
+        singleton = (sizes[labels[best_node]] == 1) & (sizes[best_target] == 1)
+        improving &= ~singleton | (best_target < labels[best_node])
+        if move_fraction < 1.0:
+            improving &= rng.random(len(best_node)) < move_fraction
+        if not improving.any():
+            if move_fraction < 1.0:
+                move_fraction = 1.0
+                continue
+            break
+
+        moved = best_node[improving]
+        candidate = labels.copy()
+        candidate[moved] = best_target[improving]
+        new_quality = quality + _quality_change(neighbours, moved, labels, candidate, strengths,
+                                                two_m, resolution)
+        if new_quality <= quality + tol:
+            # Simultaneous moves interfered; retry with fewer movers
+            move_fraction /= 2
+            if move_fraction < 1.0 / 64:
+                break
+            continue
+        labels, quality = candidate, new_quality
+        move_fraction = min(1.0, move_fraction * 2)
+        touched = np.zeros(n, dtype=bool)
+        touched[moved] = True
+        touched[neighbours[moved].indices] = True
+        active = np.flatnonzero(touched)
+
+    return labels
+
+
+def _refine(adjacency: sp.csr_matrix, labels: np.ndarray) -> np.ndarray:
+    """
+    Split every community into its connected parts.
+    """
+    coo = adjacency.tocoo()
+    intra = labels[coo.row] == labels[coo.col]
+    inside = sp.csr_matrix((coo.data[intra], (coo.row[intra], coo.col[intra])),
+                           shape=adjacency.shape)
+    return connected_components(inside, directed=False)[1].astype(np.int64)
+
+
+def _aggregate(adjacency: sp.csr_matrix, labels: np.ndarray) -> sp.csr_matrix:
+    n, k = len(labels), int(labels.max(initial=-1)) + 1
+    membership = sp.csr_matrix((np.ones(n), (np.arange(n), labels)), shape=(n, k))
+    return (membership.T @ adjacency @ membership).tocsr()
+
+
+def community_levels(graph: CSRGraph, method: str = 'louvain', resolution: float = 1.0,
+                     seed: Optional[int] = None, max_levels: int = 32,
+                     start: Optional[Tuple[sp.csr_matrix, np.ndarray]] = None) -> List[np.ndarray]:
+    """
+    Run Louvain or Leiden and return the partition found at every level.
+
+    Args:
+        graph: CSRGraph (directed graphs are clustered on their undirected version)
+        method: 'louvain' or 'leiden'
+        resolution: Resolution parameter (higher favours smaller communities)
+        seed: Random seed for the retries of interfering moves
+        max_levels: Maximum number of aggregation levels
+        start: Optional (coarse adjacency, node -> coarse node labels) to resume
+               from an aggregated graph instead of the original one
+
+    Returns:
+        list: Community labels per node index (contiguous from 0), one array per
+        level from finest to coarsest
+    """
+    if method not in COMMUNITY_METHODS:
+        raise ValueError(f"Unknown community method: {method}")
+    rng = np.random.default_rng(seed)
+    original = adjacency_matrix(graph) if start is None or method == 'leiden' else None
+    if start is None:
+        adjacency = original
+        node_map = np.arange(graph.number_of_nodes(), dtype=np.int64)
+    else:
+        adjacency, node_map = start
+    labels = np.arange(adjacency.shape[0], dtype=np.int64)
+    levels = []
+
+    for _ in range(max_levels):
+        labels = np.unique(_move_nodes(adjacency, labels, resolution, rng), return_inverse=True)[1]
+        partition = labels[node_map]
+        if method == 'leiden':
+            # Moves can leave a community disconnected once others leave it
+            partition = _refine(original, partition)
+        partition = np.unique(partition, return_inverse=True)[1]
+        if not levels or not np.array_equal(partition, levels[-1]):
+            levels.append(partition)
+
+        pieces = _refine(adjacency, labels) if method == 'leiden' else labels
+        num_pieces = int(pieces.max(initial=-1)) + 1
+        if num_pieces == adjacency.shape[0]:
+            break
+        # Coarse nodes are the (refined) pieces; under Leiden they start out in
+        # the community their piece came from
+        coarse_labels = np.zeros(num_pieces, dtype=np.int64)
+        coarse_labels[pieces] = labels
+        adjacency = _aggregate(adjacency, pieces)
+        node_map = pieces[node_map]
+        labels = coarse_labels
+
+    return levels
+
+
+def detect_partition(graph: CSRGraph, method: str = 'louvain', resolution: float = 1.0,
+                     seed: Optional[int] = None,
+                     core: Optional[np.ndarray] = None) -> Tuple[np.ndarray, float]:
+    """
+    Find communities with Louvain or Leiden.
+
+    Args:
+        graph: CSRGraph object
+        method: 'louvain' or 'leiden'
+        resolution: Resolution parameter
+        seed: Random seed
+        core: Optional core numbers; degree-1 leaves are then merged into
+              their neighbour before the first level, which shrinks the graph
+              the first moving phase works on. Only applied for resolution
+              <= 1, where joining its neighbour's community never lowers
+              modularity for a leaf
+
+    Returns:
+        Tuple of (community label per node index, modularity of the partition)
+    """
+    start = None
+    if core is not None and resolution <= 1:
+        groups = leaf_labels(graph, core)
+        if groups.max(initial=-1) + 1 < len(groups):
+            start = (_aggregate(adjacency_matrix(graph), groups), groups)
+    labels = community_levels(graph, method, resolution, seed, start=start)[-1]
+    return labels, modularity(graph, labels, resolution)
+
+
+def _independent_sets(neighbours: sp.csr_matrix, rng: np.random.Generator) -> List[np.ndarray]:
+    """
+    Partition the nodes into independent sets (a graph colouring) by repeatedly
+    taking the nodes whose random priority beats all uncoloured neighbours.
+    """
+    n = neighbours.shape[0]
+    priority = rng.permutation(n)
+    rows = np.repeat(np.arange(n), np.diff(neighbours.indptr))
+    cols = neighbours.indices
+    uncolored = np.ones(n, dtype=bool)
+    classes = []
+    while uncolored.any():
+        live = uncolored[rows] & uncolored[cols]
+        rows, cols = rows[live], cols[live]
+        blocked = np.zeros(n, dtype=bool)
+        blocked[rows[priority[cols] > priority[rows]]] = True
+        members = np.flatnonzero(uncolored & ~blocked)
+        classes.append(members)
+        uncolored[members] = False
+    return classes
+
+
+def label_propagation(graph: CSRGraph, seed: Optional[int] = None,
+                      max_rounds: int = 100) -> np.ndarray:
+    """
+    Semi-synchronous label propagation.
+
+    Nodes are coloured so that no two neighbours share a colour; colour
+    classes then update one after another, which behaves like asynchronous
+    propagation but is vectorized per class. Each node adopts the label with
+    the largest edge weight among its neighbours (ties broken at random,
+    current label kept when it is among the best) until no node can change.
+
+    Args:
+        graph: CSRGraph (directed graphs use their undirected version)
+        seed: Random seed for the colouring and tie breaking
+        max_rounds: Maximum number of rounds over all colour classes
+
+    Returns:
+        Community label per node index (contiguous from 0)
+    """
+    rng = np.random.default_rng(seed)
+    adjacency = adjacency_matrix(graph)
+    neighbours = adjacency - sp.diags(adjacency.diagonal())
+    neighbours.eliminate_zeros()
+    neighbours = neighbours.tocsr()
+    n = neighbours.shape[0]
+    labels = np.arange(n, dtype=np.int64)
+    if neighbours.nnz == 0:
+        return labels
+    jitter = 0.5 * neighbours.data.min()
+    classes = [members[np.diff(neighbours.indptr)[members] > 0]
+               for members in _independent_sets(neighbours, rng)]
+
+    for _ in range(max_rounds):
+        changed = False
+        for members in classes:
+            if not len(members):
+                continue
+            sub = neighbours[members]
+            links = sp.csr_matrix((sub.data, labels[sub.indices], sub.indptr),
+                                  shape=(len(members), n))
+            links.sum_duplicates()
+            counts = np.diff(links.indptr)
+            row = np.repeat(np.arange(len(members)), counts)
+            starts = links.indptr[:-1]
+
+            best = np.maximum.reduceat(links.data, starts)
+            own = np.zeros(len(members))
+            is_own = links.indices == labels[members][row]
+            own[row[is_own]] = links.data[is_own]
+            unstable = best > own
+            if not unstable.any():
+                continue
+
+            noisy = links.data + rng.random(len(links.data)) * jitter
+            best_noisy = np.maximum.reduceat(noisy, starts)
+            positions = np.where(noisy == np.repeat(best_noisy, counts),
+                                 np.arange(len(row)), len(row))
+            choice = links.indices[np.minimum.reduceat(positions, starts)]
+            labels[members[unstable]] = choice[unstable]
+            changed = True
+        if not changed:
+            break
+
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def normalized_mutual_info(labels_a: np.ndarray, labels_b: np.ndarray) -> float:
+    """
+    Normalized mutual information of two partitions (arithmetic-mean normalization).
+    """
+    a = np.unique(labels_a, return_inverse=True)[1]
+    b = np.unique(labels_b, return_inverse=True)[1]
+    n = len(a)
+    if n == 0:
+        return 1.0
+    contingency = sp.csr_matrix((np.ones(n), (a, b))).tocoo()
+    joint = contingency.data / n
+    p_a = np.bincount(a) / n
+    p_b = np.bincount(b) / n
+    mutual = float((joint * np.log(joint / (p_a[contingency.row] * p_b[contingency.col]))).sum())
+    entropy_a = float(-(p_a * np.log(p_a)).sum())
+    entropy_b = float(-(p_b * np.log(p_b)).sum())
+    if entropy_a + entropy_b == 0:
+        return 1.0
+    return max(0.0, 2 * mutual / (entropy_a + entropy_b))
+
+
+def _init_worker(graph: CSRGraph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _sweep_seed(method: str, resolutions: Sequence[float], seed: Optional[int],
+                reuse_levels: bool) -> List[np.ndarray]:
+    """
+    Partitions of one seed for every resolution (highest resolution first).
+    """
+    graph = _worker_graph
+    if method == 'label_propagation':
+        return [label_propagation(graph, seed)] * len(resolutions)
+
+    partitions = []
+    start = None
+    for resolution in resolutions:
+        levels = community_levels(graph, method, resolution, seed, start=start)
+        partitions.append(levels[-1])
+        if reuse_levels and start is None:
+            # Finer communities of a higher resolution nest in coarser ones, so
+            # lower resolutions resume from this first-level aggregate
+            start = (_aggregate(adjacency_matrix(graph), levels[0]), levels[0])
+    return partitions
+
+
+def resolution_sweep(graph: CSRGraph, resolutions: Sequence[float] = (0.5, 1.0, 1.5, 2.0),
+                     seeds: Sequence[int] = (0, 1, 2), method: str = 'louvain',
+                     n_jobs: int = 1, reuse_levels: bool = True) -> List[Dict]:
+    """
+    Run community detection over a grid of resolutions and seeds.
+
+    Args:
+        graph: CSRGraph object
+        resolutions: Resolution values to try
+        seeds: Random seeds per resolution
+        method: 'louvain', 'leiden' or 'label_propagation' (resolution then only
+                affects the modularity score)
+        n_jobs: Number of worker processes (seeds run in parallel)
+        reuse_levels: Resume lower resolutions from the first-level aggregate of
+                      the highest one instead of starting from single nodes
+
+    Returns:
+        list: One dict per resolution (ascending) with mean/std modularity, mean
+        community count, stability (mean pairwise NMI across seeds) and the
+        labels and seed of the best-modularity run
+    """
+    if method not in SWEEP_METHODS:
+        raise ValueError(f"Unknown community method: {method}")
+    order = sorted(resolutions, reverse=True)
+    seeds = list(seeds)
+
+    if n_jobs > 1 and len(seeds) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                 initargs=(graph,)) as executor:
+            runs = list(executor.map(_sweep_seed, [method] * len(seeds), [order] * len(seeds),
+                                     seeds, [reuse_levels] * len(seeds)))
+    else:
+        _init_worker(graph)
+        runs = [_sweep_seed(method, order, seed, reuse_levels) for seed in seeds]
+
+    results = []
+    for i, resolution in reversed(list(enumerate(order))):
+        partitions = [run[i] for run in runs]
+        scores = np.array([modularity(graph, labels, resolution) for labels in partitions])
+        pairs = [normalized_mutual_info(partitions[a], partitions[b])
+                 for a in range(len(partitions)) for b in range(a + 1, len(partitions))]
+        best = int(np.argmax(scores))
+        results.append({
+            'resolution': resolution,
+            'modularity': float(scores.mean()),
+            'modularity_std': float(scores.std()),
+            'num_communities': float(np.mean([labels.max(initial=-1) + 1 for labels in partitions])),
+            'stability': float(np.mean(pairs)) if pairs else 1.0,
+            'best_seed': seeds[best],
+            'labels': partitions[best]
+        })
+    return results
@@ -0,0 +1,452 @@
+"""
+Compact CSR (compressed sparse row) graph representation.
+
+A CSRGraph stores adjacency as two immutable NumPy arrays (indptr/indices)
+plus the array of original node identifiers, so every metric can work on
+integer node indices instead of NetworkX dict-of-dicts. Optional per-edge
+attribute arrays (e.g. ratings, timestamps) are stored aligned with indices. Graphs can be saved
+as binary snapshots (one .npy file per array plus meta.json) and loaded back
+memory-mapped, so repeated runs and worker processes share the page cache
+instead of re-parsing or copying the graph.
+"""
+
+import json
+import os
+
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+from typing import Dict, Optional, Sequence
+
+
+INDEX_DTYPE = np.int32
+SNAPSHOT_VERSION = 1
+SNAPSHOT_ARRAYS = ('indptr', 'indices', 'node_ids')
+
+
+class CSRGraph:
+    """
+    Immutable compressed sparse row graph.
+
+    Node ``i`` has the (sorted) neighbours ``indices[indptr[i]:indptr[i + 1]]``.
+    Undirected graphs store every edge in both directions (self-loops once);
+    directed graphs store out-edges only. ``edge_data[name][k]`` is the value of
+    attribute ``name`` on the edge stored at ``indices[k]``.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray,
+                 node_ids: Optional[np.ndarray] = None, directed: bool = False,
+                 edge_data: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Initialize the CSR graph from prebuilt arrays.
+
+        Args:
+            indptr: Row pointer array of length num_nodes + 1
+            indices: Column index array (neighbour indices, sorted per row)
+            node_ids: Original node identifiers, one per row (defaults to 0..n-1)
+            directed: Whether the graph is directed
+            edge_data: Per-edge attribute arrays aligned with indices
+        """
+        num_nodes = len(indptr) - 1
+        if node_ids is None:
+            node_ids = np.arange(num_nodes)
+        if len(node_ids) != num_nodes:
+            raise ValueError("node_ids must have one entry per node")
+        edge_data = edge_data or {}
+        if any(len(values) != len(indices) for values in edge_data.values()):
+            raise ValueError("edge_data arrays must have one entry per stored edge")
+
+        self.indptr = _readonly(indptr)
+        self.indices = _readonly(indices)
+        self.node_ids = _readonly(np.asarray(node_ids))
+        self.directed = directed
+        self.edge_data = {name: _readonly(values) for name, values in edge_data.items()}
+        self.snapshot_path = None
+        self._cache = {}
+
+    @classmethod
+    def from_edges(cls, src: np.ndarray, dst: np.ndarray, num_nodes: Optional[int] = None,
+                   node_ids: Optional[np.ndarray] = None, directed: bool = False,
+                   edge_data: Optional[Dict[str, np.ndarray]] = None) -> 'CSRGraph':
+        """
+        Build a CSR graph from integer edge arrays.
+
+        Duplicate edges are collapsed, keeping the attributes of the last
+        occurrence (as NetworkX does); undirected edges are symmetrized.
+
+        Args:
+            src: Source node indices
+            dst: Target node indices
+            num_nodes: Number of nodes (defaults to max index + 1)
+            node_ids: Original node identifiers for indices 0..num_nodes-1
+            directed: Whether the edges are directed
+            edge_data: Per-edge attribute arrays aligned with src/dst
+
+        Returns:
+            CSRGraph object
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if num_nodes is None:
+            if node_ids is not None:
+                num_nodes = len(node_ids)
+            else:
+                num_nodes = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+
+        edge_data = {name: np.asarray(values) for name, values in (edge_data or {}).items()}
+
+        if not directed:
+            if edge_data:
+                # Resolve duplicates per unordered pair first so both stored
+                # directions of an edge carry the same attributes
+                low, high = np.minimum(src, dst), np.maximum(src, dst)
+                keep = _last_occurrences(low * num_nodes + high)
+                src, dst = low[keep], high[keep]
+                edge_data = {name: values[keep] for name, values in edge_data.items()}
+                edge_data = {name: np.concatenate([values, values])
+                             for name, values in edge_data.items()}
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+
+        # Row-major edge keys sort by (source, target) and make deduplication one sort
+        keys = src * num_nodes + dst
+        if edge_data:
+            order = _last_occurrences(keys)
+            keys = keys[order]
+            edge_data = {name: values[order] for name, values in edge_data.items()}
+        else:
+            # Sorting directly avoids np.unique's hash-based path, which is far
+            # slower on large, sparse key ranges
+            keys = np.sort(keys)
+            keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+        rows = keys // num_nodes
+        cols = keys - rows * num_nodes
+
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+        if indptr[-1] <= np.iinfo(INDEX_DTYPE).max:
+            indptr = indptr.astype(INDEX_DTYPE)
+
+        return cls(indptr, cols.astype(INDEX_DTYPE), node_ids=node_ids, directed=directed,
+                   edge_data=edge_data)
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph, edge_attrs: Optional[Sequence[str]] = None) -> 'CSRGraph':
+        """
+        Build a CSR graph from a NetworkX graph.
+
+        Args:
+            graph: NetworkX graph object
+            edge_attrs: Numeric edge attributes to keep as edge_data (defaults to
+                        the attributes of the first edge; attributes missing on
+                        any edge are dropped)
+
+        Returns:
+            CSRGraph object with node_ids in the graph's node order
+        """
+        index = {node: i for i, node in enumerate(graph)}
+        num_edges = graph.number_of_edges()
+        src = np.fromiter((index[u] for u, _ in graph.edges()), dtype=np.int64, count=num_edges)
+        dst = np.fromiter((index[v] for _, v in graph.edges()), dtype=np.int64, count=num_edges)
+
+        if edge_attrs is None:
+            first = next(iter(graph.edges(data=True)), None)
+            edge_attrs = [name for name, value in first[2].items()
+                          if isinstance(value, (int, float, np.number))] if first else []
+        edge_data = {}
+        for name in edge_attrs:
+            values = [data.get(name) for _, _, data in graph.edges(data=True)]
+            if None not in values:
+                edge_data[name] = np.asarray(values)
+
+        node_ids = np.empty(len(index), dtype=object)
+        node_ids[:] = list(index)
+        node_ids = _compact_ids(node_ids)
+
+        return cls.from_edges(src, dst, num_nodes=len(index), node_ids=node_ids,
+                              directed=graph.is_directed(), edge_data=edge_data)
+
+    def save(self, path: str, source: Optional[dict] = None):
+        """
+        Save the graph as a binary snapshot directory.
+
+        Args:
+            path: Snapshot directory (created if needed)
+            source: Optional description of the data the graph was built from,
+                    stored in the metadata to detect stale snapshots
+        """
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, 'meta.json')
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        for name in SNAPSHOT_ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, name),
+                    allow_pickle=name == 'node_ids')
+        for name, values in self.edge_data.items():
+            np.save(os.path.join(path, f"edge_{name}.npy"), values)
+        meta = {
+            'version': SNAPSHOT_VERSION,
+            'directed': self.directed,
+            'edge_data': sorted(self.edge_data),
+            'num_nodes': self.number_of_nodes(),
+            'num_edges': self.number_of_edges(),
+            'source': source
+        }
+        # Written last so a partially saved snapshot is never considered valid
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'CSRGraph':
+        """
+        Load a snapshot written by save.
+
+        Args:
+            path: Snapshot directory
+            mmap: Memory-map the arrays read-only instead of reading them into memory
+
+        Returns:
+            CSRGraph object
+        """
+        meta = read_snapshot_meta(path)
+        if meta is None:
+            raise ValueError(f"Not a CSR graph snapshot: {path}")
+        files = list(SNAPSHOT_ARRAYS) + [f"edge_{name}" for name in meta.get('edge_data', [])]
+        arrays = {}
+        for name in files:
+            array_path = os.path.join(path, f"{name}.npy")
+            try:
+                arrays[name] = np.load(array_path, mmap_mode='r' if mmap else None)
+            except ValueError:
+                # Object arrays (mixed node id types) cannot be memory-mapped
+                arrays[name] = np.load(array_path, allow_pickle=True)
+        edge_data = {name: arrays[f"edge_{name}"] for name in meta.get('edge_data', [])}
+        graph = cls(arrays['indptr'], arrays['indices'], node_ids=arrays['node_ids'],
+                    directed=meta['directed'], edge_data=edge_data)
+        if mmap:
+            graph.snapshot_path = os.path.abspath(path)
+        return graph
+
+    def __getstate__(self):
+        if self.snapshot_path is not None:
+            # Workers re-map the snapshot instead of receiving a copy of the arrays
+            return {'snapshot_path': self.snapshot_path}
+        return self.__dict__
+
+    def __setstate__(self, state):
+        if set(state) == {'snapshot_path'}:
+            state = CSRGraph.load(state['snapshot_path']).__dict__
+        self.__dict__.update(state)
+
+    def number_of_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    def number_of_edges(self) -> int:
+        """
+        Number of edges with NetworkX semantics (undirected edges counted once).
+        """
+        if self.directed:
+            return len(self.indices)
+        return (len(self.indices) + self.self_loop_count()) // 2
+
+    def is_directed(self) -> bool:
+        return self.directed
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """
+        Return the (out-)neighbour indices of node index ``i``.
+        """
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def row_indices(self) -> np.ndarray:
+        """
+        Return the source index of every stored edge (COO row array).
+        """
+        if 'rows' not in self._cache:
+            rows = np.repeat(np.arange(self.number_of_nodes(), dtype=INDEX_DTYPE),
+                             np.diff(self.indptr))
+            self._cache['rows'] = _readonly(rows)
+        return self._cache['rows']
+
+    def self_loop_count(self) -> int:
+        if 'self_loops' not in self._cache:
+            self._cache['self_loops'] = int(np.count_nonzero(self.row_indices() == self.indices))
+        return self._cache['self_loops']
+
+    def out_degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def in_degrees(self) -> np.ndarray:
+        if not self.directed:
+            return self.out_degrees()
+        return np.bincount(self.indices, minlength=self.number_of_nodes())
+
+    def degrees(self) -> np.ndarray:
+        """
+        Node degrees with NetworkX semantics: in + out degree for directed graphs,
+        self-loops counted twice for undirected graphs.
+        """
+        if self.directed:
+            return self.out_degrees() + self.in_degrees()
+        degrees = self.out_degrees().astype(np.int64)
+        if self.self_loop_count():
+            rows = self.row_indices()
+            degrees += np.bincount(rows[rows == self.indices], minlength=self.number_of_nodes())
+        return degrees
+
+    def has_edges(self, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        """
+        Vectorized edge membership test.
+
+        Args:
+            src: Source node indices
+            dst: Target node indices
+
+        Returns:
+            Boolean array, True where the edge (src[i], dst[i]) exists
+        """
+        if 'edge_keys' not in self._cache:
+            keys = self.row_indices().astype(np.int64) * self.number_of_nodes() + self.indices
+            self._cache['edge_keys'] = _readonly(keys)
+        edge_keys = self._cache['edge_keys']
+        queries = np.asarray(src, dtype=np.int64) * self.number_of_nodes() + np.asarray(dst)
+        if len(edge_keys) == 0:
+            return np.zeros(len(queries), dtype=bool)
+        positions = np.minimum(np.searchsorted(edge_keys, queries), len(edge_keys) - 1)
+        return edge_keys[positions] == queries
+
+    def without_self_loops(self) -> 'CSRGraph':
+        """
+        Return the graph with self-loops removed (self if there are none).
+        """
+        if not self.self_loop_count():
+            return self
+        rows = self.row_indices()
+        keep = rows != self.indices
+        # Dropping entries keeps the remaining edges sorted and unique
+        indptr = np.zeros(self.number_of_nodes() + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows[keep], minlength=self.number_of_nodes()), out=indptr[1:])
+        return CSRGraph(indptr.astype(self.indptr.dtype), self.indices[keep], node_ids=self.node_ids,
+                        directed=self.directed, edge_data=self._edge_data_at(keep))
+
+    def to_undirected(self) -> 'CSRGraph':
+        """
+        Return the undirected (symmetrized) version of the graph.
+        """
+        if not self.directed:
+            return self
+        if 'undirected' not in self._cache:
+            self._cache['undirected'] = CSRGraph.from_edges(
+                self.row_indices(), self.indices, num_nodes=self.number_of_nodes(),
+                node_ids=self.node_ids, directed=False, edge_data=self.edge_data)
+        return self._cache['undirected']
+
+    def subgraph(self, nodes: np.ndarray) -> 'CSRGraph':
+        """
+        Return the subgraph induced by the given node indices.
+
+        Args:
+            nodes: Array of node indices to keep (order defines the new indices)
+
+        Returns:
+            CSRGraph induced on ``nodes``
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        relabel = np.full(self.number_of_nodes(), -1, dtype=np.int64)
+        relabel[nodes] = np.arange(len(nodes))
+        src = relabel[self.row_indices()]
+        dst = relabel[self.indices]
+        keep = (src >= 0) & (dst >= 0)
+        return CSRGraph.from_edges(src[keep], dst[keep], num_nodes=len(nodes),
+                                   node_ids=self.node_ids[nodes], directed=self.directed,
+                                   edge_data=self._edge_data_at(keep))
+
+    def _edge_data_at(self, mask: np.ndarray) -> Dict[str, np.ndarray]:
+        return {name: values[mask] for name, values in self.edge_data.items()}
+
+    def to_scipy(self) -> sp.csr_matrix:
+        """
+        Return the adjacency as a SciPy CSR matrix sharing the index arrays.
+        """
+        n = self.number_of_nodes()
+        data = np.ones(len(self.indices), dtype=np.float64)
+        return sp.csr_matrix((data, self.indices, self.indptr), shape=(n, n))
+
+    def to_networkx(self) -> nx.Graph:
+        """
+        Materialize the graph as a NetworkX graph using the original node ids.
+        """
+        graph = nx.DiGraph() if self.directed else nx.Graph()
+        graph.add_nodes_from(self.node_ids.tolist())
+        rows, cols = self.row_indices(), self.indices
+        edge_data = self.edge_data
+        if not self.directed:
+            # Each undirected edge is stored twice; add it once
+            keep = rows <= cols
+            rows, cols = rows[keep], cols[keep]
+            edge_data = self._edge_data_at(keep)
+        edges = zip(self.node_ids[rows].tolist(), self.node_ids[cols].tolist())
+        if edge_data:
+            names = list(edge_data)
+            attributes = (dict(zip(names, values))
+                          for values in zip(*(edge_data[name].tolist() for name in names)))
+            edges = ((u, v, data) for (u, v), data in zip(edges, attributes))
+        graph.add_edges_from(edges)
+        return graph
+
+    def index_of(self, node) -> int:
+        """
+        Return the integer index of an original node identifier.
+        """
+        if 'index' not in self._cache:
+            self._cache['index'] = {node_id: i for i, node_id in enumerate(self.node_ids.tolist())}
+        return self._cache['index'][node]
+
+    def nbytes(self) -> int:
+        return (self.indptr.nbytes + self.indices.nbytes + self.node_ids.nbytes
+                + sum(values.nbytes for values in self.edge_data.values()))
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        return (f"CSRGraph({kind}, {self.number_of_nodes()} nodes, "
+                f"{self.number_of_edges()} edges)")
+
+
+def read_snapshot_meta(path: str) -> Optional[dict]:
+    """
+    Return the metadata of a snapshot directory, or None if path is not a
+    snapshot of a supported version.
+    """
+    try:
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get('version') != SNAPSHOT_VERSION:
+        return None
+    return meta
+
+
+def _last_occurrences(keys: np.ndarray) -> np.ndarray:
+    """
+    Return the positions of the last occurrence of each distinct key, in key order.
+    """
+    _, first_reversed = np.unique(keys[::-1], return_index=True)
+    return len(keys) - 1 - first_reversed
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    view = np.asarray(array).view()
+    view.flags.writeable = False
+    return view
+
+
+def _compact_ids(node_ids: np.ndarray) -> np.ndarray:
+    """
+    Store node identifiers as a typed array when they are all integers or all strings.
+    """
+    values = node_ids.tolist()
+    if values and all(type(v) is int for v in values):
+        return np.asarray(values, dtype=np.int64)
+    if values and all(type(v) is str for v in values):
+        return np.asarray(values, dtype=str)
+    return node_ids
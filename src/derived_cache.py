@@ -0,0 +1,72 @@
+"""
+Lazy cache of structures derived from a graph (CSR views, component labels,
+largest component, degree arrays, triangle counts...).
+
+Entries are built at most once per graph state; the owner stamps the cache
+with a token describing the graph and the cache empties itself whenever the
+token changes.
+"""
+
+from typing import Any, Callable, Dict, Hashable
+
+
+class DerivedCache:
+    """
+    Dictionary-like cache whose entries are tied to a graph state token.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.token = None
+
+    def validate(self, token: Hashable) -> bool:
+        """
+        Compare the graph state token with the one the entries were built for.
+
+        Args:
+            token: Hashable description of the current graph state
+
+        Returns:
+            bool: True if the entries are still valid, False if they were dropped
+        """
+        if token == self.token:
+            return True
+        self._entries.clear()
+        self.token = token
+        return False
+
+    def get(self, key: str, builder: Callable[[], Any]) -> Any:
+        """
+        Return a cached entry, building it on first use.
+
+        Args:
+            key: Entry name
+            builder: Zero-argument function producing the entry
+
+        Returns:
+            The cached value
+        """
+        if key not in self._entries:
+            self._entries[key] = builder()
+        return self._entries[key]
+
+    def update(self, entries: Dict):
+        self._entries.update(entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def keys(self):
+        return self._entries.keys()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: str) -> Any:
+        return self._entries[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self._entries[key] = value
+
+    def __repr__(self) -> str:
+        return f"DerivedCache({sorted(self._entries)})"
@@ -0,0 +1,370 @@
+"""
+Streaming edge-list reader.
+
+Reads plain, gzip, bz2 or xz edge lists in fixed-size byte chunks and parses
+each chunk straight into NumPy arrays, so large SNAP-style files are loaded
+with bounded memory and without writing decompressed copies to disk. Extra
+columns (weights, signs, timestamps) are kept as typed per-edge arrays.
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+import time
+import warnings
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+COMPRESSED_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+COMMENT_PREFIXES = ('#', '%')
+ENDPOINT_NAMES = ('source', 'target')
+
+# Column layout of SNAP signed networks (e.g. soc-sign-bitcoinalpha.csv);
+# None marks the endpoint columns, which hold node labels
+SIGNED_TEMPORAL_SCHEMA = (('source', None), ('target', None),
+                          ('rating', np.int8), ('time', np.int64))
+
+
+def split_compression(filepath: str) -> Tuple[str, Optional[str]]:
+    """
+    Split a compression extension off a path.
+
+    Returns:
+        Tuple of (path without compression extension, extension or None)
+    """
+    root, ext = os.path.splitext(filepath)
+    if ext in COMPRESSED_OPENERS:
+        return root, ext
+    return filepath, None
+
+
+def open_binary(filepath: str):
+    """
+    Open a possibly compressed file for binary reading.
+    """
+    _, ext = split_compression(filepath)
+    opener = COMPRESSED_OPENERS.get(ext, open)
+    return opener(filepath, 'rb')
+
+
+def iter_line_chunks(stream, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Yield blocks of complete lines read from a binary stream in fixed-size chunks.
+    """
+    remainder = b''
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            break
+        block = remainder + block
+        cut = block.rfind(b'\n') + 1
+        if cut == 0:
+            remainder = block
+            continue
+        remainder = block[cut:]
+        yield block[:cut]
+    if remainder.strip():
+        yield remainder + b'\n'
+
+
+def _strip_comments(block: bytes, comments: Sequence[str]) -> bytes:
+    prefixes = tuple(c.encode() for c in comments)
+    if not any(p in block for p in prefixes):
+        return block
+    lines = block.split(b'\n')
+    return b'\n'.join(line for line in lines if not line.lstrip().startswith(prefixes))
+
+
+def _count_columns(block: bytes) -> int:
+    for line in block.split(b'\n'):
+        if line.strip():
+            return len(line.split())
+    return 0
+
+
+def count_tokens(block: bytes) -> int:
+    """
+    Number of whitespace-separated tokens in a block (bytes up to 0x20 separate).
+    """
+    data = np.frombuffer(block, dtype=np.uint8)
+    if not len(data):
+        return 0
+    space = data <= 0x20
+    return int(np.count_nonzero(space[:-1] > space[1:])) + int(not space[0])
+
+
+def parse_numbers(block: bytes, dtype, count: int) -> Optional[np.ndarray]:
+    """
+    Parse a whitespace-separated block of numbers in C.
+
+    np.fromstring raises on the first unparsable token under NumPy 2 but only
+    warns and stops early under NumPy 1.x, so the result is checked against
+    the expected number of tokens.
+
+    Returns:
+        1D array of the values, or None if some token is not of that dtype
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            values = np.fromstring(block, dtype=dtype, sep=' ')
+        except ValueError:
+            return None
+    return values if len(values) == count else None
+
+
+def _drop_first_line(block: bytes) -> Tuple[bytes, bool]:
+    """
+    Remove the first non-blank line of a block; returns (block, whether a line was removed).
+    """
+    start = 0
+    while start < len(block):
+        end = block.find(b'\n', start)
+        end = len(block) if end < 0 else end + 1
+        if block[start:end].strip():
+            return block[:start] + block[end:], True
+        start = end
+    return block, False
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def sniff_table(filepath: str, delimiter: Optional[str] = None,
+                comments: Sequence[str] = COMMENT_PREFIXES) -> Tuple[Optional[List[str]], int]:
+    """
+    Inspect the first lines of an edge table.
+
+    The first line is taken as a header when it names the endpoint columns
+    (e.g. 'source,target') or has a non-numeric field where the second line
+    has a number.
+
+    Returns:
+        Tuple of (header column names or None, number of columns)
+    """
+    rows = []
+    with open_binary(filepath) as stream:
+        for line in stream:
+            line = line.decode(errors='replace').strip()
+            if not line or line.startswith(tuple(comments)):
+                continue
+            rows.append([field.strip() for field in line.split(delimiter)])
+            if len(rows) == 2:
+                break
+    if not rows:
+        return None, 0
+
+    first = rows[0]
+    names = [field.lower() for field in first]
+    is_header = all(name in names for name in ENDPOINT_NAMES)
+    if not is_header and len(rows) == 2:
+        is_header = any(not _is_number(a) and _is_number(b) for a, b in zip(first, rows[1]))
+    return (first if is_header else None), len(first)
+
+
+def _parse_block(block: bytes, num_columns: int) -> np.ndarray:
+    """
+    Parse a whitespace-separated block into a (rows, num_columns) array.
+
+    Integers are parsed in C; floats and arbitrary string labels fall back to
+    slower paths.
+    """
+    count = count_tokens(block)
+    if count % num_columns:
+        raise ValueError("Edge list rows have inconsistent numbers of columns")
+    for dtype in (np.int64, np.float64):
+        values = parse_numbers(block, dtype, count)
+        if values is not None:
+            return values.reshape(-1, num_columns)
+    return np.array(block.split()).reshape(-1, num_columns)
+
+
+def iter_edge_blocks(filepath: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                     comments: Sequence[str] = COMMENT_PREFIXES,
+                     delimiter: Optional[str] = None,
+                     stats: Optional[Dict] = None,
+                     header: bool = False) -> Iterator[np.ndarray]:
+    """
+    Stream an edge list as parsed 2D blocks (one row per edge, one column per field).
+
+    Args:
+        filepath: Path to a plain or compressed edge list
+        chunk_bytes: Uncompressed bytes read per chunk
+        comments: Line prefixes marking comment lines
+        delimiter: Field delimiter (None for any whitespace)
+        stats: Optional dict updated with 'bytes' read
+        header: Skip the first non-comment line
+
+    Yields:
+        numpy arrays of shape (edges_in_chunk, num_columns)
+    """
+    sep = delimiter.encode() if delimiter and not delimiter.isspace() else None
+    num_columns = 0
+    with open_binary(filepath) as stream:
+        for block in iter_line_chunks(stream, chunk_bytes):
+            if stats is not None:
+                stats['bytes'] = stats.get('bytes', 0) + len(block)
+            block = _strip_comments(block, comments)
+            if header:
+                block, dropped = _drop_first_line(block)
+                header = not dropped
+            if sep is not None:
+                block = block.replace(sep, b' ')
+            if not num_columns:
+                num_columns = _count_columns(block)
+                if not num_columns:
+                    continue
+            yield _parse_block(block, num_columns)
+
+
+def _cast_column(name: str, values: np.ndarray, dtype) -> np.ndarray:
+    """
+    Convert a parsed attribute column to its schema dtype. With dtype None the
+    column becomes int64, float64 or (when not numeric) str.
+    """
+    if values.dtype.kind in 'SU':
+        try:
+            values = values.astype(np.float64)
+        except ValueError:
+            if dtype is None:
+                return values.astype(str)
+            raise ValueError(f"Column {name} is not numeric")
+    if dtype is None:
+        if values.dtype.kind == 'f' and np.all(values == np.floor(values)):
+            return values.astype(np.int64)
+        return values
+    dtype = np.dtype(dtype)
+    if dtype.kind in 'iu':
+        info = np.iinfo(dtype)
+        if values.dtype.kind == 'f' and not np.all(values == np.floor(values)):
+            raise ValueError(f"Column {name} has non-integer values")
+        if len(values) and (values.min() < info.min or values.max() > info.max):
+            raise ValueError(f"Column {name} does not fit in {dtype}")
+    return values.astype(dtype)
+
+
+def read_edge_table(filepath: str, schema: Optional[Sequence[Tuple[str, object]]] = None,
+                    delimiter: Optional[str] = None, header: Optional[bool] = None,
+                    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                    comments: Sequence[str] = COMMENT_PREFIXES,
+                    keep_attributes: bool = True,
+                    verbose: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict, Dict]:
+    """
+    Read an edge table (endpoints plus attribute columns) into compact arrays.
+
+    Node labels are factorized to contiguous int32 indices; the returned node_ids
+    map indices back to the original labels (ints when every label is an integer).
+    The endpoints are the columns named 'source' and 'target', or the first two.
+
+    Args:
+        filepath: Path to a plain, .gz, .bz2 or .xz edge table
+        schema: (column name, dtype) pairs in file order; attribute columns are
+                cast to their dtype (None infers int64 or float64). Defaults to
+                the header names, or 'source', 'target', 'col2', ...
+        delimiter: Field delimiter (None for any whitespace)
+        header: Whether the first line is a header (None detects it)
+        chunk_bytes: Uncompressed bytes read per chunk
+        comments: Line prefixes marking comment lines
+        keep_attributes: Convert and return the attribute columns (False skips them)
+        verbose: Print a throughput summary
+
+    Returns:
+        Tuple of (source indices, target indices, node_ids, dict of attribute
+        arrays by column name, stats dict with 'bytes', 'edges', 'seconds',
+        'mb_per_s' and 'edges_per_s')
+    """
+    start = time.perf_counter()
+    names = None
+    if header is None or schema is None:
+        names, num_columns = sniff_table(filepath, delimiter, comments)
+        if header is None:
+            header = names is not None
+        elif not header:
+            names = None
+    if schema is None:
+        if not names:
+            names = list(ENDPOINT_NAMES) + [f"col{i}" for i in range(2, num_columns)]
+        schema = [(name, None) for name in names]
+    column_names = [name for name, _ in schema]
+    endpoints = [column_names.index(name) if name in column_names else i
+                 for i, name in enumerate(ENDPOINT_NAMES)]
+
+    stats = {'bytes': 0}
+    columns = [[] for _ in schema]
+    for block in iter_edge_blocks(filepath, chunk_bytes, comments, delimiter, stats, header):
+        if block.shape[1] != len(schema):
+            raise ValueError(f"Expected {len(schema)} columns in {filepath}, found {block.shape[1]}")
+        for j, parts in enumerate(columns):
+            parts.append(block[:, j])
+
+    sources, targets = columns[endpoints[0]], columns[endpoints[1]]
+    if any(part.dtype.kind == 'S' for part in sources + targets):
+        # Some chunk held non-numeric labels, so every label is treated as a string
+        sources = [part.astype(str) for part in sources]
+        targets = [part.astype(str) for part in targets]
+    if sources:
+        src = np.concatenate(sources)
+        dst = np.concatenate(targets)
+    else:
+        src = dst = np.empty(0, dtype=np.int64)
+
+    if src.dtype.kind == 'f':
+        if not (np.all(src == np.floor(src)) and np.all(dst == np.floor(dst))):
+            raise ValueError(f"Non-integer node labels in {filepath}")
+        src, dst = src.astype(np.int64), dst.astype(np.int64)
+
+    attributes = {}
+    for j, (name, dtype) in enumerate(schema):
+        if j in endpoints or not keep_attributes:
+            continue
+        values = np.concatenate(columns[j]) if columns[j] else np.empty(0)
+        attributes[name] = _cast_column(name, values, dtype)
+    del columns, sources, targets
+
+    node_ids, inverse = np.unique(np.concatenate([src, dst]), return_inverse=True)
+    inverse = inverse.astype(np.int32)
+    src_idx, dst_idx = inverse[:len(src)], inverse[len(src):]
+
+    seconds = time.perf_counter() - start
+    stats.update({
+        'edges': len(src_idx),
+        'seconds': seconds,
+        'mb_per_s': stats['bytes'] / 1e6 / seconds if seconds > 0 else float('inf'),
+        'edges_per_s': len(src_idx) / seconds if seconds > 0 else float('inf')
+    })
+    if verbose:
+        print(f"Read {stats['edges']} edges ({stats['bytes'] / 1e6:.1f} MB) from {filepath} "
+              f"in {seconds:.2f}s ({stats['mb_per_s']:.1f} MB/s)")
+    return src_idx, dst_idx, node_ids, attributes, stats
+
+
+def read_edge_arrays(filepath: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                     comments: Sequence[str] = COMMENT_PREFIXES,
+                     delimiter: Optional[str] = None,
+                     verbose: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict]:
+    """
+    Read an edge list into compact integer arrays, ignoring any extra columns.
+
+    Args:
+        filepath: Path to a plain, .gz, .bz2 or .xz edge list
+        chunk_bytes: Uncompressed bytes read per chunk
+        comments: Line prefixes marking comment lines
+        delimiter: Field delimiter (None for any whitespace)
+        verbose: Print a throughput summary
+
+    Returns:
+        Tuple of (source indices, target indices, node_ids, stats dict)
+    """
+    src_idx, dst_idx, node_ids, _, stats = read_edge_table(
+        filepath, delimiter=delimiter, header=False, chunk_bytes=chunk_bytes,
+        comments=comments, keep_attributes=False, verbose=verbose)
+    return src_idx, dst_idx, node_ids, stats
@@ -0,0 +1,217 @@
+"""
+Loader for SNAP ego-network bundles (e.g. the Facebook ``facebook/`` directory).
+
+Each ego ``e`` contributes ``e.edges`` (edges among its friends), ``e.feat``
+and ``e.egofeat`` (binary profile features of the friends and of the ego),
+``e.featnames`` (names of the ego's local feature columns) and ``e.circles``
+(friend lists). The whole bundle is parsed once, optionally in a process
+pool across egos, into a combined CSRGraph, a sparse node-by-feature matrix
+over the union of all feature names and a sparse node-by-circle membership
+matrix.
+"""
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+import scipy.sparse as sp
+
+from csr_graph import CSRGraph
+from edge_reader import count_tokens, parse_numbers
+
+
+EGO_EXTENSIONS = ('.edges', '.circles', '.feat', '.egofeat', '.featnames')
+
+
+def is_ego_bundle(path: str) -> bool:
+    return os.path.isdir(path) and bool(glob.glob(os.path.join(path, '*.edges')))
+
+
+def _read_int_table(path: str) -> np.ndarray:
+    """
+    Read a whitespace-separated integer table as a 2D array (one row per line).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    lines = [line for line in data.split(b'\n') if line.strip()]
+    if not lines:
+        return np.empty((0, 0), dtype=np.int64)
+    count = count_tokens(data)
+    values = parse_numbers(data, np.int64, count)
+    if values is None or count % len(lines):
+        raise ValueError(f"{path} is not a table of integers with equal-length rows")
+    return values.reshape(len(lines), -1)
+
+
+def _parse_ego(directory: str, ego: int) -> Dict:
+    """
+    Parse the files of one ego into arrays of global node ids.
+    """
+    prefix = os.path.join(directory, str(ego))
+    result = {'ego': ego}
+
+    edges = _read_int_table(prefix + '.edges')
+    result['edges'] = edges.reshape(-1, 2)
+
+    names = []
+    if os.path.exists(prefix + '.featnames'):
+        with open(prefix + '.featnames') as f:
+            # Lines are '<local column> <feature name>'
+            names = [line.rstrip('\n').split(' ', 1)[1] for line in f if line.strip()]
+    result['feature_names'] = names
+
+    feat_nodes = np.empty(0, dtype=np.int64)
+    feat_rows = feat_cols = np.empty(0, dtype=np.int64)
+    if os.path.exists(prefix + '.feat'):
+        table = _read_int_table(prefix + '.feat')
+        if table.size:
+            feat_nodes = table[:, 0]
+            rows, feat_cols = np.nonzero(table[:, 1:])
+            feat_rows = feat_nodes[rows]
+    if os.path.exists(prefix + '.egofeat'):
+        values = _read_int_table(prefix + '.egofeat').ravel()
+        cols = np.flatnonzero(values)
+        feat_rows = np.concatenate([feat_rows, np.full(len(cols), ego, dtype=np.int64)])
+        feat_cols = np.concatenate([feat_cols, cols])
+    result['feature_nodes'] = feat_rows
+    result['feature_columns'] = feat_cols
+
+    circles = []
+    if os.path.exists(prefix + '.circles'):
+        with open(prefix + '.circles') as f:
+            for line in f:
+                fields = line.split()
+                if fields:
+                    circles.append((fields[0], np.array(fields[1:], dtype=np.int64)))
+    result['circles'] = circles
+
+    # Every friend of the ego: endpoints of its edges, profiled nodes and circle members
+    result['friends'] = np.unique(np.concatenate(
+        [result['edges'].ravel(), feat_nodes] + [members for _, members in circles]))
+    return result
+
+
+def _parse_ego_task(args):
+    return _parse_ego(*args)
+
+
+class EgoBundle:
+    """
+    Combined graph, node features and circles of an ego-network bundle.
+
+    Rows of ``features`` and ``circles`` follow the graph's node indices;
+    ``features[i, j]`` is 1 when node i has feature ``feature_names[j]`` in
+    any ego's profile data, and ``circles[i, c]`` is 1 when node i belongs to
+    circle ``circle_names[c]`` of ego ``circle_egos[c]``.
+    """
+
+    def __init__(self, graph: CSRGraph, features: sp.csr_matrix, feature_names: np.ndarray,
+                 circles: sp.csr_matrix, circle_names: np.ndarray, circle_egos: np.ndarray,
+                 egos: np.ndarray):
+        self.graph = graph
+        self.features = features
+        self.feature_names = feature_names
+        self.circles = circles
+        self.circle_names = circle_names
+        self.circle_egos = circle_egos
+        self.egos = egos
+
+    def circle_members(self, circle: int) -> np.ndarray:
+        """
+        Return the node indices of a circle (column index into ``circles``).
+        """
+        return self.circles[:, circle].nonzero()[0]
+
+    def circles_of(self, node: int) -> np.ndarray:
+        """
+        Return the circle indices a node index belongs to.
+        """
+        return self.circles.indices[self.circles.indptr[node]:self.circles.indptr[node + 1]]
+
+    def node_features(self, node: int) -> np.ndarray:
+        """
+        Return the feature indices set for a node index.
+        """
+        return self.features.indices[self.features.indptr[node]:self.features.indptr[node + 1]]
+
+    def __repr__(self) -> str:
+        return (f"EgoBundle({len(self.egos)} egos, {self.graph.number_of_nodes()} nodes, "
+                f"{self.features.shape[1]} features, {len(self.circle_names)} circles)")
+
+
+def load_ego_bundle(directory: str, include_ego_edges: bool = True,
+                    n_jobs: int = 1) -> EgoBundle:
+    """
+    Load every ego network of a SNAP ego bundle directory.
+
+    Args:
+        directory: Directory holding the <ego>.edges/.feat/.egofeat/.featnames/.circles files
+        include_ego_edges: Connect each ego to all of its friends (the SNAP
+                           .edges files leave these edges implicit)
+        n_jobs: Number of worker processes parsing ego files
+
+    Returns:
+        EgoBundle object
+    """
+    egos = sorted(int(os.path.basename(path)[:-len('.edges')])
+                  for path in glob.glob(os.path.join(directory, '*.edges')))
+    if not egos:
+        raise ValueError(f"No ego networks (*.edges) found in {directory}")
+
+    tasks = [(directory, ego) for ego in egos]
+    if n_jobs > 1 and len(egos) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            parsed = list(executor.map(_parse_ego_task, tasks))
+    else:
+        parsed = [_parse_ego_task(task) for task in tasks]
+
+    # Node labels from all egos are factorized to one index space
+    labels = [np.asarray(egos, dtype=np.int64)] + [part['friends'] for part in parsed]
+    node_ids = np.unique(np.concatenate(labels))
+
+    src_parts, dst_parts = [], []
+    for part in parsed:
+        src_parts.append(part['edges'][:, 0])
+        dst_parts.append(part['edges'][:, 1])
+        if include_ego_edges:
+            src_parts.append(np.full(len(part['friends']), part['ego'], dtype=np.int64))
+            dst_parts.append(part['friends'])
+    src = np.searchsorted(node_ids, np.concatenate(src_parts))
+    dst = np.searchsorted(node_ids, np.concatenate(dst_parts))
+    graph = CSRGraph.from_edges(src, dst, num_nodes=len(node_ids), node_ids=node_ids)
+
+    # Local feature columns are mapped to the union of all feature names
+    feature_names, inverse = np.unique(
+        np.array([name for part in parsed for name in part['feature_names']], dtype=str),
+        return_inverse=True)
+    rows, cols = [], []
+    offset = 0
+    for part in parsed:
+        local_to_global = inverse[offset:offset + len(part['feature_names'])]
+        offset += len(part['feature_names'])
+        rows.append(np.searchsorted(node_ids, part['feature_nodes']))
+        cols.append(local_to_global[part['feature_columns']])
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    features = sp.csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)),
+                             shape=(len(node_ids), len(feature_names)))
+    features.data[:] = 1  # Features repeated across egos are summed by the constructor
+
+    circle_names: List[str] = []
+    circle_egos: List[int] = []
+    rows, cols = [], []
+    for part in parsed:
+        for name, members in part['circles']:
+            rows.append(np.searchsorted(node_ids, members))
+            cols.append(np.full(len(members), len(circle_names), dtype=np.int64))
+            circle_names.append(name)
+            circle_egos.append(part['ego'])
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.int64)
+    circles = sp.csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)),
+                            shape=(len(node_ids), len(circle_names)))
+    circles.data[:] = 1
+
+    return EgoBundle(graph, features, feature_names, circles, np.array(circle_names, dtype=str),
+                     np.array(circle_egos, dtype=np.int64), np.asarray(egos, dtype=np.int64))
@@ -16,29 +16,193 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence, Union
 import json
 import os
 from datetime import datetime
 
+from betweenness import DEFAULT_BETWEENNESS_PIVOTS, betweenness_centrality
+from community_engine import COMMUNITY_METHODS, detect_partition, modularity, resolution_sweep
+from centrality import (distance_centralities, eigenvector_centrality, katz_centrality,
+                        save_vectors, spectral_radius, top_k, top_k_closeness)
+from components import component_labels, component_size_histogram, largest_component_nodes
+from csr_graph import CSRGraph, read_snapshot_meta
+from derived_cache import DerivedCache
+from eccentricity import distance_extrema
+from graph_similarity import DEFAULT_EIGENVALUES, GraphSignature, distance_matrices, graph_signature
+from incremental import IncrementalGraph
+from kcore import core_decomposition, degeneracy
+from ego_loader import is_ego_bundle, load_ego_bundle
+from directed_metrics import degree_statistics, dyad_census, reciprocity, triad_census
+from edge_reader import (SIGNED_TEMPORAL_SCHEMA, read_edge_arrays, read_edge_table,
+                         sniff_table, split_compression)
+from pagerank import pagerank
+from metrics_cache import MetricsCache, graph_fingerprint
+from scheduler import MetricTask, run_metric_tasks
+from sampling import (DEFAULT_CONFIDENCE, DEFAULT_SAMPLE_BUDGET, estimate_average_clustering,
+                      estimate_distance_bounds, estimate_transitivity, hoeffding_half_width)
+from temporal import windowed_metrics
+from triangles import count_triangles as count_csr_triangles, local_clustering
+
+
+# Headline metrics of one graph as flat table columns, and where each is found in its metrics
+SUMMARY_METRICS = {
+    'density': ('density',),
+    'triangles': ('triangles',),
+    'num_components': ('connected_components', 'num_components'),
+    'largest_component_size': ('connected_components', 'largest_component_size'),
+    'diameter': ('diameter',),
+    'radius': ('radius',),
+    'reciprocity': ('reciprocity',),
+    'clustering_coefficient': ('clustering_coefficient',),
+    'assortativity': ('assortativity',),
+    'avg_degree': ('degree_distribution', 'avg_degree'),
+    'max_degree': ('degree_distribution', 'max_degree'),
+    'degeneracy': ('k_core', 'degeneracy'),
+    'num_communities': ('communities', 'num_communities'),
+    'modularity': ('communities', 'modularity'),
+}
+
 
 class GraphAnalyzer:
     """
     A comprehensive graph analysis class for computing various graph properties
     and comparing different graphs.
+    
+    Metrics run on a compact CSR copy of the graph that is built once and shared
+    by all compute_* methods; the NetworkX graph is only materialized on demand.
     """
     
-    def __init__(self, graph: nx.Graph, name: str = "Graph"):
+    def __init__(self, graph: Union[nx.Graph, CSRGraph], name: str = "Graph"):
         """
-        Initialize the GraphAnalyzer with a NetworkX graph.
+        Initialize the GraphAnalyzer with a NetworkX or CSR graph.
         
         Args:
-            graph: NetworkX graph object
+            graph: NetworkX graph or CSRGraph object
             name: Name identifier for the graph
         """
-        self.graph = graph
+        if isinstance(graph, CSRGraph):
+            self._graph = None
+            self._csr = graph
+        else:
+            self._graph = graph
+            self._csr = None
         self.name = name
         self.metrics = {}
+        self._derived = DerivedCache()
+        self._incremental = None
+        self._pagerank = None
+    
+    @property
+    def graph(self) -> nx.Graph:
+        """
+        NetworkX view of the graph, materialized from the CSR arrays on first use.
+        """
+        if self._graph is None:
+            self._graph = self.csr.to_networkx()
+            self._derived.token = self._graph_token()
+        return self._graph
+    
+    @graph.setter
+    def graph(self, graph: nx.Graph):
+        self._graph = graph
+        self._csr = None
+        self._incremental = None
+        self._pagerank = None
+        self.invalidate_cache()
+    
+    @property
+    def csr(self) -> CSRGraph:
+        """
+        Immutable CSR representation of the graph, built once on first use.
+        After apply_edge_batch it is rebuilt from the incremental state, whose
+        per-node degrees, triangles and components seed the derived cache.
+        """
+        self._check_graph()
+        if self._csr is None:
+            if self._graph is None:
+                self._csr = self._incremental.to_csr()
+                self._derived.update(self._incremental.derived())
+            else:
+                self._csr = CSRGraph.from_networkx(self._graph)
+        return self._csr
+    
+    def _graph_token(self) -> Tuple:
+        """
+        Cheap fingerprint of the NetworkX graph's state (node and adjacency-slot counts).
+        """
+        adjacency = self._graph._adj
+        return (len(adjacency), sum(map(len, adjacency.values())))
+    
+    def _check_graph(self):
+        """
+        Drop the CSR copy and all derived structures if the NetworkX graph was mutated.
+        """
+        if self._graph is not None and not self._derived.validate(self._graph_token()):
+            self._csr = None
+    
+    def invalidate_cache(self):
+        """
+        Discard all derived structures, e.g. after editing the graph in place in a
+        way that keeps its node and edge counts unchanged.
+        """
+        self._derived.clear()
+        self._derived.token = None if self._graph is None else self._graph_token()
+        if self._graph is not None:
+            self._csr = None
+    
+    def _cached(self, key: str, builder):
+        """
+        Return a derived structure, building it at most once per graph state.
+        """
+        self._check_graph()
+        return self._derived.get(key, builder)
+    
+    def _undirected(self) -> CSRGraph:
+        return self._cached('undirected', lambda: self.csr.to_undirected())
+    
+    def _degrees(self) -> np.ndarray:
+        return self._cached('degrees', lambda: self.csr.degrees())
+    
+    def _core_decomposition(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self._cached('core_decomposition', lambda: core_decomposition(self.csr))
+    
+    def _node_triangles(self) -> np.ndarray:
+        # Orienting edges along the degeneracy order bounds forward degrees by the degeneracy
+        return self._cached('node_triangles', lambda: count_csr_triangles(
+            self._undirected(), self._core_decomposition()[1])[1])
+    
+    def _component_labels(self, strong: bool = False, n_jobs: int = 1) -> Tuple[int, np.ndarray]:
+        """
+        Component count and label array (weak components unless strong=True).
+        """
+        if strong and self.is_directed():
+            return self._cached('strong_component_labels',
+                                lambda: component_labels(self.csr, strong=True))
+        return self._cached('component_labels',
+                            lambda: component_labels(self.csr, n_jobs=n_jobs))
+    
+    def node_components(self, strong: bool = True) -> np.ndarray:
+        """
+        Component label per node index (strong components for directed graphs
+        unless strong=False), e.g. for plot_connected_components.
+        """
+        return self._component_labels(strong)[1]
+    
+    def fingerprint(self) -> str:
+        """
+        Content hash of the graph, used to key the persistent metrics cache.
+        """
+        return self._cached('fingerprint', lambda: graph_fingerprint(self.csr))
+    
+    def number_of_nodes(self) -> int:
+        return self.csr.number_of_nodes()
+    
+    def number_of_edges(self) -> int:
+        return self.csr.number_of_edges()
+    
+    def is_directed(self) -> bool:
+        return self.csr.is_directed()
         
     def compute_density(self) -> float:
         """
@@ -49,13 +213,13 @@ class GraphAnalyzer:
         Returns:
             float: Graph density
         """
-        n = self.graph.number_of_nodes()
-        m = self.graph.number_of_edges()
+        n = self.number_of_nodes()
+        m = self.number_of_edges()
         
         if n <= 1:
             return 0.0
             
-        if self.graph.is_directed():
+        if self.is_directed():
             max_edges = n * (n - 1)
         else:
             max_edges = n * (n - 1) / 2
@@ -67,96 +231,233 @@ class GraphAnalyzer:
     def count_triangles(self) -> int:
         """
         Count the number of triangles in the graph.
+        Directed graphs are counted on their undirected version. Per-node counts
+        are kept for compute_clustering_coefficient.
         
         Returns:
             int: Number of triangles
         """
-        if not self.graph.is_directed():
-            triangles = sum(nx.triangles(self.graph).values()) // 3
-        else:
-            # For directed graphs, count triangles in the undirected version
-            undirected_graph = self.graph.to_undirected()
-            triangles = sum(nx.triangles(undirected_graph).values()) // 3
+        triangles = int(self._node_triangles().sum()) // 3
             
         self.metrics['triangles'] = triangles
         return triangles
     
-    def analyze_connected_components(self) -> Dict:
+    def analyze_connected_components(self, n_jobs: int = 1) -> Dict:
         """
-        Analyze connected components of the graph.
+        Analyze connected components of the graph (strongly connected
+        components for directed graphs, which also report their weak count).
+        
+        Args:
+            n_jobs: Number of worker processes for weak components
         
         Returns:
             dict: Dictionary containing component statistics
         """
-        if self.graph.is_directed():
-            components = list(nx.strongly_connected_components(self.graph))
-        else:
-            components = list(nx.connected_components(self.graph))
-        
-        component_sizes = [len(comp) for comp in components]
+        num_components, labels = self._component_labels(strong=True, n_jobs=n_jobs)
+        component_sizes = np.bincount(labels, minlength=num_components).tolist()
+        sizes, counts = component_size_histogram(labels)
         
         analysis = {
-            'num_components': len(components),
+            'num_components': num_components,
             'largest_component_size': max(component_sizes) if component_sizes else 0,
             'component_sizes': component_sizes,
-            'avg_component_size': np.mean(component_sizes) if component_sizes else 0
+            'avg_component_size': np.mean(component_sizes) if component_sizes else 0,
+            'size_histogram': dict(zip(sizes.tolist(), counts.tolist()))
         }
+        if self.is_directed():
+            analysis['num_weak_components'] = self._component_labels(n_jobs=n_jobs)[0]
         
         self.metrics['connected_components'] = analysis
         return analysis
     
+    def _largest_component(self) -> CSRGraph:
+        """
+        Undirected CSR subgraph of the largest connected component.
+        """
+        def build():
+            undirected = self._undirected()
+            nodes = largest_component_nodes(self._component_labels()[1])
+            if len(nodes) == undirected.number_of_nodes():
+                return undirected
+            return undirected.subgraph(nodes)
+        
+        return self._cached('largest_component', build)
+    
+    def compute_distance_extrema(self) -> Dict:
+        """
+        Compute diameter, radius, center and periphery together from a few
+        eccentricity-bounding BFS sweeps over the largest connected component.
+        Directed graphs are measured on their undirected version.
+        
+        Returns:
+            dict: Diameter, radius, center/periphery node lists and BFS sweep count
+        """
+        def build():
+            component = self._largest_component()
+            extrema = distance_extrema(component)
+            return {
+                'diameter': extrema['diameter'],
+                'radius': extrema['radius'],
+                'center': component.node_ids[extrema['center']].tolist(),
+                'periphery': component.node_ids[extrema['periphery']].tolist(),
+                'bfs_sweeps': extrema['bfs_sweeps']
+            }
+        
+        analysis = self._cached('distance_extrema', build)
+        self.metrics['distance_extrema'] = analysis
+        return analysis
+    
     def compute_diameter(self) -> int:
         """
         Calculate the diameter of the graph (longest shortest path).
+        For disconnected graphs the diameter of the largest component is used.
         
         Returns:
             int: Graph diameter
         """
-        if not nx.is_connected(self.graph.to_undirected()):
-            # For disconnected graphs, compute diameter of largest component
-            largest_cc = max(nx.connected_components(self.graph.to_undirected()), key=len)
-            subgraph = self.graph.subgraph(largest_cc)
-            diameter = nx.diameter(subgraph)
-        else:
-            diameter = nx.diameter(self.graph)
+        diameter = self.compute_distance_extrema()['diameter']
             
         self.metrics['diameter'] = diameter
         return diameter
     
+    def _record_approximation(self, metric: str, interval: Dict, sample_size: int,
+                              confidence: float = DEFAULT_CONFIDENCE):
+        """
+        Store the confidence interval and sample size of an approximate metric.
+        """
+        entry = dict(interval, confidence=confidence, sample_size=sample_size)
+        self.metrics.setdefault('approximation', {})[metric] = entry
+    
+    def estimate_triangles(self, sample_budget: int = DEFAULT_SAMPLE_BUDGET,
+                           seed: Optional[int] = None) -> int:
+        """
+        Estimate the number of triangles by uniform wedge sampling.
+        
+        Args:
+            sample_budget: Number of wedges to sample
+            seed: Random seed
+            
+        Returns:
+            int: Estimated number of triangles
+        """
+        rng = np.random.default_rng(seed)
+        graph = self._undirected().without_self_loops()
+        estimate = estimate_transitivity(graph, sample_budget, rng)
+        triangles = int(round(estimate['triangles']['estimate']))
+        
+        self._record_approximation('triangles', estimate['triangles'], estimate['sample_size'])
+        self._record_approximation('transitivity', estimate['transitivity'], estimate['sample_size'])
+        self.metrics['triangles'] = triangles
+        return triangles
+    
+    def estimate_clustering_coefficient(self, sample_budget: int = DEFAULT_SAMPLE_BUDGET,
+                                        seed: Optional[int] = None) -> float:
+        """
+        Estimate the average clustering coefficient from one random wedge per sampled node.
+        
+        Args:
+            sample_budget: Number of nodes to sample
+            seed: Random seed
+            
+        Returns:
+            float: Estimated average clustering coefficient
+        """
+        rng = np.random.default_rng(seed)
+        graph = self._undirected().without_self_loops()
+        estimate = estimate_average_clustering(graph, sample_budget, rng)
+        clustering = estimate['estimate']
+        
+        self._record_approximation('clustering_coefficient', estimate, estimate['sample_size'])
+        self.metrics['clustering_coefficient'] = clustering
+        return clustering
+    
+    def estimate_diameter(self, sweeps: int = 4, seed: Optional[int] = None) -> int:
+        """
+        Bound diameter and radius of the largest component with double-sweep BFS.
+        The reported diameter is a guaranteed lower bound and the radius an upper bound.
+        
+        Args:
+            sweeps: Number of double sweeps
+            seed: Random seed for the start nodes
+            
+        Returns:
+            int: Diameter lower bound
+        """
+        rng = np.random.default_rng(seed)
+        bounds = estimate_distance_bounds(self._largest_component(), sweeps, rng)
+        
+        self._record_approximation('diameter', bounds['diameter'], bounds['sample_size'], confidence=1.0)
+        self._record_approximation('radius', bounds['radius'], bounds['sample_size'], confidence=1.0)
+        self.metrics['diameter'] = bounds['diameter']['estimate']
+        self.metrics['radius'] = bounds['radius']['estimate']
+        return self.metrics['diameter']
+    
     def compute_reciprocity(self) -> float:
         """
         Calculate reciprocity for directed graphs.
         Reciprocity = (number of mutual edges) / (total number of edges)
         
         Returns:
-            float: Reciprocity value (0.0 for undirected graphs)
+            float: Reciprocity value (1.0 for undirected graphs)
         """
-        if not self.graph.is_directed():
-            self.metrics['reciprocity'] = 1.0  # All edges are mutual in undirected graphs
-            return 1.0
-            
-        total_edges = self.graph.number_of_edges()
-        if total_edges == 0:
-            self.metrics['reciprocity'] = 0.0
-            return 0.0
-            
-        mutual_edges = 0
-        for edge in self.graph.edges():
-            if self.graph.has_edge(edge[1], edge[0]):
-                mutual_edges += 1
-                
-        reciprocity = mutual_edges / total_edges
-        self.metrics['reciprocity'] = reciprocity
-        return reciprocity
+        value = reciprocity(self.csr)
+        self.metrics['reciprocity'] = value
+        return value
+    
+    def analyze_directed_structure(self) -> Dict:
+        """
+        Analyze the directed structure: in/out-degree statistics, dyad census
+        (mutual/asymmetric/null pairs) and triad census (16 MAN triad types).
+        
+        Returns:
+            dict: Directed structure statistics
+        """
+        analysis = {
+            'degrees': degree_statistics(self.csr),
+            'dyad_census': dyad_census(self.csr),
+            'triad_census': triad_census(self.csr)
+        }
+        
+        self.metrics['directed_structure'] = analysis
+        return analysis
+    
+    def analyze_core_structure(self) -> Dict:
+        """
+        Analyze the k-core decomposition (directed graphs use their undirected
+        version): degeneracy, size of the innermost core and shell sizes.
+        
+        Returns:
+            dict: k-core statistics
+        """
+        core, _ = self._core_decomposition()
+        shells, counts = np.unique(core, return_counts=True)
+        k = degeneracy(core)
+        
+        analysis = {
+            'degeneracy': k,
+            'max_core_size': int(np.count_nonzero(core == k)),
+            'avg_core_number': np.mean(core) if core.size else 0.0,
+            'shell_sizes': dict(zip(shells.tolist(), counts.tolist()))
+        }
+        
+        self.metrics['k_core'] = analysis
+        return analysis
     
     def compute_clustering_coefficient(self) -> float:
         """
         Calculate the average clustering coefficient.
+        Undirected graphs reuse the per-node triangle counts from count_triangles.
         
         Returns:
             float: Average clustering coefficient
         """
-        clustering = nx.average_clustering(self.graph)
+        if self.is_directed():
+            # Directed clustering counts oriented triangles, which the undirected
+            # triangle engine does not track
+            clustering = nx.average_clustering(self.graph)
+        else:
+            node_clustering = local_clustering(self._undirected(), self._node_triangles())
+            clustering = float(node_clustering.mean()) if node_clustering.size else 0.0
         self.metrics['clustering_coefficient'] = clustering
         return clustering
     
@@ -167,12 +468,12 @@ class GraphAnalyzer:
         Returns:
             dict: Degree distribution statistics
         """
-        degrees = [d for n, d in self.graph.degree()]
+        degrees = self._degrees()
         
         analysis = {
             'avg_degree': np.mean(degrees),
-            'max_degree': max(degrees) if degrees else 0,
-            'min_degree': min(degrees) if degrees else 0,
+            'max_degree': degrees.max() if degrees.size else 0,
+            'min_degree': degrees.min() if degrees.size else 0,
             'degree_variance': np.var(degrees),
             'degree_std': np.std(degrees)
         }
@@ -180,6 +481,42 @@ class GraphAnalyzer:
         self.metrics['degree_distribution'] = analysis
         return analysis
     
+    def analyze_edge_signs(self, attribute: str = 'rating') -> Dict:
+        """
+        Summarize the signs of a signed graph's edge weights (e.g. trust ratings)
+        and the time span of its edges when timestamps are present.
+        
+        Args:
+            attribute: Edge attribute holding the signed weight
+            
+        Returns:
+            dict: Counts and fractions of positive/negative edges and weight statistics
+        """
+        ratings = self.csr.edge_data[attribute]
+        if not self.is_directed():
+            # Undirected edges are stored in both directions; count each once
+            keep = self.csr.row_indices() <= self.csr.indices
+            ratings = ratings[keep]
+            times = self.csr.edge_data['time'][keep] if 'time' in self.csr.edge_data else None
+        else:
+            times = self.csr.edge_data.get('time')
+        
+        num_edges = len(ratings)
+        positive = int(np.count_nonzero(ratings > 0))
+        negative = int(np.count_nonzero(ratings < 0))
+        analysis = {
+            'positive_edges': positive,
+            'negative_edges': negative,
+            'positive_fraction': positive / num_edges if num_edges else 0.0,
+            'mean_weight': float(ratings.mean()) if num_edges else 0.0
+        }
+        if times is not None and num_edges:
+            analysis['first_time'] = int(times.min())
+            analysis['last_time'] = int(times.max())
+        
+        self.metrics['edge_signs'] = analysis
+        return analysis
+    
     def compute_assortativity(self) -> float:
         """
         Calculate degree assortativity coefficient.
@@ -200,18 +537,13 @@ class GraphAnalyzer:
     def compute_radius(self) -> int:
         """
         Calculate the radius of the graph (minimum eccentricity).
+        For disconnected graphs the radius of the largest component is used.
         
         Returns:
             int: Graph radius
         """
         try:
-            if not nx.is_connected(self.graph.to_undirected()):
-                # For disconnected graphs, compute radius of largest component
-                largest_cc = max(nx.connected_components(self.graph.to_undirected()), key=len)
-                subgraph = self.graph.subgraph(largest_cc)
-                radius = nx.radius(subgraph)
-            else:
-                radius = nx.radius(self.graph)
+            radius = self.compute_distance_extrema()['radius']
             
             self.metrics['radius'] = radius
             return radius
@@ -220,60 +552,111 @@ class GraphAnalyzer:
             self.metrics['radius'] = 0
             return 0
     
-    def compute_centrality_measures(self) -> Dict:
+    def compute_centrality_measures(self, betweenness_pivots: Optional[int] = DEFAULT_BETWEENNESS_PIVOTS,
+                                    pivot_strategy: str = 'random', n_jobs: int = 1,
+                                    seed: Optional[int] = None, top: int = 10,
+                                    vector_dir: Optional[str] = None) -> Dict:
         """
         Compute various centrality measures.
         
+        Betweenness is exact when the graph has at most betweenness_pivots nodes;
+        otherwise it is estimated from that many sampled pivots and its Hoeffding
+        confidence interval is recorded under metrics['approximation'].
+        
+        Each measure keeps its average, max and top-ranked nodes; the full
+        vectors are only kept when written to vector_dir.
+        
+        Args:
+            betweenness_pivots: Number of betweenness pivots (None for exact)
+            pivot_strategy: Pivot sampling strategy ('random' or 'degree')
+            n_jobs: Number of worker processes for betweenness accumulation
+            seed: Random seed for pivot sampling
+            top: Number of top-ranked nodes to report per measure
+            vector_dir: Directory to save the full vectors to as .npy arrays
+        
         Returns:
             dict: Dictionary containing centrality measures
         """
         try:
             # Degree centrality
-            degree_centrality = nx.degree_centrality(self.graph)
-            avg_degree_centrality = np.mean(list(degree_centrality.values()))
-            max_degree_centrality = max(degree_centrality.values()) if degree_centrality else 0
+            n = self.number_of_nodes()
+            degree_centrality = self._degrees() / (n - 1) if n > 1 else np.ones(n)
+            avg_degree_centrality = np.mean(degree_centrality)
+            max_degree_centrality = degree_centrality.max() if n else 0
             
-            # Betweenness centrality (sample for large graphs)
-            betweenness = {}
-            avg_betweenness = 0.0
-            max_betweenness = 0.0
+            # Betweenness centrality (pivot-sampled for large graphs)
+            betweenness, pivots = betweenness_centrality(self.csr, pivots=betweenness_pivots,
+                                                         strategy=pivot_strategy, n_jobs=n_jobs,
+                                                         seed=seed)
+            avg_betweenness = np.mean(betweenness) if n else 0.0
+            max_betweenness = betweenness.max() if n else 0.0
+            if pivots < n:
+                # Each pivot contributes a normalized term in [0, n / (n - 1)]
+                half_width = hoeffding_half_width(pivots, value_range=n / (n - 1))
+                self._record_approximation('betweenness_centrality',
+                                           {'estimate': max_betweenness,
+                                            'ci_low': max(0.0, max_betweenness - half_width),
+                                            'ci_high': min(1.0, max_betweenness + half_width)},
+                                           pivots)
             
-            if self.graph.number_of_nodes() < 10000:  # Only compute for smaller graphs
-                betweenness = nx.betweenness_centrality(self.graph)
-                avg_betweenness = np.mean(list(betweenness.values()))
-                max_betweenness = max(betweenness.values()) if betweenness else 0
-            else:
-                # Sample for large graphs
-                sample_nodes = list(self.graph.nodes())[:1000]
-                betweenness = nx.betweenness_centrality(self.graph, k=sample_nodes)
-                avg_betweenness = np.mean(list(betweenness.values()))
-                max_betweenness = max(betweenness.values()) if betweenness else 0
+            # PageRank (sparse power iteration, warm-started after edge batches)
+            pagerank_scores = self.compute_pagerank()
+            avg_pagerank = np.mean(pagerank_scores) if n else 0.0
+            max_pagerank = pagerank_scores.max() if n else 0.0
             
-            # PageRank (if graph is not too large)
-            pagerank = {}
-            avg_pagerank = 0.0
-            max_pagerank = 0.0
+            # Closeness and harmonic centrality share one bit-parallel BFS pass,
+            # from sampled sources when betweenness is sampled too
+            sources = None
+            if betweenness_pivots is not None and betweenness_pivots < n:
+                sources = np.random.default_rng(seed).choice(n, size=betweenness_pivots, replace=False)
+            distances = distance_centralities(self.csr, sources)
             
-            if self.graph.number_of_nodes() < 100000:
-                pagerank = nx.pagerank(self.graph)
-                avg_pagerank = np.mean(list(pagerank.values()))
-                max_pagerank = max(pagerank.values()) if pagerank else 0
+            # Eigenvector and Katz centrality (Katz attenuated to 0.9 / spectral radius)
+            eigenvector = eigenvector_centrality(self.csr)
+            radius = spectral_radius(self.csr, eigenvector)
+            katz = katz_centrality(self.csr, alpha=0.9 / radius if radius > 1e-9 else 0.1)
+            
+            def summary(scores):
+                return {
+                    'average': np.mean(scores) if n else 0.0,
+                    'max': scores.max() if n else 0.0,
+                    'top': self._ranking(scores, top)
+                }
             
             analysis = {
                 'degree_centrality': {
                     'average': avg_degree_centrality,
-                    'max': max_degree_centrality
+                    'max': max_degree_centrality,
+                    'top': self._ranking(degree_centrality, top)
                 },
                 'betweenness_centrality': {
                     'average': avg_betweenness,
-                    'max': max_betweenness
+                    'max': max_betweenness,
+                    'pivots': pivots,
+                    'top': self._ranking(betweenness, top)
                 },
                 'pagerank': {
                     'average': avg_pagerank,
-                    'max': max_pagerank
-                }
+                    'max': max_pagerank,
+                    'top': self._ranking(pagerank_scores, top)
+                },
+                'closeness_centrality': dict(summary(distances['closeness']),
+                                             sources=n if sources is None else len(sources)),
+                'harmonic_centrality': dict(summary(distances['harmonic']),
+                                            sources=n if sources is None else len(sources)),
+                'eigenvector_centrality': summary(eigenvector),
+                'katz_centrality': summary(katz)
             }
             
+            if vector_dir is not None:
+                save_vectors(vector_dir, {'degree_centrality': degree_centrality,
+                                          'betweenness_centrality': betweenness,
+                                          'pagerank': pagerank_scores,
+                                          'closeness_centrality': distances['closeness'],
+                                          'harmonic_centrality': distances['harmonic'],
+                                          'eigenvector_centrality': eigenvector,
+                                          'katz_centrality': katz}, self.csr.node_ids)
+            
             self.metrics['centrality'] = analysis
             return analysis
             
@@ -282,83 +665,326 @@ class GraphAnalyzer:
             self.metrics['centrality'] = {
                 'degree_centrality': {'average': 0.0, 'max': 0.0},
                 'betweenness_centrality': {'average': 0.0, 'max': 0.0},
-                'pagerank': {'average': 0.0, 'max': 0.0}
+                'pagerank': {'average': 0.0, 'max': 0.0},
+                'closeness_centrality': {'average': 0.0, 'max': 0.0},
+                'harmonic_centrality': {'average': 0.0, 'max': 0.0},
+                'eigenvector_centrality': {'average': 0.0, 'max': 0.0},
+                'katz_centrality': {'average': 0.0, 'max': 0.0}
             }
             return self.metrics['centrality']
     
-    def detect_communities(self, algorithm: str = 'louvain') -> Dict:
+    def _ranking(self, scores: np.ndarray, k: int) -> List[Tuple]:
+        """
+        Top-k (node, score) pairs of a per-node-index score vector.
+        """
+        nodes, values = top_k(scores, k)
+        return list(zip(self.csr.node_ids[nodes].tolist(), values.tolist()))
+    
+    def top_closeness(self, k: int = 10) -> List[Tuple]:
+        """
+        Find the k most central nodes by closeness with pruned BFS, without
+        computing closeness for every node. Directed graphs are measured on
+        their undirected version.
+        
+        Args:
+            k: Number of nodes
+            
+        Returns:
+            list: (node, closeness) pairs, best first
+        """
+        nodes, values, completed = top_k_closeness(self.csr, k)
+        ranking = list(zip(self.csr.node_ids[nodes].tolist(), values.tolist()))
+        self.metrics['top_closeness'] = {'top': ranking, 'full_bfs_runs': completed}
+        return ranking
+    
+    def compute_pagerank(self, personalization=None, alpha: float = 0.85,
+                         method: str = 'power') -> np.ndarray:
+        """
+        Compute PageRank with sparse power iteration or Gauss-Seidel.
+        
+        The uniform PageRank vector is cached and seeds the next computation
+        after apply_edge_batch, so it converges in a few iterations when only
+        a small part of the graph changed.
+        
+        Args:
+            personalization: Teleport weights as a dict of node -> weight, an
+                             array over node indices, or an (n, k) array of k
+                             vectors solved together
+            alpha: Damping factor
+            method: 'power' or 'gauss_seidel'
+            
+        Returns:
+            np.ndarray: PageRank per node index (n, or (n, k) for several vectors)
+        """
+        if isinstance(personalization, dict):
+            vector = np.zeros(self.number_of_nodes())
+            for node, value in personalization.items():
+                vector[self.csr.index_of(node)] = value
+            personalization = vector
+        
+        if personalization is not None:
+            return pagerank(self.csr, alpha, personalization, method=method)[0]
+        
+        def build():
+            scores, _ = pagerank(self.csr, alpha, start=self._pagerank, method=method)
+            self._pagerank = scores
+            return scores
+        
+        return self._cached(f'pagerank_{alpha}', build)
+    
+    def detect_communities(self, algorithm: str = 'louvain', resolution: float = 1.0,
+                           seed: Optional[int] = None) -> Dict:
         """
         Detect communities in the graph using various algorithms.
         
+        Louvain and Leiden run on the built-in CSR community engine; the other
+        algorithms use NetworkX. Modularity is evaluated on the full partition.
+        
         Args:
-            algorithm: Community detection algorithm ('louvain', 'greedy', 'label_propagation')
+            algorithm: Community detection algorithm ('louvain', 'leiden', 'greedy', 'label_propagation')
+            resolution: Modularity resolution (higher favours smaller communities)
+            seed: Random seed for Louvain/Leiden
             
         Returns:
             dict: Community detection results
         """
-        try:
-            if algorithm == 'louvain':
-                import community as community_louvain
-                partition = community_louvain.best_partition(self.graph)
-            elif algorithm == 'greedy':
-                communities = nx.community.greedy_modularity_communities(self.graph)
-                partition = {}
-                for i, community in enumerate(communities):
-                    for node in community:
-                        partition[node] = i
-            elif algorithm == 'label_propagation':
-                communities = nx.community.label_propagation_communities(self.graph)
-                partition = {}
-                for i, community in enumerate(communities):
-                    for node in community:
-                        partition[node] = i
+        if algorithm in COMMUNITY_METHODS:
+            labels, _ = detect_partition(self.csr, algorithm, resolution, seed,
+                                         core=self._core_decomposition()[0])
+        elif algorithm in ('greedy', 'label_propagation'):
+            if algorithm == 'greedy':
+                communities = nx.community.greedy_modularity_communities(self.graph, resolution=resolution)
             else:
-                raise ValueError(f"Unknown algorithm: {algorithm}")
-            
-            num_communities = len(set(partition.values()))
-            modularity = nx.community.modularity(self.graph, [set(partition.keys())])
+                communities = nx.community.label_propagation_communities(self.graph)
+            labels = np.empty(self.number_of_nodes(), dtype=np.int64)
+            for i, community in enumerate(communities):
+                labels[[self.csr.index_of(node) for node in community]] = i
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        
+        analysis = {
+            'num_communities': len(np.unique(labels)),
+            'modularity': modularity(self.csr, labels, resolution),
+            'partition': dict(zip(self.csr.node_ids.tolist(), labels.tolist()))
+        }
+        
+        self.metrics['communities'] = analysis
+        return analysis
+    
+    def sweep_communities(self, resolutions: Sequence[float] = (0.5, 1.0, 1.5, 2.0),
+                          seeds: Sequence[int] = (0, 1, 2), algorithm: str = 'louvain',
+                          n_jobs: int = 1) -> List[Dict]:
+        """
+        Run community detection over a grid of resolutions and seeds.
+        
+        Args:
+            resolutions: Resolution values to try
+            seeds: Random seeds per resolution
+            algorithm: 'louvain', 'leiden' or 'label_propagation'
+            n_jobs: Number of worker processes
             
-            analysis = {
-                'num_communities': num_communities,
-                'modularity': modularity,
-                'partition': partition
-            }
+        Returns:
+            list: Per-resolution modularity, community count, stability (mean
+            pairwise NMI across seeds) and best partition labels
+        """
+        results = resolution_sweep(self.csr, resolutions, seeds, algorithm, n_jobs)
+        self.metrics['community_sweep'] = [
+            {key: value for key, value in result.items() if key != 'labels'}
+            for result in results
+        ]
+        return results
+    
+    def apply_edge_batch(self, added=None, removed=None) -> Dict:
+        """
+        Insert and delete a batch of edges, updating density, degree statistics,
+        triangles, reciprocity and (for undirected graphs) clustering and
+        connected components in time proportional to the batch.
+        
+        The first call switches the analyzer to incremental mode. All other
+        metrics are dropped and are recomputed from scratch on request.
+        
+        Args:
+            added: Edges to insert, as (source, target) pairs of node identifiers
+            removed: Edges to delete (applied before the insertions)
             
-            self.metrics['communities'] = analysis
-            return analysis
+        Returns:
+            dict: Updated values of the maintained metrics
+        """
+        if self._incremental is None:
+            self._incremental = IncrementalGraph(self.csr, self._node_triangles(),
+                                                 self._component_labels())
+        self._incremental.apply(added, removed)
+        self._graph = None
+        self._csr = None
+        self._derived.clear()
+        self._derived.token = None
+        
+        updated = self._incremental.metrics()
+        self.metrics = dict(updated)
+        return updated
+    
+    def analyze_temporal_windows(self, window: Union[int, float, str],
+                                 step: Optional[Union[int, float, str]] = None,
+                                 attribute: str = 'time') -> pd.DataFrame:
+        """
+        Compute density, degree, triangle, clustering, reciprocity and component
+        metrics over sliding (step < window) or tumbling windows of the edge
+        timestamps, in one incremental pass over the time-sorted edges.
+        
+        Args:
+            window: Window length in timestamp units, or a pandas timedelta string ('90D')
+            step: Distance between window starts (defaults to tumbling windows)
+            attribute: Edge attribute holding the timestamps
             
-        except ImportError:
-            print(f"Warning: Community detection library not available for {algorithm}")
-            return {'num_communities': 0, 'modularity': 0.0, 'partition': {}}
+        Returns:
+            DataFrame: One row of metrics per window
+        """
+        series = windowed_metrics(self.csr, window, step, attribute)
+        self.metrics['temporal'] = series.to_dict(orient='records')
+        return series
     
-    def compute_all_metrics(self) -> Dict:
+    def metric_tasks(self, approximate: bool = False, sample_budget: Optional[int] = None,
+                     seed: Optional[int] = None) -> List[MetricTask]:
         """
-        Compute all available graph metrics.
+        Build the task list used by compute_all_metrics.
         
+        Args:
+            approximate: Use the sampling estimators for expensive metrics
+            sample_budget: Wedge/node samples for approximate mode (pivots use 1%)
+            seed: Random seed for approximate mode
+            
         Returns:
-            dict: Dictionary containing all computed metrics
+            list: MetricTask objects with their dependencies
         """
-        print(f"Computing metrics for {self.name}...")
+        if sample_budget is None:
+            sample_budget = DEFAULT_SAMPLE_BUDGET
+        sampled = {'sample_budget': sample_budget, 'seed': seed}
         
         # Basic metrics (5 key metrics for conclusions)
-        self.compute_density()
-        self.count_triangles()
-        self.analyze_connected_components()
-        self.compute_diameter()
-        self.compute_reciprocity()
+        tasks = [MetricTask('density', 'compute_density'),
+                 MetricTask('k_core', 'analyze_core_structure', provides=['core_decomposition'])]
+        if approximate:
+            tasks.append(MetricTask('triangles', 'estimate_triangles', sampled))
+        else:
+            tasks.append(MetricTask('triangles', 'count_triangles', depends_on=['k_core'],
+                                    provides=['node_triangles']))
+        tasks.append(MetricTask('connected_components', 'analyze_connected_components'))
+        if approximate:
+            tasks.append(MetricTask('diameter', 'estimate_diameter', {'seed': seed}))
+        else:
+            tasks.append(MetricTask('diameter', 'compute_diameter', provides=['distance_extrema']))
+        tasks.append(MetricTask('reciprocity', 'compute_reciprocity'))
+        if self.is_directed():
+            tasks.append(MetricTask('directed_structure', 'analyze_directed_structure'))
         
         # Additional metrics
-        self.compute_clustering_coefficient()
-        self.analyze_degree_distribution()
-        self.compute_assortativity()
-        self.compute_radius()
-        self.compute_centrality_measures()
+        if approximate:
+            tasks.append(MetricTask('clustering_coefficient', 'estimate_clustering_coefficient', sampled))
+        else:
+            tasks.append(MetricTask('clustering_coefficient', 'compute_clustering_coefficient',
+                                    depends_on=['triangles']))
+        tasks.append(MetricTask('degree_distribution', 'analyze_degree_distribution'))
+        tasks.append(MetricTask('assortativity', 'compute_assortativity'))
+        if 'rating' in self.csr.edge_data:
+            tasks.append(MetricTask('edge_signs', 'analyze_edge_signs'))
+        if approximate:
+            tasks.append(MetricTask('centrality', 'compute_centrality_measures',
+                                    {'betweenness_pivots': max(1, sample_budget // 100), 'seed': seed}))
+        else:
+            tasks.append(MetricTask('radius', 'compute_radius', depends_on=['diameter']))
+            tasks.append(MetricTask('centrality', 'compute_centrality_measures'))
         
         # Community detection
-        self.detect_communities()
+        tasks.append(MetricTask('communities', 'detect_communities', depends_on=['k_core']))
+        return tasks
+    
+    def compute_all_metrics(self, approximate: bool = False,
+                            sample_budget: Optional[int] = None,
+                            seed: Optional[int] = None, n_jobs: int = 1,
+                            cache: Optional[MetricsCache] = None,
+                            raise_errors: bool = True) -> Dict:
+        """
+        Compute all available graph metrics.
+        
+        In approximate mode triangles and clustering are estimated by wedge
+        sampling, diameter/radius are bounded by double-sweep BFS and betweenness
+        uses random pivots. Each estimate's confidence interval and sample size
+        is stored under metrics['approximation'].
+        
+        With n_jobs > 1 independent metrics run concurrently in a process pool.
+        Wall time per metric is stored under metrics['timings']. Metrics found in
+        the given cache for this graph and parameters are loaded, not recomputed.
+        
+        Args:
+            approximate: Trade accuracy for a bounded running time
+            sample_budget: Wedge/node samples for approximate mode (pivots use 1%)
+            seed: Random seed for approximate mode
+            n_jobs: Number of worker processes
+            cache: Optional persistent MetricsCache
+            raise_errors: Re-raise a failing metric's exception; otherwise its
+                          message is kept under metrics['errors'] and the
+                          other metrics are still computed
+        
+        Returns:
+            dict: Dictionary containing all computed metrics
+        """
+        print(f"Computing metrics for {self.name}...")
+        tasks = self.metric_tasks(approximate, sample_budget, seed)
         
+        if n_jobs > 1:
+            # Build shared intermediates once so every worker starts with them
+            self._largest_component()
+        
+        self.metrics['timings'] = run_metric_tasks(self, tasks, n_jobs=n_jobs, cache=cache,
+                                                   raise_errors=raise_errors)
         return self.metrics
     
+    def similarity_signature(self, k: int = DEFAULT_EIGENVALUES,
+                             cache: Optional[MetricsCache] = None) -> GraphSignature:
+        """
+        Compute (once) the structural signature used by GraphComparator's
+        structural distances: degree histogram, extreme normalized Laplacian
+        eigenvalues, NetLSD heat trace, graphlet counts and hashed edges.
+        
+        Args:
+            k: Number of Laplacian eigenvalues kept from each end of the spectrum
+            cache: Optional persistent MetricsCache to load/store the signature
+            
+        Returns:
+            GraphSignature object
+        """
+        def build():
+            params = {'k': k}
+            if cache is not None:
+                hit, signature = cache.load(self.fingerprint(), 'similarity_signature', params)
+                if hit:
+                    return signature
+            signature = graph_signature(self.csr, k, node_triangles=self._node_triangles())
+            if cache is not None:
+                cache.store(self.fingerprint(), 'similarity_signature', signature, params)
+            return signature
+        
+        return self._cached(f'similarity_signature_{k}', build)
+    
+    def summary_row(self) -> Dict:
+        """
+        Flatten the graph's size and headline metrics (SUMMARY_METRICS) into
+        one table row; metrics not computed yet are None and failed metrics
+        are listed in 'failed_metrics'.
+        
+        Returns:
+            dict: Column name to value
+        """
+        row = {'nodes': self.number_of_nodes(), 'edges': self.number_of_edges(),
+               'directed': self.is_directed()}
+        for column, keys in SUMMARY_METRICS.items():
+            value = self.metrics
+            for key in keys:
+                value = value.get(key) if isinstance(value, dict) else None
+            row[column] = value
+        row['failed_metrics'] = ', '.join(sorted(self.metrics.get('errors', {}))) or None
+        return row
+    
     def save_metrics(self, filepath: str):
         """
         Save computed metrics to a JSON file.
@@ -368,7 +994,11 @@ class GraphAnalyzer:
         """
         # Convert numpy types to Python types for JSON serialization
         def convert_numpy(obj):
-            if isinstance(obj, np.integer):
+            if isinstance(obj, dict):
+                return {k: convert_numpy(v) for k, v in obj.items()}
+            elif isinstance(obj, (list, tuple)):
+                return [convert_numpy(v) for v in obj]
+            elif isinstance(obj, np.integer):
                 return int(obj)
             elif isinstance(obj, np.floating):
                 return float(obj)
@@ -376,12 +1006,7 @@ class GraphAnalyzer:
                 return obj.tolist()
             return obj
         
-        serializable_metrics = {}
-        for key, value in self.metrics.items():
-            if isinstance(value, dict):
-                serializable_metrics[key] = {k: convert_numpy(v) for k, v in value.items()}
-            else:
-                serializable_metrics[key] = convert_numpy(value)
+        serializable_metrics = convert_numpy(self.metrics)
         
         with open(filepath, 'w') as f:
             json.dump(serializable_metrics, f, indent=2)
@@ -391,63 +1016,167 @@ class GraphAnalyzer:
 
 class GraphComparator:
     """
-    Class for comparing two graphs and generating comparative analysis.
+    Class for comparing any number of graphs and generating comparative analysis.
+    
+    The graphs' headline metrics are collected once into a columnar table
+    (one row per graph, one column per metric); pairwise differences, ratios
+    and rankings are computed on its NumPy columns as whole arrays.
     """
     
-    def __init__(self, graph_a: GraphAnalyzer, graph_b: GraphAnalyzer):
+    def __init__(self, *analyzers: GraphAnalyzer):
         """
-        Initialize the comparator with two graph analyzers.
+        Initialize the comparator with graph analyzers.
         
         Args:
-            graph_a: First graph analyzer
-            graph_b: Second graph analyzer
+            analyzers: Graph analyzers to compare (or one list of them); the
+                       first two are also available as graph_a and graph_b
         """
-        self.graph_a = graph_a
-        self.graph_b = graph_b
+        if len(analyzers) == 1 and isinstance(analyzers[0], (list, tuple)):
+            analyzers = tuple(analyzers[0])
+        self.analyzers = list(analyzers)
+        self.graph_a = self.analyzers[0] if len(self.analyzers) > 0 else None
+        self.graph_b = self.analyzers[1] if len(self.analyzers) > 1 else None
+        self.table = pd.DataFrame([analyzer.summary_row() for analyzer in self.analyzers],
+                                  index=pd.Index([analyzer.name for analyzer in self.analyzers],
+                                                 name='graph'))
         self.comparison_results = {}
     
+    @classmethod
+    def from_table(cls, table: pd.DataFrame, name_column: str = 'name') -> 'GraphComparator':
+        """
+        Build a comparator from an existing metrics table (e.g. a batch
+        summary.csv), one row per graph, without the analyzers.
+        
+        Args:
+            table: DataFrame with one column per metric
+            name_column: Column holding graph names (the index is used if absent)
+        
+        Returns:
+            GraphComparator object
+        """
+        comparator = cls()
+        if name_column in table.columns:
+            table = table.set_index(name_column)
+        comparator.table = table.rename_axis('graph')
+        return comparator
+    
+    @property
+    def names(self) -> List[str]:
+        return self.table.index.tolist()
+    
+    def metric_columns(self) -> List[str]:
+        """
+        Numeric metric columns of the table.
+        """
+        return self.table.select_dtypes(include='number').columns.tolist()
+    
+    def _values(self, metric: str) -> np.ndarray:
+        return self.table[metric].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    def pairwise(self, metric: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Pairwise differences and ratios of one metric between all graphs.
+        
+        Args:
+            metric: Metric column name
+        
+        Returns:
+            Tuple of (differences, ratios) DataFrames where entry [i, j] compares
+            graph i to graph j (value_i - value_j and value_i / value_j, inf
+            when value_j is 0)
+        """
+        values = self._values(metric)
+        difference = values[:, None] - values[None, :]
+        ratio = np.full(difference.shape, np.inf)
+        denominators = np.broadcast_to(values[None, :], ratio.shape)
+        np.divide(values[:, None], denominators, out=ratio, where=denominators != 0)
+        return (pd.DataFrame(difference, index=self.table.index, columns=self.table.index),
+                pd.DataFrame(ratio, index=self.table.index, columns=self.table.index))
+    
+    def rankings(self, metrics: Optional[Sequence[str]] = None, ascending: bool = False) -> pd.DataFrame:
+        """
+        Rank the graphs on each metric (1 = largest value unless ascending).
+        
+        Args:
+            metrics: Metric columns to rank (all numeric columns when None)
+            ascending: Rank the smallest value first
+        
+        Returns:
+            DataFrame: Rank per graph and metric (ties share the lowest rank)
+        """
+        metrics = self.metric_columns() if metrics is None else list(metrics)
+        return self.table[metrics].rank(ascending=ascending, method='min')
+    
     def compare_metrics(self) -> Dict:
         """
-        Compare metrics between the two graphs.
+        Compare metrics across the graphs.
+        
+        Each metric known for every graph maps graph names to values. With two
+        graphs it also holds the 'difference' and 'ratio' of the first to the
+        second; with more it holds each graph's 'rank'.
         
         Returns:
             dict: Comparative analysis results
         """
         comparison = {}
+        names = self.names
+        complete = [metric for metric in self.metric_columns() if self.table[metric].notna().all()]
+        ranks = self.rankings(complete)
         
-        # Compare basic metrics
-        metrics_to_compare = ['density', 'triangles', 'diameter', 'reciprocity', 'clustering_coefficient']
-        
-        for metric in metrics_to_compare:
-            if metric in self.graph_a.metrics and metric in self.graph_b.metrics:
-                val_a = self.graph_a.metrics[metric]
-                val_b = self.graph_b.metrics[metric]
-                
-                comparison[metric] = {
-                    f'{self.graph_a.name}': val_a,
-                    f'{self.graph_b.name}': val_b,
-                    'difference': val_a - val_b,
-                    'ratio': val_a / val_b if val_b != 0 else float('inf')
-                }
+        for metric in complete:
+            values = self.table[metric].tolist()
+            comparison[metric] = dict(zip(names, values))
+            if len(names) == 2:
+                ratio = self.pairwise(metric)[1]
+                comparison[metric]['difference'] = values[0] - values[1]
+                comparison[metric]['ratio'] = float(ratio.iat[0, 1])
+            else:
+                comparison[metric]['rank'] = dict(zip(names, ranks[metric].astype(int).tolist()))
         
         # Compare connected components
-        if 'connected_components' in self.graph_a.metrics and 'connected_components' in self.graph_b.metrics:
-            cc_a = self.graph_a.metrics['connected_components']
-            cc_b = self.graph_b.metrics['connected_components']
-            
-            comparison['connected_components'] = {
-                f'{self.graph_a.name}_num_components': cc_a['num_components'],
-                f'{self.graph_b.name}_num_components': cc_b['num_components'],
-                f'{self.graph_a.name}_largest_component': cc_a['largest_component_size'],
-                f'{self.graph_b.name}_largest_component': cc_b['largest_component_size']
-            }
+        if 'num_components' in complete and 'largest_component_size' in complete:
+            components = {}
+            for name, count, largest in zip(names, self.table['num_components'].tolist(),
+                                            self.table['largest_component_size'].tolist()):
+                components[f'{name}_num_components'] = count
+                components[f'{name}_largest_component'] = largest
+            comparison['connected_components'] = components
         
         self.comparison_results = comparison
         return comparison
     
+    def structural_distances(self, measures: Optional[Sequence[str]] = None,
+                             k: int = DEFAULT_EIGENVALUES,
+                             cache: Optional[MetricsCache] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Compare the graphs' structure beyond scalar metrics: degree
+        distribution KS/EMD, Laplacian spectrum, NetLSD, graphlet and edge
+        overlap (Jaccard) distances between every pair of graphs.
+        
+        Each graph's signature is computed once and reused by every pair.
+        With two graphs the distances are also stored under
+        comparison_results['structural_distances'].
+        
+        Args:
+            measures: Measures to compute (all of graph_similarity.SIMILARITY_MEASURES when None)
+            k: Number of Laplacian eigenvalues kept from each end of the spectrum
+            cache: Optional persistent MetricsCache for the signatures
+            
+        Returns:
+            dict: Measure name to (N, N) DataFrame of distances
+        """
+        if not self.analyzers:
+            raise ValueError("Structural distances need the graph analyzers, not only a metrics table")
+        signatures = [analyzer.similarity_signature(k, cache) for analyzer in self.analyzers]
+        distances = distance_matrices(signatures, self.names, measures)
+        if len(self.analyzers) == 2:
+            self.comparison_results['structural_distances'] = {
+                measure: float(table.iat[0, 1]) for measure, table in distances.items()}
+        return distances
+    
     def generate_comparison_report(self) -> str:
         """
-        Generate a text report comparing the two graphs.
+        Generate a text report comparing the graphs.
         
         Returns:
             str: Formatted comparison report
@@ -455,102 +1184,129 @@ class GraphComparator:
         report = f"""
 # Graph Comparison Report
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Graph A: {self.graph_a.name}
-- Nodes: {self.graph_a.graph.number_of_nodes()}
-- Edges: {self.graph_a.graph.number_of_edges()}
-- Directed: {self.graph_a.graph.is_directed()}
-
-## Graph B: {self.graph_b.name}
-- Nodes: {self.graph_b.graph.number_of_nodes()}
-- Edges: {self.graph_b.graph.number_of_edges()}
-- Directed: {self.graph_b.graph.is_directed()}
-
-## Comparative Analysis
 """
+        names = self.names
+        for i, (name, row) in enumerate(self.table.iterrows()):
+            label = chr(ord('A') + i) if len(names) <= 26 else str(i + 1)
+            report += f"\n## Graph {label}: {name}\n"
+            for column, title in (('nodes', 'Nodes'), ('edges', 'Edges'), ('directed', 'Directed')):
+                if column in row.index:
+                    report += f"- {title}: {row[column]}\n"
         
-        for metric, data in self.comparison_results.items():
-            if isinstance(data, dict) and 'difference' in data:
-                report += f"\n### {metric.replace('_', ' ').title()}\n"
-                report += f"- {self.graph_a.name}: {data[self.graph_a.name]:.4f}\n"
-                report += f"- {self.graph_b.name}: {data[self.graph_b.name]:.4f}\n"
-                report += f"- Difference: {data['difference']:.4f}\n"
-                report += f"- Ratio: {data['ratio']:.4f}\n"
+        report += "\n## Comparative Analysis\n"
+        if len(names) == 2:
+            for metric, data in self.comparison_results.items():
+                if isinstance(data, dict) and 'difference' in data:
+                    report += f"\n### {metric.replace('_', ' ').title()}\n"
+                    report += f"- {names[0]}: {data[names[0]]:.4f}\n"
+                    report += f"- {names[1]}: {data[names[1]]:.4f}\n"
+                    report += f"- Difference: {data['difference']:.4f}\n"
+                    report += f"- Ratio: {data['ratio']:.4f}\n"
+            if 'structural_distances' in self.comparison_results:
+                report += "\n### Structural Distances\n"
+                for measure, distance in self.comparison_results['structural_distances'].items():
+                    report += f"- {measure.replace('_', ' ')}: {distance:.4f}\n"
+        else:
+            metrics = self.metric_columns()
+            report += f"\n### Metrics\n{self.table[metrics].to_string()}\n"
+            report += f"\n### Rankings (1 = largest)\n{self.rankings(metrics).to_string()}\n"
         
         return report
 
 
-def load_graph_from_file(filepath: str, directed: bool = False) -> nx.Graph:
+def load_graph_from_file(filepath: str, directed: bool = False, as_csr: bool = False,
+                         snapshot_dir: Optional[str] = None) -> Union[nx.Graph, CSRGraph]:
     """
     Load a graph from various file formats, including compressed files.
     
+    Edge lists (.edgelist, .txt, .tsv or no extension) and .csv tables,
+    optionally .gz/.bz2/.xz compressed, are streamed in fixed-size chunks
+    straight into integer arrays; compressed files are decompressed on the fly,
+    never to disk. Extra .csv columns are kept as typed per-edge arrays
+    (CSRGraph.edge_data, NetworkX edge attributes): a headerless 4-column file
+    is read as SNAP's signed network layout (source, target, rating as int8,
+    time as int64), otherwise the header names the columns.
+    
+    A directory written by CSRGraph.save is loaded as a memory-mapped binary
+    snapshot, and a SNAP ego-network directory (<ego>.edges files) as its
+    combined graph (see ego_loader for its features and circles). With
+    snapshot_dir set, parsed edge lists are also saved there and later runs
+    map the snapshot instead of re-parsing the unchanged file.
+    
     Args:
-        filepath: Path to the graph file
+        filepath: Path to the graph file, snapshot or ego-network directory
         directed: Whether the graph is directed
+        as_csr: Return a CSRGraph instead of a NetworkX graph, skipping the
+                NetworkX materialization entirely (edge-list and .csv formats only)
+        snapshot_dir: Directory holding binary snapshots of parsed edge lists
         
     Returns:
-        NetworkX graph object
+        NetworkX graph object (or CSRGraph if as_csr is True)
     """
-    import gzip
-    
-    # Handle compressed .gz files
-    if filepath.endswith('.gz'):
-        filepath_uncompressed = filepath[:-3]  # Remove .gz extension
-        if not os.path.exists(filepath_uncompressed):
-            # Extract on the fly
-            with gzip.open(filepath, 'rt') as f_in:
-                with open(filepath_uncompressed, 'w') as f_out:
-                    f_out.write(f_in.read())
-            filepath = filepath_uncompressed
-        else:
-            filepath = filepath_uncompressed
+    if read_snapshot_meta(filepath) is not None:
+        csr = CSRGraph.load(filepath)
+        return csr if as_csr else csr.to_networkx()
+    if is_ego_bundle(filepath):
+        csr = load_ego_bundle(filepath).graph
+        return csr if as_csr else csr.to_networkx()
     
-    # Handle .edgelist files
-    if filepath.endswith('.edgelist'):
-        return nx.read_edgelist(filepath, create_using=nx.DiGraph() if directed else nx.Graph(), comments='#')
+    base_path, _ = split_compression(filepath)
     
-    # Handle .txt files (common in SNAP datasets)
-    elif filepath.endswith('.txt'):
-        # Try reading as edgelist first (handles SNAP format with # comments)
-        try:
-            return nx.read_edgelist(filepath, create_using=nx.DiGraph() if directed else nx.Graph(), comments='#', nodetype=int)
-        except:
-            # If that fails, try reading as space/tab separated
-            try:
-                return nx.read_edgelist(filepath, create_using=nx.DiGraph() if directed else nx.Graph(), comments='#', delimiter='\t')
-            except:
-                return nx.read_edgelist(filepath, create_using=nx.DiGraph() if directed else nx.Graph(), comments='#')
+    def parse_edge_list():
+        src, dst, node_ids, _ = read_edge_arrays(filepath)
+        return src, dst, node_ids, {}
+    
+    def parse_csv():
+        header, num_columns = sniff_table(filepath, ',')
+        schema = None
+        if header is None and num_columns == len(SIGNED_TEMPORAL_SCHEMA):
+            schema = SIGNED_TEMPORAL_SCHEMA
+        src, dst, node_ids, attributes, _ = read_edge_table(filepath, schema, delimiter=',')
+        return src, dst, node_ids, attributes
+    
+    def from_edge_table(parse):
+        snapshot_path = source = None
+        if snapshot_dir is not None:
+            stat = os.stat(filepath)
+            source = {'path': os.path.abspath(filepath), 'size': stat.st_size,
+                      'mtime_ns': stat.st_mtime_ns, 'directed': directed}
+            kind = 'directed' if directed else 'undirected'
+            snapshot_path = os.path.join(snapshot_dir, f"{os.path.basename(filepath)}.{kind}.csr")
+            meta = read_snapshot_meta(snapshot_path)
+            if meta is not None and meta['source'] == source:
+                csr = CSRGraph.load(snapshot_path)
+                print(f"Loaded snapshot {snapshot_path}")
+                return csr if as_csr else csr.to_networkx()
+        
+        src, dst, node_ids, edge_data = parse()
+        csr = CSRGraph.from_edges(src, dst, num_nodes=len(node_ids), node_ids=node_ids,
+                                  directed=directed, edge_data=edge_data)
+        if snapshot_path is not None:
+            csr.save(snapshot_path, source=source)
+            csr = CSRGraph.load(snapshot_path)
+        return csr if as_csr else csr.to_networkx()
+    
+    # Handle edge lists (.txt is common in SNAP datasets, which use # comments)
+    if base_path.endswith(('.edgelist', '.txt', '.tsv')):
+        return from_edge_table(parse_edge_list)
+    
+    # Handle .csv files
+    elif base_path.endswith('.csv'):
+        return from_edge_table(parse_csv)
     
     # Handle .gml files
-    elif filepath.endswith('.gml'):
+    elif base_path.endswith('.gml'):
         return nx.read_gml(filepath)
     
     # Handle .graphml files
-    elif filepath.endswith('.graphml'):
+    elif base_path.endswith('.graphml'):
         return nx.read_graphml(filepath)
     
-    # Handle .csv files
-    elif filepath.endswith('.csv'):
-        df = pd.read_csv(filepath)
-        if 'source' in df.columns and 'target' in df.columns:
-            G = nx.DiGraph() if directed else nx.Graph()
-            G.add_edges_from(zip(df['source'], df['target']))
-            return G
-        elif len(df.columns) >= 2:
-            # Assume first two columns are source and target
-            G = nx.DiGraph() if directed else nx.Graph()
-            G.add_edges_from(zip(df.iloc[:, 0], df.iloc[:, 1]))
-            return G
-    
-    # Handle .tsv files (tab-separated)
-    elif filepath.endswith('.tsv'):
-        return nx.read_edgelist(filepath, create_using=nx.DiGraph() if directed else nx.Graph(), comments='#', delimiter='\t')
-    
     else:
         # Try to read as edgelist anyway (for files without extension)
         try:
-            return nx.read_edgelist(filepath, create_using=nx.DiGraph() if directed else nx.Graph(), comments='#')
-        except:
+            return from_edge_table(parse_edge_list)
+        except Exception:
             raise ValueError(f"Unsupported file format: {filepath}. Supported formats: .edgelist, .txt, .csv, .tsv, .gml, .graphml")
 
 
@@ -0,0 +1,366 @@
+"""
+Structural similarity between graphs from compact per-graph signatures.
+
+A GraphSignature is computed once per graph and holds everything the
+distances need, so comparing many graphs never revisits their edges:
+
+- the degree histogram, for Kolmogorov-Smirnov and earth mover's distances
+  between degree distributions;
+- the k smallest and k largest eigenvalues of the normalized Laplacian from
+  SciPy's sparse Lanczos solver (eigsh); the smallest ones come from the
+  largest of 2I - L, so no factorization is needed, and small graphs use
+  the full dense spectrum;
+- the NetLSD heat trace h(t) = sum_j exp(-t * lambda_j) / n over log-spaced
+  timescales, with the unknown middle of the spectrum interpolated linearly
+  between its two computed ends;
+- counts of small connected subgraphs (edges, wedges, triangles, 3-stars,
+  3-edge paths and tailed triangles, not induced) from degrees and
+  per-node triangle counts, compared by relative graphlet frequency distance;
+- the sorted 64-bit hashes of the edges' node identifiers, so the edge
+  overlap (Jaccard) of two graphs sharing node ids is one merge of two
+  sorted arrays.
+
+Signatures are small and picklable and can be kept in a MetricsCache.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import scipy.sparse.csgraph as csgraph
+from scipy.sparse.linalg import ArpackNoConvergence, eigsh
+from scipy.spatial.distance import cdist
+from scipy.stats import wasserstein_distance
+
+from csr_graph import CSRGraph
+from triangles import count_triangles
+
+
+DEFAULT_EIGENVALUES = 20
+NETLSD_TIMESCALES = np.logspace(-2, 2, 250)
+GRAPHLETS = ('edges', 'wedges', 'triangles', '3-stars', '3-paths', 'tailed_triangles')
+SIMILARITY_MEASURES = ('degree_ks', 'degree_emd', 'spectral', 'netlsd', 'graphlets', 'edge_jaccard')
+# Graphs with at most this many nodes use the full dense spectrum
+DENSE_SPECTRUM_NODES = 512
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+class GraphSignature:
+    """
+    Compact structural summary of one graph.
+
+    ``eigenvalues_low`` and ``eigenvalues_high`` hold the smallest and
+    largest normalized Laplacian eigenvalues in ascending order; when
+    ``full_spectrum`` is True they are both the complete spectrum. ``k`` is
+    the number of eigenvalues requested from each end, which is what the
+    spectral distance compares.
+    """
+
+    def __init__(self, num_nodes: int, num_edges: int, directed: bool,
+                 degree_values: np.ndarray, degree_counts: np.ndarray,
+                 eigenvalues_low: np.ndarray, eigenvalues_high: np.ndarray, full_spectrum: bool,
+                 k: int, timescales: np.ndarray, heat_trace: np.ndarray, graphlets: np.ndarray,
+                 edge_keys: np.ndarray):
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.directed = directed
+        self.degree_values = degree_values
+        self.degree_counts = degree_counts
+        self.eigenvalues_low = eigenvalues_low
+        self.eigenvalues_high = eigenvalues_high
+        self.full_spectrum = full_spectrum
+        self.k = k
+        self.timescales = timescales
+        self.heat_trace = heat_trace
+        self.graphlets = graphlets
+        self.edge_keys = edge_keys
+
+    def graphlet_counts(self) -> Dict[str, int]:
+        return dict(zip(GRAPHLETS, self.graphlets.tolist()))
+
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in (self.degree_values, self.degree_counts,
+                                              self.eigenvalues_low, self.eigenvalues_high,
+                                              self.timescales, self.heat_trace,
+                                              self.graphlets, self.edge_keys))
+
+    def __repr__(self) -> str:
+        return (f"GraphSignature({self.num_nodes} nodes, {self.num_edges} edges, "
+                f"{len(self.eigenvalues_low)} eigenvalues, {self.nbytes() / 1e6:.1f} MB)")
+
+
+def laplacian_spectrum(graph: CSRGraph, k: int = DEFAULT_EIGENVALUES):
+    """
+    Smallest and largest eigenvalues of the normalized Laplacian of the
+    undirected version of a graph.
+
+    Args:
+        graph: CSRGraph object
+        k: Number of eigenvalues taken from each end of the spectrum
+
+    Returns:
+        Tuple of (k smallest ascending, k largest ascending, whether the full
+        spectrum was computed)
+    """
+    adjacency = graph.to_undirected().without_self_loops().to_scipy().astype(np.float64)
+    n = adjacency.shape[0]
+    laplacian = csgraph.laplacian(adjacency, normed=True)
+    if n <= max(DENSE_SPECTRUM_NODES, 2 * k + 1):
+        spectrum = np.linalg.eigvalsh(laplacian.toarray()) if n else np.empty(0)
+        return spectrum, spectrum, True
+
+    def extreme(matrix):
+        try:
+            values = eigsh(matrix, k=k, which='LA', return_eigenvectors=False, tol=1e-8)
+        except ArpackNoConvergence as e:
+            print(f"Warning: only {len(e.eigenvalues)} of {k} Laplacian eigenvalues converged")
+            values = e.eigenvalues
+        return np.sort(values)
+
+    high = extreme(laplacian)
+    # The spectrum lies in [0, 2], so the smallest eigenvalues of L are the largest of 2I - L
+    low = np.sort(2.0 - extreme(2.0 * sp.identity(n, format='csr') - laplacian))
+    return np.clip(low, 0.0, 2.0), np.clip(high, 0.0, 2.0), False
+
+
+def heat_trace(eigenvalues_low: np.ndarray, eigenvalues_high: np.ndarray, num_nodes: int,
+               full_spectrum: bool, timescales: np.ndarray = NETLSD_TIMESCALES) -> np.ndarray:
+    """
+    NetLSD heat trace signature normalized by the number of nodes.
+    """
+    if num_nodes == 0:
+        return np.zeros(len(timescales))
+    if full_spectrum:
+        spectrum = eigenvalues_low
+    else:
+        missing = num_nodes - len(eigenvalues_low) - len(eigenvalues_high)
+        # Interpolate the uncomputed middle of the spectrum linearly between its ends
+        middle = np.linspace(eigenvalues_low[-1], eigenvalues_high[0], missing + 2)[1:-1]
+        spectrum = np.concatenate([eigenvalues_low, middle, eigenvalues_high])
+    return np.exp(-np.outer(timescales, spectrum)).sum(axis=1) / num_nodes
+
+
+def graphlet_counts(graph: CSRGraph, node_triangles: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Count the small connected subgraphs listed in GRAPHLETS (not induced) in
+    the undirected version of a graph.
+
+    Args:
+        graph: CSRGraph object
+        node_triangles: Per-node triangle counts, if already known
+
+    Returns:
+        int64 array of counts in GRAPHLETS order
+    """
+    graph = graph.to_undirected().without_self_loops()
+    degrees = np.diff(graph.indptr).astype(np.int64)
+    if node_triangles is None:
+        node_triangles = count_triangles(graph)[1]
+    triangles = int(node_triangles.sum()) // 3
+    rows, cols = graph.row_indices(), graph.indices
+    forward = rows < cols
+    # Paths u' - u - v - v' around every edge (u, v), minus the closed ones (triangles)
+    paths = int(((degrees[rows[forward]] - 1) * (degrees[cols[forward]] - 1)).sum()) - 3 * triangles
+    return np.array([
+        len(rows) // 2,
+        int((degrees * (degrees - 1) // 2).sum()),
+        triangles,
+        int((degrees * (degrees - 1) * (degrees - 2) // 6).sum()),
+        paths,
+        int((node_triangles * np.maximum(degrees - 2, 0)).sum())
+    ], dtype=np.int64)
+
+
+def edge_keys(graph: CSRGraph) -> np.ndarray:
+    """
+    Sorted 64-bit hashes of every edge's (source id, target id) pair, keyed
+    on node identifiers so that graphs with different index orders compare.
+    Undirected edges hash both endpoint orders alike and appear once.
+    """
+    ids = pd.util.hash_array(np.asarray(graph.node_ids))
+    rows, cols = graph.row_indices(), graph.indices
+    if graph.is_directed():
+        first, second = ids[rows], ids[cols]
+    else:
+        keep = rows <= cols
+        first = np.minimum(ids[rows[keep]], ids[cols[keep]])
+        second = np.maximum(ids[rows[keep]], ids[cols[keep]])
+    keys = first * _HASH_MULTIPLIER + second  # wraps modulo 2**64
+    keys.sort()
+    return keys
+
+
+def graph_signature(graph: CSRGraph, k: int = DEFAULT_EIGENVALUES,
+                    timescales: np.ndarray = NETLSD_TIMESCALES,
+                    node_triangles: Optional[np.ndarray] = None) -> GraphSignature:
+    """
+    Compute the structural signature of a graph.
+
+    Args:
+        graph: CSRGraph object
+        k: Number of Laplacian eigenvalues kept from each end of the spectrum
+        timescales: NetLSD heat trace timescales
+        node_triangles: Per-node triangle counts, if already known
+
+    Returns:
+        GraphSignature object
+    """
+    n = graph.number_of_nodes()
+    degree_values, degree_counts = np.unique(graph.degrees(), return_counts=True)
+    low, high, full = laplacian_spectrum(graph, k)
+    return GraphSignature(
+        num_nodes=n, num_edges=graph.number_of_edges(), directed=graph.is_directed(),
+        degree_values=degree_values.astype(np.int64), degree_counts=degree_counts.astype(np.int64),
+        eigenvalues_low=low, eigenvalues_high=high, full_spectrum=full, k=k,
+        timescales=np.asarray(timescales, dtype=np.float64),
+        heat_trace=heat_trace(low, high, n, full, timescales),
+        graphlets=graphlet_counts(graph, node_triangles),
+        edge_keys=edge_keys(graph))
+
+
+def degree_ks(a: GraphSignature, b: GraphSignature) -> float:
+    """
+    Kolmogorov-Smirnov statistic between two degree distributions.
+    """
+    if not a.num_nodes or not b.num_nodes:
+        return float(a.num_nodes != b.num_nodes)
+    support = np.union1d(a.degree_values, b.degree_values)
+
+    def cdf(signature):
+        cumulative = np.concatenate([[0], np.cumsum(signature.degree_counts)]) / signature.num_nodes
+        return cumulative[np.searchsorted(signature.degree_values, support, side='right')]
+
+    return float(np.abs(cdf(a) - cdf(b)).max())
+
+
+def degree_emd(a: GraphSignature, b: GraphSignature) -> float:
+    """
+    Earth mover's (1-Wasserstein) distance between two degree distributions.
+    """
+    if not a.num_nodes or not b.num_nodes:
+        return 0.0 if a.num_nodes == b.num_nodes else np.inf
+    return float(wasserstein_distance(a.degree_values, b.degree_values,
+                                      a.degree_counts, b.degree_counts))
+
+
+def _spectral_vector(signature: GraphSignature) -> np.ndarray:
+    """
+    The k smallest eigenvalues, zero-padded to length k for graphs with
+    fewer than k nodes.
+    """
+    values = signature.eigenvalues_low[:signature.k]
+    return np.pad(values, (0, signature.k - len(values)))
+
+
+def spectral_distance(a: GraphSignature, b: GraphSignature) -> float:
+    """
+    Euclidean distance between the k smallest normalized Laplacian
+    eigenvalues (same k required), whatever the size of either graph.
+    """
+    if a.k != b.k:
+        raise ValueError("Spectra were computed with different numbers of eigenvalues")
+    return float(np.linalg.norm(_spectral_vector(a) - _spectral_vector(b)))
+
+
+def netlsd_distance(a: GraphSignature, b: GraphSignature) -> float:
+    """
+    Euclidean distance between NetLSD heat traces (same timescales required).
+    """
+    if len(a.heat_trace) != len(b.heat_trace) or not np.allclose(a.timescales, b.timescales):
+        raise ValueError("Heat traces were computed on different timescales")
+    return float(np.linalg.norm(a.heat_trace - b.heat_trace))
+
+
+def _graphlet_frequencies(signature: GraphSignature) -> np.ndarray:
+    counts = signature.graphlets.astype(np.float64)
+    return np.log1p(counts) - np.log1p(counts.sum())
+
+
+def graphlet_distance(a: GraphSignature, b: GraphSignature) -> float:
+    """
+    Relative graphlet frequency distance: sum of absolute differences of the
+    log relative frequencies of each graphlet.
+    """
+    return float(np.abs(_graphlet_frequencies(a) - _graphlet_frequencies(b)).sum())
+
+
+def edge_jaccard(a: GraphSignature, b: GraphSignature) -> float:
+    """
+    Jaccard similarity of two graphs' edge sets (edges matched by node ids).
+    """
+    if not len(a.edge_keys) and not len(b.edge_keys):
+        return 1.0
+    small, large = sorted((a.edge_keys, b.edge_keys), key=len)
+    positions = np.searchsorted(large, small).clip(max=max(len(large) - 1, 0))
+    shared = int(np.count_nonzero(large[positions] == small)) if len(large) else 0
+    return shared / (len(small) + len(large) - shared)
+
+
+_PAIRWISE_DISTANCES = {
+    'degree_ks': degree_ks,
+    'degree_emd': degree_emd,
+    'spectral': spectral_distance,
+    'netlsd': netlsd_distance,
+    'graphlets': graphlet_distance,
+    'edge_jaccard': lambda a, b: 1.0 - edge_jaccard(a, b),
+}
+
+
+def distance_matrix(signatures: Sequence[GraphSignature], measure: str) -> np.ndarray:
+    """
+    Pairwise distances between many signatures for one measure.
+
+    Spectra, heat traces and graphlet frequencies are stacked and compared
+    with one cdist call; the distribution and edge measures are evaluated
+    per pair. 'edge_jaccard' gives the Jaccard distance (1 - similarity).
+
+    Args:
+        signatures: GraphSignature objects
+        measure: One of SIMILARITY_MEASURES
+
+    Returns:
+        Symmetric (N, N) array of distances
+    """
+    if measure not in SIMILARITY_MEASURES:
+        raise ValueError(f"Unknown similarity measure: {measure}")
+    count = len(signatures)
+    if measure == 'netlsd' and count:
+        for signature in signatures[1:]:
+            netlsd_distance(signatures[0], signature)  # validates the timescales
+        return cdist(np.stack([s.heat_trace for s in signatures]),
+                     np.stack([s.heat_trace for s in signatures]))
+    if measure == 'graphlets' and count:
+        frequencies = np.stack([_graphlet_frequencies(s) for s in signatures])
+        return cdist(frequencies, frequencies, metric='cityblock')
+    if measure == 'spectral' and count:
+        for signature in signatures[1:]:
+            spectral_distance(signatures[0], signature)  # validates k
+        spectra = np.stack([_spectral_vector(s) for s in signatures])
+        return cdist(spectra, spectra)
+
+    distance = _PAIRWISE_DISTANCES[measure]
+    matrix = np.zeros((count, count))
+    for i in range(count):
+        for j in range(i + 1, count):
+            matrix[i, j] = matrix[j, i] = distance(signatures[i], signatures[j])
+    return matrix
+
+
+def distance_matrices(signatures: Sequence[GraphSignature], names: Sequence[str],
+                      measures: Optional[Sequence[str]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Pairwise distance tables between named signatures.
+
+    Args:
+        signatures: GraphSignature objects
+        names: Graph names labelling rows and columns
+        measures: Measures to compute (all of SIMILARITY_MEASURES when None)
+
+    Returns:
+        dict: Measure name to (N, N) DataFrame of distances
+    """
+    measures: List[str] = list(SIMILARITY_MEASURES if measures is None else measures)
+    index = pd.Index(list(names), name='graph')
+    return {measure: pd.DataFrame(distance_matrix(signatures, measure), index=index, columns=index)
+            for measure in measures}
@@ -0,0 +1,347 @@
+"""
+Incremental maintenance of graph metrics under batches of edge insertions and
+deletions.
+
+The graph is held as adjacency sets alongside running per-node degrees and
+triangle counts, a union-find over the undirected projection and the global
+counters (edges, mutual edges, sums of degrees and local clustering) that the
+maintained metrics are read from. Applying a batch costs time proportional to
+the batch and the neighbourhoods of its endpoints; only the union-find is
+rebuilt from scratch, and only after a batch that deleted an edge.
+"""
+
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from components import component_labels, component_size_histogram
+from csr_graph import CSRGraph
+from directed_metrics import reverse_edge_mask
+from triangles import count_triangles, local_clustering
+
+
+# Metrics kept up to date for every graph, and those only kept for undirected
+# graphs (directed clustering and strong components need a full recompute)
+MAINTAINED_METRICS = ('density', 'triangles', 'degree_distribution', 'reciprocity')
+UNDIRECTED_METRICS = ('clustering_coefficient', 'connected_components')
+
+
+def _edge_pairs(edges) -> Iterable[Tuple]:
+    if edges is None:
+        return ()
+    if isinstance(edges, np.ndarray):
+        return map(tuple, edges.reshape(-1, 2).tolist())
+    return edges
+
+
+class IncrementalGraph:
+    """
+    Mutable graph with incrementally maintained metrics.
+
+    Nodes are addressed by their original identifiers; edges naming unknown
+    nodes add them. Deleting edges never removes nodes. Edge attributes are
+    not tracked.
+    """
+
+    def __init__(self, graph: CSRGraph, node_triangles: Optional[np.ndarray] = None,
+                 components: Optional[Tuple[int, np.ndarray]] = None):
+        """
+        Args:
+            graph: Initial graph
+            node_triangles: Per-node triangle counts of the undirected graph, if
+                            already computed
+            components: (count, labels) of the weak components, if already computed
+        """
+        self.directed = graph.is_directed()
+        self.node_ids: List = graph.node_ids.tolist()
+        self._index = {node: i for i, node in enumerate(self.node_ids)}
+        n = len(self.node_ids)
+
+        undirected = graph.to_undirected()
+        simple = undirected.without_self_loops()
+        indptr, indices = simple.indptr, simple.indices.tolist()
+        self._neighbours = [set(indices[indptr[i]:indptr[i + 1]]) for i in range(n)]
+        if self.directed:
+            indptr, indices = graph.indptr, graph.indices.tolist()
+            self._out = [set(indices[indptr[i]:indptr[i + 1]]) for i in range(n)]
+            self._loops = None
+            self._mutual = int(reverse_edge_mask(graph).sum())
+        else:
+            rows = graph.row_indices()
+            self._out = None
+            self._loops = set(rows[rows == graph.indices].tolist())
+            self._mutual = 0
+        self.num_edges = graph.number_of_edges()
+
+        degrees = graph.degrees().astype(np.int64)
+        self._degrees = degrees.tolist()
+        self._degree_counts = dict(zip(*(a.tolist() for a in np.unique(degrees, return_counts=True))))
+        self._degree_sum = int(degrees.sum())
+        self._degree_square_sum = int((degrees * degrees).sum())
+
+        if node_triangles is None:
+            node_triangles = count_triangles(undirected)[1]
+        self._triangles = np.asarray(node_triangles, dtype=np.int64).tolist()
+        self.num_triangles = sum(self._triangles) // 3
+        clustering = local_clustering(undirected, np.asarray(node_triangles))
+        self._clustering = clustering.tolist()
+        self._clustering_sum = float(clustering.sum())
+
+        self._rebuild_components(components or component_labels(undirected))
+
+    def _rebuild_components(self, components: Tuple[int, np.ndarray]):
+        """
+        Reset the union-find to the given component labelling.
+        """
+        num_components, labels = components
+        labels = np.asarray(labels, dtype=np.int64)
+        roots = np.full(num_components, -1, dtype=np.int64)
+        # The last node of every component becomes its root
+        roots[labels] = np.arange(len(labels))
+        self._parent = roots[labels].tolist()
+        self._size = np.bincount(roots[labels], minlength=len(labels)).tolist()
+        self.num_components = num_components
+        self._components_stale = False
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(self, u: int, v: int):
+        ru, rv = self._find(u), self._find(v)
+        if ru == rv:
+            return
+        if self._size[ru] < self._size[rv]:
+            ru, rv = rv, ru
+        self._parent[rv] = ru
+        self._size[ru] += self._size[rv]
+        self.num_components -= 1
+
+    def number_of_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def _node(self, node) -> int:
+        i = self._index.get(node)
+        if i is None:
+            i = len(self.node_ids)
+            self._index[node] = i
+            self.node_ids.append(node)
+            self._neighbours.append(set())
+            if self.directed:
+                self._out.append(set())
+            self._degrees.append(0)
+            self._degree_counts[0] = self._degree_counts.get(0, 0) + 1
+            self._triangles.append(0)
+            self._clustering.append(0.0)
+            self._parent.append(i)
+            self._size.append(1)
+            self.num_components += 1
+        return i
+
+    def _shift_degree(self, i: int, delta: int):
+        old = self._degrees[i]
+        new = old + delta
+        self._degrees[i] = new
+        self._degree_counts[old] -= 1
+        if not self._degree_counts[old]:
+            del self._degree_counts[old]
+        self._degree_counts[new] = self._degree_counts.get(new, 0) + 1
+        self._degree_sum += delta
+        self._degree_square_sum += new * new - old * old
+
+    def _link(self, u: int, v: int, sign: int, touched: set):
+        """
+        Add (sign=1) or remove (sign=-1) the undirected edge u-v (u != v),
+        updating the triangles it closes.
+        """
+        common = self._neighbours[u] & self._neighbours[v]
+        closed = sign * len(common)
+        self._triangles[u] += closed
+        self._triangles[v] += closed
+        for w in common:
+            self._triangles[w] += sign
+        self.num_triangles += closed
+        touched.update(common)
+        touched.add(u)
+        touched.add(v)
+        if sign > 0:
+            self._neighbours[u].add(v)
+            self._neighbours[v].add(u)
+            self._union(u, v)
+        else:
+            self._neighbours[u].discard(v)
+            self._neighbours[v].discard(u)
+            self._components_stale = True
+
+    def _add(self, u: int, v: int, touched: set):
+        if self.directed:
+            if v in self._out[u]:
+                return
+            self._out[u].add(v)
+            if u == v or u in self._out[v]:
+                self._mutual += 1 if u == v else 2
+            else:
+                self._link(u, v, 1, touched)
+        elif u == v:
+            if u in self._loops:
+                return
+            self._loops.add(u)
+        elif v in self._neighbours[u]:
+            return
+        else:
+            self._link(u, v, 1, touched)
+        self.num_edges += 1
+        self._shift_degree(u, 1)
+        self._shift_degree(v, 1)
+
+    def _remove(self, u: int, v: int, touched: set):
+        if self.directed:
+            if v not in self._out[u]:
+                return
+            self._out[u].discard(v)
+            if u == v or u in self._out[v]:
+                self._mutual -= 1 if u == v else 2
+            else:
+                self._link(u, v, -1, touched)
+        elif u == v:
+            if u not in self._loops:
+                return
+            self._loops.discard(u)
+        elif v not in self._neighbours[u]:
+            return
+        else:
+            self._link(u, v, -1, touched)
+        self.num_edges -= 1
+        self._shift_degree(u, -1)
+        self._shift_degree(v, -1)
+
+    def apply(self, added=None, removed=None):
+        """
+        Apply one batch of edge changes; deletions are applied before insertions.
+        Inserting an existing edge or deleting a missing one has no effect.
+
+        Args:
+            added: Edges to insert, as (source, target) pairs of node identifiers
+            removed: Edges to delete, as (source, target) pairs of node identifiers
+        """
+        touched = set()
+        for source, target in _edge_pairs(removed):
+            u, v = self._index.get(source), self._index.get(target)
+            if u is not None and v is not None:
+                self._remove(u, v, touched)
+        for source, target in _edge_pairs(added):
+            self._add(self._node(source), self._node(target), touched)
+
+        # Local clustering only changes where a triangle or an undirected degree did
+        for i in touched:
+            degree = len(self._neighbours[i])
+            value = 2.0 * self._triangles[i] / (degree * (degree - 1)) if degree > 1 else 0.0
+            self._clustering_sum += value - self._clustering[i]
+            self._clustering[i] = value
+        if not self.num_triangles:
+            # Every local coefficient is zero; drop accumulated rounding error
+            self._clustering_sum = 0.0
+
+    def _component_labels(self) -> Tuple[int, np.ndarray]:
+        if self._components_stale:
+            self._rebuild_components(component_labels(self.to_csr().to_undirected()))
+        parent = np.asarray(self._parent, dtype=np.int64)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        self._parent = parent.tolist()
+        _, labels = np.unique(parent, return_inverse=True)
+        return self.num_components, labels.astype(np.int32)
+
+    def active_nodes(self) -> int:
+        """
+        Number of nodes with at least one edge.
+        """
+        return self.number_of_nodes() - self._degree_counts.get(0, 0)
+
+    def density(self, active_only: bool = False) -> float:
+        n = self.active_nodes() if active_only else self.number_of_nodes()
+        max_edges = n * (n - 1) if self.directed else n * (n - 1) / 2
+        return self.num_edges / max_edges if max_edges > 0 else 0.0
+
+    def degree_summary(self, active_only: bool = False) -> Dict:
+        """
+        Degree statistics over all nodes, or over the nodes with an edge.
+        """
+        n = self.active_nodes() if active_only else self.number_of_nodes()
+        degrees = [d for d in self._degree_counts if d or not active_only]
+        mean = self._degree_sum / n if n else 0.0
+        variance = max(self._degree_square_sum / n - mean * mean, 0.0) if n else 0.0
+        return {
+            'avg_degree': mean,
+            'max_degree': max(degrees) if degrees else 0,
+            'min_degree': min(degrees) if degrees else 0,
+            'degree_variance': variance,
+            'degree_std': np.sqrt(variance)
+        }
+
+    def average_clustering(self, active_only: bool = False) -> float:
+        """
+        Average local clustering of the undirected projection.
+        """
+        n = self.active_nodes() if active_only else self.number_of_nodes()
+        return self._clustering_sum / n if n else 0.0
+
+    def reciprocity(self) -> float:
+        if not self.directed:
+            return 1.0
+        return self._mutual / self.num_edges if self.num_edges else 0.0
+
+    def metrics(self) -> Dict:
+        """
+        Current values of the maintained metrics, in the layout of the
+        corresponding GraphAnalyzer metrics.
+        """
+        metrics = {
+            'density': self.density(),
+            'triangles': self.num_triangles,
+            'degree_distribution': self.degree_summary(),
+            'reciprocity': self.reciprocity()
+        }
+        if not self.directed:
+            metrics['clustering_coefficient'] = self.average_clustering()
+            num_components, labels = self._component_labels()
+            sizes = np.bincount(labels, minlength=num_components).tolist()
+            metrics['connected_components'] = {
+                'num_components': num_components,
+                'largest_component_size': max(sizes) if sizes else 0,
+                'component_sizes': sizes,
+                'avg_component_size': np.mean(sizes) if sizes else 0,
+                'size_histogram': dict(zip(*(a.tolist() for a in component_size_histogram(labels))))
+            }
+        return metrics
+
+    def derived(self) -> Dict:
+        """
+        Maintained per-node arrays, keyed like the GraphAnalyzer derived cache.
+        """
+        return {
+            'degrees': np.asarray(self._degrees, dtype=np.int64),
+            'node_triangles': np.asarray(self._triangles, dtype=np.int64),
+            'component_labels': self._component_labels()
+        }
+
+    def to_csr(self) -> CSRGraph:
+        """
+        Build a CSRGraph of the current edges.
+        """
+        adjacency = self._out if self.directed else self._neighbours
+        counts = np.fromiter(map(len, adjacency), dtype=np.int64, count=len(adjacency))
+        src = np.repeat(np.arange(len(adjacency)), counts)
+        dst = np.fromiter(chain.from_iterable(adjacency), dtype=np.int64, count=int(counts.sum()))
+        if not self.directed and self._loops:
+            loops = np.fromiter(self._loops, dtype=np.int64, count=len(self._loops))
+            src, dst = np.concatenate([src, loops]), np.concatenate([dst, loops])
+        return CSRGraph.from_edges(src, dst, num_nodes=len(adjacency),
+                                   node_ids=np.array(self.node_ids), directed=self.directed)
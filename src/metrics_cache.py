@@ -0,0 +1,168 @@
+"""
+Persistent, content-addressed cache of computed graph metrics.
+
+Each metric result is stored in its own file keyed by a fingerprint of the
+graph's CSR arrays, the metric name, its parameters and the versions of the
+libraries that computed it. Re-running an analysis on unchanged data reloads
+results instead of recomputing them; the cache is bounded in size and evicts
+the least recently used entries first.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Dict, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+import scipy
+
+from csr_graph import CSRGraph
+
+
+# Part of every cache key: bump whenever a metric implementation changes in a
+# way that alters its results, so entries computed by older code are missed
+# 2: reciprocity, communities, centralities, components and k-core outputs changed
+# 3: similarity signatures record k
+CACHE_FORMAT_VERSION = 3
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+
+def library_versions() -> Dict[str, str]:
+    return {
+        'cache_format': str(CACHE_FORMAT_VERSION),
+        'networkx': nx.__version__,
+        'numpy': np.__version__,
+        'scipy': scipy.__version__
+    }
+
+
+def graph_fingerprint(graph: CSRGraph) -> str:
+    """
+    Hash the content of a graph (CSR arrays, node ids, edge attributes and directedness).
+
+    Args:
+        graph: CSRGraph object
+
+    Returns:
+        str: Hex digest identifying the graph's content
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(b'directed' if graph.is_directed() else b'undirected')
+    digest.update(np.ascontiguousarray(graph.indptr, dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(graph.indices, dtype=np.int64).tobytes())
+    if graph.node_ids.dtype == object:
+        digest.update(pickle.dumps(graph.node_ids.tolist()))
+    else:
+        digest.update(str(graph.node_ids.dtype).encode())
+        digest.update(np.ascontiguousarray(graph.node_ids).tobytes())
+    for name in sorted(graph.edge_data):
+        values = graph.edge_data[name]
+        digest.update(f"{name}:{values.dtype}".encode())
+        digest.update(np.ascontiguousarray(values).tobytes())
+    return digest.hexdigest()
+
+
+class MetricsCache:
+    """
+    Size-bounded on-disk cache of metric results keyed by graph fingerprint.
+    """
+
+    def __init__(self, cache_dir: str = 'results/cache', max_bytes: int = DEFAULT_CACHE_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_path(self, fingerprint: str, metric: str, params: Optional[Dict]) -> str:
+        key = json.dumps({'metric': metric, 'params': params or {},
+                          'versions': library_versions()}, sort_keys=True, default=str)
+        key_hash = hashlib.blake2b(key.encode(), digest_size=12).hexdigest()
+        return os.path.join(self.cache_dir, fingerprint, f"{metric}-{key_hash}.pkl")
+
+    def load(self, fingerprint: str, metric: str, params: Optional[Dict] = None) -> Tuple[bool, Any]:
+        """
+        Look up a metric result.
+
+        Args:
+            fingerprint: Graph fingerprint from graph_fingerprint
+            metric: Metric name
+            params: Parameters the metric was computed with
+
+        Returns:
+            Tuple of (hit, value); value is None on a miss
+        """
+        path = self._entry_path(fingerprint, metric, params)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False, None
+        os.utime(path)  # mark as recently used
+        return True, value
+
+    def store(self, fingerprint: str, metric: str, value: Any, params: Optional[Dict] = None):
+        """
+        Save a metric result and evict old entries if the cache is over budget.
+
+        Args:
+            fingerprint: Graph fingerprint from graph_fingerprint
+            metric: Metric name
+            value: Result to store (must be picklable)
+            params: Parameters the metric was computed with
+        """
+        path = self._entry_path(fingerprint, metric, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def invalidate(self, fingerprint: Optional[str] = None, metric: Optional[str] = None) -> int:
+        """
+        Remove cache entries.
+
+        Args:
+            fingerprint: Only remove entries of this graph (all graphs if None)
+            metric: Only remove entries of this metric (all metrics if None)
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        for path, _, _ in self._entries():
+            entry_fingerprint = os.path.basename(os.path.dirname(path))
+            entry_metric = os.path.basename(path).rsplit('-', 1)[0]
+            if fingerprint not in (None, entry_fingerprint) or metric not in (None, entry_metric):
+                continue
+            os.remove(path)
+            removed += 1
+        return removed
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.pkl'):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    yield path, stat.st_size, stat.st_mtime
+
+    def _evict(self):
+        entries = list(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
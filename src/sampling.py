@@ -0,0 +1,178 @@
+"""
+Sampling estimators with confidence intervals for approximate graph metrics.
+
+Used by GraphAnalyzer's approximate mode to bound the cost of triangle,
+clustering, distance and betweenness metrics on very large graphs.
+"""
+
+import numpy as np
+from scipy.stats import norm
+from typing import Dict
+
+from bfs import bfs_distances
+from csr_graph import CSRGraph
+
+
+DEFAULT_SAMPLE_BUDGET = 20000
+DEFAULT_CONFIDENCE = 0.95
+
+
+def _interval(estimate: float, half_width: float, low: float = 0.0,
+              high: float = np.inf) -> Dict:
+    return {
+        'estimate': estimate,
+        'ci_low': max(low, estimate - half_width),
+        'ci_high': min(high, estimate + half_width)
+    }
+
+
+def _bernoulli_half_width(p: float, samples: int, confidence: float) -> float:
+    if samples == 0:
+        return 0.0
+    z = norm.ppf(0.5 + confidence / 2)
+    return float(z * np.sqrt(p * (1 - p) / samples))
+
+
+def _sample_wedges(graph: CSRGraph, centers: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Sample one random wedge (pair of distinct neighbours) per center node and
+    return whether each wedge is closed. Centers must have degree >= 2.
+    """
+    starts = graph.indptr[centers].astype(np.int64)
+    degrees = graph.indptr[centers + 1] - starts
+    first = (rng.random(len(centers)) * degrees).astype(np.int64)
+    second = (rng.random(len(centers)) * (degrees - 1)).astype(np.int64)
+    second += second >= first
+    u = graph.indices[starts + first]
+    w = graph.indices[starts + second]
+    return graph.has_edges(u, w)
+
+
+def estimate_transitivity(graph: CSRGraph, samples: int, rng: np.random.Generator,
+                          confidence: float = DEFAULT_CONFIDENCE) -> Dict:
+    """
+    Estimate global transitivity and the triangle count by uniform wedge sampling.
+
+    Wedge centers are drawn proportionally to their number of wedges, so the
+    fraction of closed sampled wedges is an unbiased estimate of the fraction
+    of closed wedges, and triangles = closed fraction * wedges / 3.
+
+    Args:
+        graph: Undirected CSRGraph without self-loops
+        samples: Number of wedges to sample
+        rng: NumPy random generator
+        confidence: Confidence level of the reported intervals
+
+    Returns:
+        dict: 'transitivity' and 'triangles' intervals plus sample size
+    """
+    degrees = graph.out_degrees().astype(np.float64)
+    wedges_per_node = degrees * (degrees - 1) / 2
+    total_wedges = wedges_per_node.sum()
+    if total_wedges == 0 or samples == 0:
+        return {'transitivity': _interval(0.0, 0.0, high=1.0),
+                'triangles': _interval(0.0, 0.0), 'sample_size': 0}
+
+    centers = rng.choice(len(degrees), size=samples, p=wedges_per_node / total_wedges)
+    closed = _sample_wedges(graph, centers, rng)
+    p = float(closed.mean())
+    half_width = _bernoulli_half_width(p, samples, confidence)
+
+    return {
+        'transitivity': _interval(p, half_width, high=1.0),
+        'triangles': _interval(p * total_wedges / 3, half_width * total_wedges / 3,
+                               high=total_wedges / 3),
+        'sample_size': samples
+    }
+
+
+def estimate_average_clustering(graph: CSRGraph, samples: int, rng: np.random.Generator,
+                                confidence: float = DEFAULT_CONFIDENCE) -> Dict:
+    """
+    Estimate the average clustering coefficient.
+
+    A uniformly drawn node contributes one random wedge; the wedge is closed with
+    probability equal to the node's local clustering, so the closed fraction is
+    an unbiased estimate of the average (nodes with degree < 2 contribute 0).
+
+    Args:
+        graph: Undirected CSRGraph without self-loops
+        samples: Number of nodes to sample
+        rng: NumPy random generator
+        confidence: Confidence level of the reported interval
+
+    Returns:
+        dict: Interval for the average clustering coefficient plus sample size
+    """
+    n = graph.number_of_nodes()
+    if n == 0 or samples == 0:
+        return dict(_interval(0.0, 0.0, high=1.0), sample_size=0)
+
+    nodes = rng.integers(0, n, size=samples)
+    nodes = nodes[graph.out_degrees()[nodes] >= 2]
+    closed = np.count_nonzero(_sample_wedges(graph, nodes, rng))
+    p = closed / samples
+    return dict(_interval(p, _bernoulli_half_width(p, samples, confidence), high=1.0),
+                sample_size=samples)
+
+
+def estimate_distance_bounds(graph: CSRGraph, sweeps: int, rng: np.random.Generator) -> Dict:
+    """
+    Bound diameter and radius of a connected graph with repeated double sweeps.
+
+    Each double sweep runs a BFS from a start node, then a second BFS from the
+    farthest node found; every eccentricity seen is a diameter lower bound and a
+    radius upper bound, and 2 * e(v) bounds the diameter from above.
+
+    Args:
+        graph: Connected undirected CSRGraph
+        sweeps: Number of double sweeps (the first starts at the max-degree node)
+        rng: NumPy random generator for later start nodes
+
+    Returns:
+        dict: 'diameter' and 'radius' intervals (bounds are certain) plus BFS count
+    """
+    n = graph.number_of_nodes()
+    if n == 0:
+        return {'diameter': _interval(0, 0), 'radius': _interval(0, 0), 'sample_size': 0}
+
+    diameter_low, diameter_high = 0, np.inf
+    radius_high = np.inf
+    start = int(np.argmax(graph.out_degrees()))
+    for sweep in range(sweeps):
+        if sweep > 0:
+            start = int(rng.integers(n))
+        dist = bfs_distances(graph, start)
+        far = int(np.argmax(dist))
+        ecc_start = int(dist[far])
+        ecc_far = int(bfs_distances(graph, far).max())
+
+        diameter_low = max(diameter_low, ecc_start, ecc_far)
+        diameter_high = min(diameter_high, 2 * ecc_start, 2 * ecc_far)
+        radius_high = min(radius_high, ecc_start, ecc_far)
+
+    radius_low = (diameter_low + 1) // 2
+    return {
+        'diameter': {'estimate': diameter_low, 'ci_low': diameter_low, 'ci_high': diameter_high},
+        'radius': {'estimate': radius_high, 'ci_low': radius_low, 'ci_high': radius_high},
+        'sample_size': 2 * sweeps
+    }
+
+
+def hoeffding_half_width(samples: int, confidence: float = DEFAULT_CONFIDENCE,
+                         value_range: float = 1.0) -> float:
+    """
+    Hoeffding bound on the deviation of a mean of bounded i.i.d. samples.
+
+    Args:
+        samples: Number of samples averaged
+        confidence: Confidence level
+        value_range: Width of the interval each sample lies in
+
+    Returns:
+        float: Half-width of the confidence interval
+    """
+    if samples == 0:
+        return float(value_range)
+    return float(value_range * np.sqrt(np.log(2 / (1 - confidence)) / (2 * samples)))
+
@@ -0,0 +1,174 @@
+"""
+Dependency-aware scheduler for running GraphAnalyzer metrics concurrently.
+
+Each metric is a MetricTask naming a GraphAnalyzer method. Independent tasks
+run side by side in a process pool; every worker receives one copy of the
+analyzer (with shared intermediates such as the CSR arrays and the largest
+component already built), and the intermediates a task produces (e.g.
+per-node triangle counts) are shipped to the tasks that depend on it.
+Results found in a MetricsCache are loaded instead of recomputed.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence
+
+
+_worker_analyzer = None
+
+
+class MetricTask:
+    """
+    A single metric computation scheduled by run_metric_tasks.
+    """
+
+    def __init__(self, name: str, method: str, kwargs: Optional[Dict] = None,
+                 depends_on: Sequence[str] = (), provides: Sequence[str] = ()):
+        """
+        Args:
+            name: Task name used for dependencies and timings
+            method: GraphAnalyzer method to call
+            kwargs: Keyword arguments for the method
+            depends_on: Names of tasks that must finish first
+            provides: Keys of analyzer intermediates this task makes available
+                      to its dependents
+        """
+        self.name = name
+        self.method = method
+        self.kwargs = kwargs or {}
+        self.depends_on = tuple(depends_on)
+        self.provides = tuple(provides)
+
+    def __repr__(self) -> str:
+        return f"MetricTask({self.name!r})"
+
+
+def _run_task(analyzer, task: MetricTask, shared: Dict):
+    """
+    Run one task on an analyzer and collect what it produced.
+    """
+    analyzer._derived.update(shared)
+    analyzer.metrics = {}
+    start = time.perf_counter()
+    getattr(analyzer, task.method)(**task.kwargs)
+    elapsed = time.perf_counter() - start
+    provided = {key: analyzer._derived[key] for key in task.provides if key in analyzer._derived}
+    return analyzer.metrics, provided, elapsed
+
+
+def _init_worker(analyzer):
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _run_in_worker(task: MetricTask, shared: Dict):
+    return _run_task(_worker_analyzer, task, shared)
+
+
+def _merge_metrics(target: Dict, produced: Dict):
+    for key, value in produced.items():
+        if key == 'approximation':
+            target.setdefault(key, {}).update(value)
+        else:
+            target[key] = value
+
+
+def _check_dependencies(tasks: List[MetricTask]):
+    names = {task.name for task in tasks}
+    for task in tasks:
+        missing = set(task.depends_on) - names
+        if missing:
+            raise ValueError(f"Task {task.name} depends on unknown tasks: {sorted(missing)}")
+
+
+def run_metric_tasks(analyzer, tasks: List[MetricTask], n_jobs: int = 1,
+                     cache=None, raise_errors: bool = True) -> Dict:
+    """
+    Run metric tasks on an analyzer, concurrently where dependencies allow.
+
+    Args:
+        analyzer: GraphAnalyzer whose metrics are computed
+        tasks: Tasks to run
+        n_jobs: Number of worker processes (1 runs in-process, in task order)
+        cache: Optional MetricsCache to load results from and store them in
+        raise_errors: Re-raise the exception of a failing task; otherwise its
+                      message is recorded under metrics['errors'][task name]
+                      and the remaining tasks still run
+
+    Returns:
+        dict: Wall time in seconds per task name, plus 'total'
+    """
+    _check_dependencies(tasks)
+    by_name = {task.name: task for task in tasks}
+    timings = {}
+    done = set()
+    start = time.perf_counter()
+
+    def shared_for(task):
+        keys = [key for dep in task.depends_on for key in by_name[dep].provides]
+        return {key: analyzer._derived[key] for key in keys if key in analyzer._derived}
+
+    def cache_params(task):
+        return {'method': task.method, 'kwargs': task.kwargs}
+
+    def finish(task, result):
+        if isinstance(result, Exception):
+            if raise_errors:
+                raise result
+            print(f"Warning: Metric task {task.name} failed: {result}")
+            analyzer.metrics.setdefault('errors', {})[task.name] = str(result)
+            done.add(task.name)
+            return
+        produced, provided, elapsed = result
+        if cache is not None:
+            cache.store(fingerprint, task.name, produced, cache_params(task))
+        _merge_metrics(analyzer.metrics, produced)
+        analyzer._derived.update(provided)
+        timings[task.name] = elapsed
+        done.add(task.name)
+
+    remaining = list(tasks)
+    if cache is not None:
+        fingerprint = analyzer.fingerprint()
+        for task in tasks:
+            load_start = time.perf_counter()
+            hit, produced = cache.load(fingerprint, task.name, cache_params(task))
+            if hit:
+                _merge_metrics(analyzer.metrics, produced)
+                timings[task.name] = time.perf_counter() - load_start
+                done.add(task.name)
+                remaining.remove(task)
+        if done:
+            print(f"Loaded {len(done)} cached metrics for {analyzer.name}")
+
+    if n_jobs <= 1 or not remaining:
+        while remaining:
+            ready = [t for t in remaining if set(t.depends_on) <= done]
+            if not ready:
+                raise ValueError("Metric task dependencies contain a cycle")
+            task = ready[0]
+            remaining.remove(task)
+            metrics = analyzer.metrics
+            try:
+                result = _run_task(analyzer, task, {})
+            except Exception as e:
+                result = e
+            finally:
+                analyzer.metrics = metrics
+            finish(task, result)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                 initargs=(analyzer,)) as executor:
+            running = {}
+            while remaining or running:
+                for task in [t for t in remaining if set(t.depends_on) <= done]:
+                    remaining.remove(task)
+                    running[executor.submit(_run_in_worker, task, shared_for(task))] = task
+                if not running:
+                    raise ValueError("Metric task dependencies contain a cycle")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    finish(running.pop(future), future.exception() or future.result())
+
+    timings['total'] = time.perf_counter() - start
+    return timings
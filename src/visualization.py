@@ -12,6 +12,9 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 
+from components import component_labels as labels_of
+from csr_graph import CSRGraph
+
 
 class GraphVisualizer:
     """
@@ -159,7 +162,8 @@ class GraphVisualizer:
         plt.close()  # Close the figure instead of showing it
     
     def plot_connected_components(self, graph: nx.Graph, title: str = "Connected Components",
-                                save_path: Optional[str] = None):
+                                save_path: Optional[str] = None,
+                                component_labels: Optional[np.ndarray] = None):
         """
         Visualize connected components of a graph.
         
@@ -167,21 +171,18 @@ class GraphVisualizer:
             graph: NetworkX graph
             title: Title for the plot
             save_path: Optional path to save the plot
+            component_labels: Component label per node in graph.nodes() order
+                              (e.g. GraphAnalyzer.node_components()); computed
+                              when omitted
         """
-        if graph.is_directed():
-            components = list(nx.strongly_connected_components(graph))
-        else:
-            components = list(nx.connected_components(graph))
+        if component_labels is None:
+            component_labels = labels_of(CSRGraph.from_networkx(graph), strong=True)[1]
         
         plt.figure(figsize=self.figsize)
         
         # Color nodes by component
-        node_colors = []
-        for node in graph.nodes():
-            for i, component in enumerate(components):
-                if node in component:
-                    node_colors.append(i)
-                    break
+        node_colors = np.asarray(component_labels)
+        num_components = int(node_colors.max()) + 1 if node_colors.size else 0
         
         pos = nx.spring_layout(graph, k=1, iterations=50)
         nx.draw(graph, pos, 
@@ -193,7 +194,7 @@ class GraphVisualizer:
                 font_size=8,
                 font_weight='bold')
         
-        plt.title(f"{title}\nNumber of components: {len(components)}", 
+        plt.title(f"{title}\nNumber of components: {num_components}", 
                   fontsize=16, fontweight='bold')
         plt.axis('off')
         
@@ -0,0 +1,77 @@
+"""
+Shared fixtures: small fixed graphs, built both as NetworkX graphs and as
+CSRGraphs, covering the degenerate inputs every kernel has to accept.
+"""
+
+import os
+import sys
+
+import networkx as nx
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'src'), ROOT]  # modules and the analysis scripts
+
+from csr_graph import CSRGraph  # noqa: E402
+
+
+def _disconnected():
+    graph = nx.disjoint_union(nx.karate_club_graph(), nx.cycle_graph(5))
+    graph.add_nodes_from([100, 101])  # isolated nodes
+    graph.add_edge(102, 103)
+    return graph
+
+
+def _self_loops():
+    graph = nx.karate_club_graph()
+    graph.add_edges_from([(0, 0), (5, 5)])
+    return graph
+
+
+UNDIRECTED_GRAPHS = {
+    'empty': nx.Graph,
+    'single_node': lambda: nx.empty_graph(1),
+    'self_loop_only': lambda: nx.Graph([(0, 0)]),
+    'karate': nx.karate_club_graph,
+    'self_loops': _self_loops,
+    'disconnected': _disconnected,
+    'path': lambda: nx.path_graph(30),
+    'tree': lambda: nx.balanced_tree(2, 4),
+    'random': lambda: nx.gnm_random_graph(60, 180, seed=7),
+}
+
+DIRECTED_GRAPHS = {
+    'empty_directed': nx.DiGraph,
+    'directed_random': lambda: nx.gnm_random_graph(40, 160, seed=3, directed=True),
+    'directed_self_loops': lambda: nx.DiGraph([(0, 1), (1, 0), (1, 2), (2, 2), (3, 1), (2, 4)]),
+    'directed_disconnected': lambda: nx.disjoint_union(
+        nx.gnm_random_graph(15, 40, seed=5, directed=True), nx.DiGraph([(0, 1), (1, 2), (2, 0)])),
+}
+
+ALL_GRAPHS = {**UNDIRECTED_GRAPHS, **DIRECTED_GRAPHS}
+
+
+def to_dict(csr: CSRGraph, values) -> dict:
+    """
+    Map a per-index array onto node identifiers, like NetworkX's dict results.
+    """
+    return dict(zip(csr.node_ids.tolist(), np.asarray(values).tolist()))
+
+
+@pytest.fixture(params=sorted(UNDIRECTED_GRAPHS))
+def undirected(request):
+    graph = UNDIRECTED_GRAPHS[request.param]()
+    return graph, CSRGraph.from_networkx(graph)
+
+
+@pytest.fixture(params=sorted(DIRECTED_GRAPHS))
+def directed(request):
+    graph = DIRECTED_GRAPHS[request.param]()
+    return graph, CSRGraph.from_networkx(graph)
+
+
+@pytest.fixture(params=sorted(ALL_GRAPHS))
+def any_graph(request):
+    graph = ALL_GRAPHS[request.param]()
+    return graph, CSRGraph.from_networkx(graph)
@@ -0,0 +1,33 @@
+import networkx as nx
+import numpy as np
+
+from betweenness import betweenness_centrality
+from conftest import to_dict
+
+
+def test_exact_betweenness_matches_networkx(any_graph):
+    graph, csr = any_graph
+    scores, pivots = betweenness_centrality(csr)
+    assert pivots == len(graph)
+    expected = nx.betweenness_centrality(graph)
+    for node, value in to_dict(csr, scores).items():
+        assert np.isclose(value, expected[node])
+
+
+def test_unnormalized_betweenness_matches_networkx(any_graph):
+    graph, csr = any_graph
+    scores, _ = betweenness_centrality(csr, normalized=False)
+    expected = nx.betweenness_centrality(graph, normalized=False)
+    for node, value in to_dict(csr, scores).items():
+        assert np.isclose(value, expected[node])
+
+
+def test_sampled_betweenness_is_close():
+    graph = nx.connected_watts_strogatz_graph(200, 6, 0.1, seed=1)
+    from csr_graph import CSRGraph
+    csr = CSRGraph.from_networkx(graph)
+    scores, pivots = betweenness_centrality(csr, pivots=100, seed=0)
+    expected = nx.betweenness_centrality(graph)
+    exact = np.array([expected[node] for node in csr.node_ids.tolist()])
+    assert pivots == 100
+    assert np.abs(scores - exact).max() < 0.05
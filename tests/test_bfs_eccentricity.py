@@ -0,0 +1,58 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from bfs import bfs_distances, distance_sums
+from components import component_labels, largest_component_nodes
+from conftest import to_dict
+from csr_graph import CSRGraph
+from eccentricity import distance_extrema
+
+
+def test_bfs_distances_match_networkx(any_graph):
+    graph, csr = any_graph
+    if not len(graph):
+        return
+    source = csr.node_ids[0]
+    dist = bfs_distances(csr, 0)
+    expected = nx.single_source_shortest_path_length(graph, source)
+    for node, d in to_dict(csr, dist).items():
+        assert d == expected.get(node, -1)
+
+
+def test_distance_sums_match_networkx(any_graph):
+    graph, csr = any_graph
+    sums = distance_sums(csr)
+    # Distances from every other node to each node (incoming for directed graphs)
+    reverse = graph.reverse() if graph.is_directed() else graph
+    for i, node in enumerate(csr.node_ids.tolist()):
+        lengths = nx.single_source_shortest_path_length(reverse, node)
+        others = [d for other, d in lengths.items() if other != node]
+        assert sums['reached'][i] == len(others)
+        assert sums['distance_sum'][i] == sum(others)
+        assert np.isclose(sums['inverse_distance_sum'][i], sum(1 / d for d in others))
+        assert sums['farthest'][i] == max(others, default=0)
+
+
+@pytest.mark.parametrize('make', [nx.karate_club_graph, lambda: nx.path_graph(25),
+                                  lambda: nx.balanced_tree(3, 3),
+                                  lambda: nx.connected_watts_strogatz_graph(80, 4, 0.1, seed=2),
+                                  lambda: nx.empty_graph(1)])
+def test_distance_extrema_match_networkx(make):
+    graph = make()
+    csr = CSRGraph.from_networkx(graph)
+    extrema = distance_extrema(csr)
+    assert extrema['diameter'] == nx.diameter(graph)
+    assert extrema['radius'] == nx.radius(graph)
+    assert set(csr.node_ids[extrema['center']].tolist()) == set(nx.center(graph))
+    assert set(csr.node_ids[extrema['periphery']].tolist()) == set(nx.periphery(graph))
+
+
+def test_distance_extrema_of_largest_component():
+    graph = nx.disjoint_union(nx.path_graph(12), nx.karate_club_graph())
+    csr = CSRGraph.from_networkx(graph)
+    nodes = largest_component_nodes(component_labels(csr)[1])
+    extrema = distance_extrema(csr.subgraph(nodes))
+    largest = graph.subgraph(max(nx.connected_components(graph), key=len))
+    assert extrema['diameter'] == nx.diameter(largest)
+    assert extrema['radius'] == nx.radius(largest)
@@ -0,0 +1,63 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from centrality import (distance_centralities, eigenvector_centrality, katz_centrality,
+                        load_vector, save_vectors, spectral_radius, top_k, top_k_closeness)
+from conftest import to_dict
+from csr_graph import CSRGraph
+
+
+def test_closeness_and_harmonic_match_networkx(any_graph):
+    graph, csr = any_graph
+    scores = distance_centralities(csr)
+    closeness, harmonic = nx.closeness_centrality(graph), nx.harmonic_centrality(graph)
+    for node, value in to_dict(csr, scores['closeness']).items():
+        assert np.isclose(value, closeness[node])
+    for node, value in to_dict(csr, scores['harmonic']).items():
+        assert np.isclose(value, harmonic[node])
+
+
+@pytest.mark.parametrize('make', [nx.karate_club_graph,
+                                  lambda: nx.gnm_random_graph(40, 200, seed=3, directed=True)])
+def test_eigenvector_and_katz_match_networkx(make):
+    graph = make()
+    csr = CSRGraph.from_networkx(graph)
+    eigenvector = eigenvector_centrality(csr, tol=1e-10, max_iter=1000)
+    expected = nx.eigenvector_centrality(graph, tol=1e-10, max_iter=1000)
+    for node, value in to_dict(csr, eigenvector).items():
+        assert np.isclose(value, expected[node], atol=1e-6)
+
+    radius = spectral_radius(csr, eigenvector)
+    assert np.isclose(radius, max(abs(np.linalg.eigvals(nx.to_numpy_array(graph, weight=None)))), rtol=1e-4)
+    alpha = 0.5 / radius
+    katz = katz_centrality(csr, alpha=alpha, tol=1e-10)
+    expected = nx.katz_centrality(graph, alpha=alpha, tol=1e-10, max_iter=5000)
+    for node, value in to_dict(csr, katz).items():
+        assert np.isclose(value, expected[node], atol=1e-6)
+
+
+def test_top_k_closeness_matches_full_ranking(undirected):
+    graph, csr = undirected
+    nodes, values, _ = top_k_closeness(csr, k=5)
+    simple = nx.Graph(graph)
+    simple.remove_edges_from(list(nx.selfloop_edges(simple)))
+    expected = sorted(nx.closeness_centrality(simple).values(), reverse=True)[:5]
+    assert np.allclose(values, expected)
+    closeness = nx.closeness_centrality(simple)
+    for node, value in zip(csr.node_ids[nodes].tolist(), values):
+        assert np.isclose(closeness[node], value)
+
+
+def test_top_k_orders_best_first():
+    scores = np.array([0.1, 0.7, 0.3, 0.7, 0.0])
+    nodes, values = top_k(scores, 3)
+    assert nodes.tolist() == [1, 3, 2]
+    assert values.tolist() == [0.7, 0.7, 0.3]
+    assert len(top_k(scores, 0)[0]) == 0
+
+
+def test_vectors_round_trip(tmp_path):
+    values = np.linspace(0, 1, 10)
+    save_vectors(str(tmp_path), {'pagerank': values}, np.arange(10))
+    assert np.allclose(load_vector(str(tmp_path), 'pagerank'), values)
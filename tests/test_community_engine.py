@@ -0,0 +1,146 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from community_engine import (adjacency_matrix, community_levels, detect_partition, label_propagation, modularity,
+                              normalized_mutual_info, resolution_sweep)
+from components import component_labels
+from conftest import ALL_GRAPHS
+from csr_graph import CSRGraph
+from kcore import core_decomposition
+
+
+def _communities(csr, labels):
+    groups = {}
+    for node, label in zip(csr.node_ids.tolist(), labels.tolist()):
+        groups.setdefault(label, set()).add(node)
+    return list(groups.values())
+
+
+@pytest.mark.parametrize('resolution', [0.5, 1.0, 2.0])
+def test_modularity_matches_networkx(any_graph, resolution):
+    graph, csr = any_graph
+    if graph.number_of_edges() == 0:
+        assert modularity(csr, np.arange(len(graph)), resolution) == 0.0
+        return
+    labels = np.arange(len(graph)) % 3
+    expected = nx.community.modularity(graph, _communities(csr, labels), weight=None,
+                                       resolution=resolution)
+    assert np.isclose(modularity(csr, labels, resolution), expected)
+
+
+@pytest.mark.parametrize('method', ['louvain', 'leiden'])
+def test_partition_quality_on_known_graphs(method):
+    graph = nx.karate_club_graph()
+    csr = CSRGraph.from_networkx(graph)
+    labels, q = detect_partition(csr, method, seed=0)
+    assert len(labels) == csr.number_of_nodes()
+    assert np.isclose(q, nx.community.modularity(graph, _communities(csr, labels), weight=None))
+    assert q > 0.40
+
+    # Planted cliques joined by single edges are recovered exactly
+    caveman = nx.connected_caveman_graph(6, 8)
+    csr = CSRGraph.from_networkx(caveman)
+    labels, _ = detect_partition(csr, method, seed=0)
+    assert len(np.unique(labels)) == 6
+
+
+def _tailed_cycle():
+    graph = nx.cycle_graph(20)
+    nx.add_path(graph, [0] + list(range(100, 200)))
+    return graph
+
+
+@pytest.mark.parametrize('method', ['louvain', 'leiden'])
+@pytest.mark.parametrize('graph', [nx.path_graph(100), nx.balanced_tree(2, 6), _tailed_cycle(),
+                                   nx.lollipop_graph(10, 150), nx.barabasi_albert_graph(500, 1, seed=1)],
+                         ids=['path', 'tree', 'tailed_cycle', 'lollipop', 'random_tree'])
+def test_leaf_folding_keeps_modularity(graph, method):
+    csr = CSRGraph.from_networkx(graph)
+    core = core_decomposition(csr)[0]
+    plain = detect_partition(csr, method, seed=0)[1]
+    folded = detect_partition(csr, method, seed=0, core=core)[1]
+    assert plain > 0.75
+    assert folded == pytest.approx(plain, abs=0.005)
+
+
+def test_leiden_communities_are_connected():
+    graph = nx.gnm_random_graph(300, 900, seed=2)
+    csr = CSRGraph.from_networkx(graph)
+    for labels in community_levels(csr, 'leiden', seed=1):
+        for community in np.unique(labels):
+            members = csr.node_ids[labels == community].tolist()
+            assert nx.is_connected(graph.subgraph(members))
+
+
+def test_levels_get_coarser():
+    csr = CSRGraph.from_networkx(nx.connected_caveman_graph(10, 5))
+    levels = community_levels(csr, 'louvain', seed=0)
+    counts = [len(np.unique(labels)) for labels in levels]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_label_propagation_finds_cliques():
+    csr = CSRGraph.from_networkx(nx.connected_caveman_graph(8, 6))
+    labels = label_propagation(csr, seed=0)
+    assert len(np.unique(labels)) == 8
+
+
+def test_label_propagation_respects_components():
+    graph = nx.disjoint_union(nx.complete_graph(5), nx.complete_graph(4))
+    csr = CSRGraph.from_networkx(graph)
+    labels = label_propagation(csr, seed=0)
+    _, components = component_labels(csr)
+    assert normalized_mutual_info(labels, components) == 1.0
+
+
+def test_normalized_mutual_info():
+    a = np.array([0, 0, 1, 1, 2, 2])
+    assert normalized_mutual_info(a, a[::-1] + 5) == 1.0
+    assert normalized_mutual_info(a, np.zeros(6)) == 0.0
+    # I(a; b) = (2/3) log 2, H(a) = log 3, H(b) = log 2
+    expected = (2 / 3 * np.log(2)) / ((np.log(3) + np.log(2)) / 2)
+    assert np.isclose(normalized_mutual_info(a, np.array([0, 0, 0, 1, 1, 1])), expected)
+
+
+def test_resolution_sweep_summaries():
+    csr = CSRGraph.from_networkx(nx.connected_caveman_graph(6, 6))
+    results = resolution_sweep(csr, resolutions=(0.5, 1.0, 2.0), seeds=(0, 1))
+    assert [r['resolution'] for r in results] == [0.5, 1.0, 2.0]
+    for result in results:
+        best = modularity(csr, result['labels'], result['resolution'])
+        assert best >= result['modularity'] - 1e-12
+        assert 0.0 <= result['stability'] <= 1.0 + 1e-12
+    assert results[0]['num_communities'] <= results[-1]['num_communities']
+
+
+DEGENERATE = ['empty', 'single_node', 'self_loop_only', 'empty_directed', 'directed_self_loops']
+
+
+@pytest.mark.parametrize('name', DEGENERATE)
+def test_adjacency_matrix_on_degenerate_graphs(name):
+    graph = ALL_GRAPHS[name]()
+    csr = CSRGraph.from_networkx(graph)
+    adjacency = adjacency_matrix(csr)
+    expected = nx.to_numpy_array(graph.to_undirected(), nodelist=csr.node_ids.tolist(), weight=None)
+    expected[np.diag_indices_from(expected)] *= 2
+    np.testing.assert_array_equal(adjacency.toarray(), expected)
+    # The graph's own arrays are left untouched
+    assert csr.number_of_edges() == graph.number_of_edges()
+
+
+@pytest.mark.parametrize('method', ['louvain', 'leiden'])
+@pytest.mark.parametrize('name', DEGENERATE)
+def test_detection_on_degenerate_graphs(name, method):
+    graph = ALL_GRAPHS[name]()
+    csr = CSRGraph.from_networkx(graph)
+    labels, q = detect_partition(csr, method, seed=0, core=core_decomposition(csr)[0])
+    assert len(labels) == len(graph)
+    if graph.number_of_edges():
+        expected = nx.community.modularity(graph, _communities(csr, labels), weight=None)
+        assert q == pytest.approx(expected)
+    else:
+        assert q == 0.0
+    assert len(label_propagation(csr, seed=0)) == len(graph)
+    for summary in resolution_sweep(csr, [0.5, 1.0], seeds=[0, 1], method=method):
+        assert len(summary['labels']) == len(graph)
@@ -0,0 +1,96 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from components import component_labels, component_size_histogram, largest_component_nodes
+from conftest import to_dict
+from csr_graph import CSRGraph
+from kcore import core_decomposition, degeneracy, leaf_labels
+
+
+def _partition(csr, labels):
+    groups = {}
+    for node, label in to_dict(csr, labels).items():
+        groups.setdefault(label, set()).add(node)
+    return sorted(map(sorted, groups.values()))
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_weak_components_match_networkx(any_graph, n_jobs):
+    graph, csr = any_graph
+    count, labels = component_labels(csr, n_jobs=n_jobs)
+    if graph.is_directed():
+        expected = list(nx.weakly_connected_components(graph))
+    else:
+        expected = list(nx.connected_components(graph))
+    assert count == len(expected)
+    assert _partition(csr, labels) == sorted(map(sorted, expected))
+
+
+def test_strong_components_match_networkx(directed):
+    graph, csr = directed
+    count, labels = component_labels(csr, strong=True)
+    expected = list(nx.strongly_connected_components(graph))
+    assert count == len(expected)
+    assert _partition(csr, labels) == sorted(map(sorted, expected))
+
+
+def test_size_histogram_and_largest_component():
+    graph = nx.disjoint_union_all([nx.path_graph(5), nx.path_graph(3), nx.path_graph(3),
+                                   nx.empty_graph(2)])
+    csr = CSRGraph.from_networkx(graph)
+    _, labels = component_labels(csr)
+    sizes, counts = component_size_histogram(labels)
+    assert dict(zip(sizes.tolist(), counts.tolist())) == {1: 2, 3: 2, 5: 1}
+    assert sorted(csr.node_ids[largest_component_nodes(labels)].tolist()) == [0, 1, 2, 3, 4]
+
+
+def test_core_numbers_match_networkx(any_graph):
+    graph, csr = any_graph
+    core, order = core_decomposition(csr)
+    simple = nx.Graph(graph.to_undirected())
+    simple.remove_edges_from(list(nx.selfloop_edges(simple)))
+    expected = nx.core_number(simple)
+    assert to_dict(csr, core) == expected
+    assert degeneracy(core) == max(expected.values(), default=0)
+    assert sorted(order.tolist()) == list(range(len(graph)))
+
+
+def test_degeneracy_order_bounds_later_neighbours(undirected):
+    _, csr = undirected
+    core, order = core_decomposition(csr)
+    simple = csr.to_undirected().without_self_loops()
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    rows, cols = simple.row_indices(), simple.indices
+    later = np.bincount(rows[rank[cols] > rank[rows]], minlength=len(order))
+    assert later.max(initial=0) <= degeneracy(core)
+
+
+@pytest.mark.parametrize('graph', [nx.path_graph(6), nx.star_graph(5), nx.Graph([(0, 1)]),
+                                   nx.lollipop_graph(4, 3), nx.Graph([(0, 1), (1, 1), (1, 2), (2, 3)])])
+def test_leaf_labels_fold_only_leaves(graph):
+    csr = CSRGraph.from_networkx(graph)
+    groups = leaf_labels(csr, core_decomposition(csr)[0])
+    index = {node: i for i, node in enumerate(csr.node_ids.tolist())}
+    for component in nx.connected_components(graph):
+        # No component collapses to a single group
+        if len(component) > 1:
+            assert len({groups[index[node]] for node in component}) > 1
+    for u, v in graph.edges:
+        if u != v and groups[index[u]] == groups[index[v]]:
+            assert 1 in (graph.degree(u), graph.degree(v))
+
+
+def test_high_diameter_components():
+    rng = np.random.default_rng(0)
+    order = rng.permutation(20000)
+    # Two long shuffled paths: hard for label propagation, linear for a traversal
+    src = np.concatenate([order[:9999], order[10000:-1]])
+    dst = np.concatenate([order[1:10000], order[10001:]])
+    csr = CSRGraph.from_edges(src, dst, num_nodes=20000)
+    serial = component_labels(csr)
+    parallel = component_labels(csr, n_jobs=2)
+    assert serial[0] == parallel[0] == 2
+    np.testing.assert_array_equal(serial[1], parallel[1])
+    np.testing.assert_array_equal(np.bincount(serial[1]), [10000, 10000])
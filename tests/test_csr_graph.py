@@ -0,0 +1,50 @@
+import networkx as nx
+import numpy as np
+
+from conftest import to_dict
+from csr_graph import CSRGraph
+
+
+def test_round_trip_matches_networkx(any_graph):
+    graph, csr = any_graph
+    assert csr.number_of_nodes() == graph.number_of_nodes()
+    assert csr.number_of_edges() == graph.number_of_edges()
+    assert csr.is_directed() == graph.is_directed()
+    assert nx.utils.graphs_equal(csr.to_networkx(), graph) or \
+        set(csr.to_networkx().edges()) == set(graph.edges())
+
+
+def test_degrees_match_networkx(any_graph):
+    graph, csr = any_graph
+    assert to_dict(csr, csr.degrees()) == dict(graph.degree())
+    if graph.is_directed():
+        assert to_dict(csr, csr.in_degrees()) == dict(graph.in_degree())
+        assert to_dict(csr, csr.out_degrees()) == dict(graph.out_degree())
+
+
+def test_without_self_loops_and_undirected(any_graph):
+    graph, csr = any_graph
+    simple = csr.without_self_loops()
+    assert simple.self_loop_count() == 0
+    assert simple.number_of_edges() == graph.number_of_edges() - nx.number_of_selfloops(graph)
+    undirected = csr.to_undirected()
+    assert not undirected.is_directed()
+    assert undirected.number_of_edges() == graph.to_undirected().number_of_edges()
+
+
+def test_from_edges_deduplicates():
+    src = np.array([0, 1, 0, 2, 1])
+    dst = np.array([1, 0, 1, 2, 2])
+    csr = CSRGraph.from_edges(src, dst, num_nodes=4)
+    assert csr.number_of_edges() == 3
+    assert csr.has_edges(np.array([1, 2, 3]), np.array([0, 1, 0])).tolist() == [True, True, False]
+
+
+def test_snapshot_round_trip(tmp_path):
+    csr = CSRGraph.from_networkx(nx.karate_club_graph())
+    path = str(tmp_path / 'karate.csr')
+    csr.save(path)
+    loaded = CSRGraph.load(path)
+    assert np.array_equal(loaded.indptr, csr.indptr)
+    assert np.array_equal(loaded.indices, csr.indices)
+    assert np.array_equal(loaded.node_ids, csr.node_ids)
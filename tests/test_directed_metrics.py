@@ -0,0 +1,57 @@
+import networkx as nx
+
+from directed_metrics import degree_statistics, dyad_census, reciprocity, triad_census
+
+
+def _simple(graph):
+    graph = graph.copy()
+    graph.remove_edges_from(list(nx.selfloop_edges(graph)))
+    return graph
+
+
+def test_reciprocity_counts_reversed_edges(any_graph):
+    graph, csr = any_graph
+    if not graph.is_directed():
+        assert reciprocity(csr) == 1.0
+    elif graph.number_of_edges() == 0:
+        assert reciprocity(csr) == 0.0
+    else:
+        # Self-loops count as their own reverse, as in the original has_edge loop
+        mutual = sum(1 for u, v in graph.edges() if graph.has_edge(v, u))
+        assert abs(reciprocity(csr) - mutual / graph.number_of_edges()) < 1e-12
+        if not nx.number_of_selfloops(graph):
+            assert abs(reciprocity(csr) - nx.overall_reciprocity(graph)) < 1e-12
+
+
+def test_dyad_census_matches_networkx(directed):
+    graph, csr = directed
+    census = dyad_census(csr)
+    triads = nx.triadic_census(_simple(graph)) if len(graph) >= 3 else None
+    simple = _simple(graph)
+    mutual = sum(1 for u, v in simple.edges() if simple.has_edge(v, u)) // 2
+    asymmetric = simple.number_of_edges() - 2 * mutual
+    n = len(graph)
+    assert census == {'mutual': mutual, 'asymmetric': asymmetric,
+                      'null': n * (n - 1) // 2 - mutual - asymmetric}
+    if triads is not None:
+        assert sum(triads.values()) == n * (n - 1) * (n - 2) // 6
+
+
+def test_triad_census_matches_networkx(directed):
+    graph, csr = directed
+    if len(graph) < 3:
+        return
+    assert triad_census(csr) == nx.triadic_census(_simple(graph))
+
+
+def test_degree_statistics(directed):
+    graph, csr = directed
+    stats = degree_statistics(csr)
+    in_degrees = [d for _, d in graph.in_degree()]
+    out_degrees = [d for _, d in graph.out_degree()]
+    assert stats['max_in_degree'] == max(in_degrees, default=0)
+    assert stats['max_out_degree'] == max(out_degrees, default=0)
+    assert stats['sources'] == sum(1 for node in graph
+                                   if graph.in_degree(node) == 0 and graph.out_degree(node) > 0)
+    assert stats['sinks'] == sum(1 for node in graph
+                                 if graph.out_degree(node) == 0 and graph.in_degree(node) > 0)
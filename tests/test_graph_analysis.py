@@ -0,0 +1,88 @@
+import networkx as nx
+import pytest
+
+from batch import read_manifest, run_batch
+from graph_analysis import GraphAnalyzer, GraphComparator
+from metrics_cache import MetricsCache
+
+
+def _exact_metrics(graph, **kwargs):
+    return GraphAnalyzer(graph, 'graph').compute_all_metrics(**kwargs)
+
+
+def test_exact_metrics_match_networkx():
+    graph = nx.karate_club_graph()
+    metrics = _exact_metrics(graph)
+    assert metrics['density'] == pytest.approx(nx.density(graph))
+    assert metrics['triangles'] == sum(nx.triangles(graph).values()) // 3
+    assert metrics['diameter'] == nx.diameter(graph)
+    assert metrics['radius'] == nx.radius(graph)
+    assert metrics['clustering_coefficient'] == pytest.approx(nx.average_clustering(graph))
+    assert metrics['assortativity'] == pytest.approx(nx.degree_assortativity_coefficient(graph))
+    assert metrics['k_core']['degeneracy'] == max(nx.core_number(graph).values())
+    assert metrics['connected_components']['num_components'] == 1
+    assert metrics['communities']['modularity'] > 0.4
+
+
+def test_directed_metrics_match_networkx():
+    graph = nx.gnm_random_graph(40, 160, seed=3, directed=True)
+    metrics = _exact_metrics(graph)
+    assert metrics['density'] == pytest.approx(nx.density(graph))
+    assert metrics['reciprocity'] == pytest.approx(nx.overall_reciprocity(graph))
+    components = metrics['connected_components']
+    assert components['num_components'] == nx.number_strongly_connected_components(graph)
+    assert components['num_weak_components'] == nx.number_weakly_connected_components(graph)
+    assert 'directed_structure' in metrics
+
+
+def test_parallel_and_cached_runs_agree(tmp_path):
+    graph = nx.karate_club_graph()
+    serial = _exact_metrics(graph)
+    parallel = _exact_metrics(graph, n_jobs=2)
+    cache = MetricsCache(str(tmp_path))
+    _exact_metrics(graph, cache=cache)
+    cached = _exact_metrics(graph, cache=cache)
+    for metrics in (parallel, cached):
+        for key in ('density', 'triangles', 'diameter', 'radius', 'clustering_coefficient'):
+            assert metrics[key] == pytest.approx(serial[key])
+
+
+def test_approximate_metrics_report_intervals():
+    graph = nx.powerlaw_cluster_graph(300, 3, 0.4, seed=2)
+    metrics = _exact_metrics(graph, approximate=True, seed=0)
+    approximation = metrics['approximation']
+    assert {'triangles', 'clustering_coefficient', 'diameter'} <= set(approximation)
+    diameter = approximation['diameter']
+    assert diameter['ci_low'] <= nx.diameter(graph) <= diameter['ci_high']
+
+
+def test_comparator_rankings():
+    analyzers = []
+    for name, graph in (('karate', nx.karate_club_graph()), ('path', nx.path_graph(20)),
+                        ('star', nx.star_graph(10))):
+        analyzer = GraphAnalyzer(graph, name)
+        analyzer.compute_all_metrics()
+        analyzers.append(analyzer)
+    comparator = GraphComparator(analyzers)
+    assert comparator.names == ['karate', 'path', 'star']
+    ranks = comparator.rankings(['diameter'])
+    assert ranks.loc['path', 'diameter'] == 1
+    comparison = comparator.compare_metrics()
+    assert comparison['triangles']['rank']['karate'] == 1
+    differences, ratios = comparator.pairwise('edges')
+    assert differences.loc['karate', 'path'] == 78 - 19
+    assert ratios.loc['star', 'star'] == 1.0
+    distances = comparator.structural_distances(['degree_ks', 'edge_jaccard'])
+    assert distances['degree_ks'].shape == (3, 3)
+
+
+def test_run_batch(tmp_path):
+    nx.write_edgelist(nx.karate_club_graph(), tmp_path / 'karate.txt', data=False)
+    nx.write_edgelist(nx.cycle_graph(6), tmp_path / 'cycle.txt', data=False)
+    (tmp_path / 'manifest.txt').write_text('karate.txt\n# comment\ncycle.txt\nmissing.txt\n')
+    entries = read_manifest(str(tmp_path / 'manifest.txt'))
+    assert [entry['name'] for entry in entries] == ['karate', 'cycle', 'missing']
+    table = run_batch(entries, output_dir=str(tmp_path / 'out'))
+    assert table['edges'].tolist()[:2] == [78, 6]
+    assert table['error'].isna().tolist() == [True, True, False]
+    assert (tmp_path / 'out' / 'summary.csv').exists()
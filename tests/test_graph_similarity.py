@@ -0,0 +1,121 @@
+from itertools import combinations
+
+import networkx as nx
+import numpy as np
+import pytest
+from scipy.stats import ks_2samp
+
+from conftest import UNDIRECTED_GRAPHS
+from csr_graph import CSRGraph
+from graph_similarity import (GRAPHLETS, SIMILARITY_MEASURES, degree_ks, distance_matrix,
+                              edge_jaccard, graph_signature, graphlet_counts, laplacian_spectrum,
+                              spectral_distance)
+
+
+def _brute_force_graphlets(graph):
+    """
+    Count the GRAPHLETS subgraphs (not induced) by enumerating small edge sets.
+    """
+    simple = nx.Graph(graph)
+    simple.remove_edges_from(nx.selfloop_edges(simple))
+    edges = list(simple.edges)
+    counts = dict.fromkeys(GRAPHLETS, 0)
+    counts['edges'] = len(edges)
+    for pair in combinations(edges, 2):
+        if len(set(pair[0]) | set(pair[1])) == 3:
+            counts['wedges'] += 1
+    for triple in combinations(edges, 3):
+        sub = nx.Graph(triple)
+        degrees = sorted(d for _, d in sub.degree())
+        if len(sub) == 3:
+            counts['triangles'] += 1
+        elif len(sub) == 4 and nx.is_connected(sub):
+            counts['3-stars' if degrees[-1] == 3 else '3-paths'] += 1
+    for quad in combinations(edges, 4):
+        sub = nx.Graph(quad)
+        if len(sub) == 4 and sorted(d for _, d in sub.degree()) == [1, 2, 2, 3]:
+            counts['tailed_triangles'] += 1
+    return [counts[name] for name in GRAPHLETS]
+
+
+@pytest.mark.parametrize('graph', [nx.petersen_graph(), nx.complete_graph(5), nx.path_graph(6),
+                                   nx.star_graph(4), nx.gnm_random_graph(9, 16, seed=2),
+                                   nx.Graph([(0, 0), (0, 1), (1, 2), (2, 0), (2, 3)])])
+def test_graphlet_counts_brute_force(graph):
+    counts = graphlet_counts(CSRGraph.from_networkx(graph))
+    assert counts.tolist() == _brute_force_graphlets(graph)
+
+
+def test_dense_spectrum(undirected):
+    graph, csr = undirected
+    low, high, full = laplacian_spectrum(csr)
+    simple = nx.Graph(graph)
+    simple.remove_edges_from(nx.selfloop_edges(simple))
+    expected = np.linalg.eigvalsh(nx.normalized_laplacian_matrix(simple, weight=None).toarray()) \
+        if len(graph) else np.empty(0)
+    assert full
+    np.testing.assert_allclose(low, expected, atol=1e-10)
+    np.testing.assert_allclose(high, expected, atol=1e-10)
+
+
+def test_sparse_spectrum_ends():
+    graph = nx.gnm_random_graph(700, 3000, seed=4)
+    low, high, full = laplacian_spectrum(CSRGraph.from_networkx(graph), k=6)
+    spectrum = np.linalg.eigvalsh(nx.normalized_laplacian_matrix(graph, weight=None).toarray())
+    assert not full
+    np.testing.assert_allclose(low, spectrum[:6], atol=1e-6)
+    np.testing.assert_allclose(high, spectrum[-6:], atol=1e-6)
+
+
+def test_degree_ks_matches_scipy():
+    a, b = nx.karate_club_graph(), nx.gnm_random_graph(50, 120, seed=1)
+    signature_a = graph_signature(CSRGraph.from_networkx(a))
+    signature_b = graph_signature(CSRGraph.from_networkx(b))
+    expected = ks_2samp([d for _, d in a.degree()], [d for _, d in b.degree()]).statistic
+    assert degree_ks(signature_a, signature_b) == pytest.approx(expected)
+
+
+def test_edge_jaccard_matches_set_overlap():
+    a = nx.gnm_random_graph(30, 80, seed=5)
+    b = nx.gnm_random_graph(30, 80, seed=6)
+    # Same edges with another node order and reversed endpoints
+    shuffled = nx.Graph()
+    shuffled.add_nodes_from(reversed(list(b.nodes)))
+    shuffled.add_edges_from((v, u) for u, v in b.edges)
+    edges_a = {frozenset(e) for e in a.edges}
+    edges_b = {frozenset(e) for e in b.edges}
+    expected = len(edges_a & edges_b) / len(edges_a | edges_b)
+    signature_a = graph_signature(CSRGraph.from_networkx(a))
+    signature_b = graph_signature(CSRGraph.from_networkx(shuffled))
+    assert edge_jaccard(signature_a, signature_b) == pytest.approx(expected)
+    assert edge_jaccard(signature_a, signature_a) == 1.0
+
+
+@pytest.mark.parametrize('measure', SIMILARITY_MEASURES)
+def test_distance_matrix_properties(measure):
+    signatures = [graph_signature(CSRGraph.from_networkx(UNDIRECTED_GRAPHS[name]()))
+                  for name in ('karate', 'path', 'tree', 'random', 'disconnected')]
+    matrix = distance_matrix(signatures, measure)
+    np.testing.assert_allclose(matrix, matrix.T)
+    np.testing.assert_allclose(np.diag(matrix), 0.0, atol=1e-12)
+    assert (matrix >= -1e-12).all()
+
+
+def test_spectral_distance_uses_fixed_k():
+    small = graph_signature(CSRGraph.from_networkx(nx.path_graph(6)), k=10)
+    medium = graph_signature(CSRGraph.from_networkx(nx.cycle_graph(40)), k=10)
+    large = graph_signature(CSRGraph.from_networkx(nx.gnm_random_graph(700, 3000, seed=4)), k=10)
+    assert small.full_spectrum and medium.full_spectrum and not large.full_spectrum
+
+    def vector(graph, k=10):
+        spectrum = np.linalg.eigvalsh(nx.normalized_laplacian_matrix(graph, weight=None).toarray())[:k]
+        return np.pad(spectrum, (0, k - len(spectrum)))
+
+    # Full spectra are truncated to k, short ones zero-padded
+    expected = np.linalg.norm(vector(nx.path_graph(6)) - vector(nx.cycle_graph(40)))
+    assert spectral_distance(small, medium) == pytest.approx(expected)
+    matrix = distance_matrix([small, medium, large], 'spectral')
+    for i, j, a, b in ((0, 1, small, medium), (0, 2, small, large), (1, 2, medium, large)):
+        assert matrix[i, j] == pytest.approx(spectral_distance(a, b))
+    with pytest.raises(ValueError):
+        spectral_distance(small, graph_signature(CSRGraph.from_networkx(nx.path_graph(6)), k=5))
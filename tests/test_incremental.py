@@ -0,0 +1,82 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from conftest import ALL_GRAPHS
+from csr_graph import CSRGraph
+from incremental import IncrementalGraph
+
+
+def _expected(graph):
+    """
+    Metrics of a NetworkX graph in the IncrementalGraph.metrics() layout.
+    """
+    simple = nx.Graph(graph)
+    simple.remove_edges_from(nx.selfloop_edges(simple))
+    degrees = np.array([d for _, d in graph.degree()], dtype=np.float64)
+    expected = {
+        'density': nx.density(graph) if len(graph) > 1 else 0.0,
+        'triangles': sum(nx.triangles(simple).values()) // 3,
+        'avg_degree': degrees.mean() if len(degrees) else 0.0,
+        'max_degree': int(degrees.max()) if len(degrees) else 0,
+    }
+    if not graph.is_directed():
+        expected['clustering_coefficient'] = nx.average_clustering(simple) if len(graph) else 0.0
+        expected['num_components'] = nx.number_connected_components(graph)
+    return expected
+
+
+def _check(state, graph):
+    metrics = state.metrics()
+    expected = _expected(graph)
+    assert metrics['density'] == pytest.approx(expected['density'])
+    assert metrics['triangles'] == expected['triangles']
+    assert metrics['degree_distribution']['avg_degree'] == pytest.approx(expected['avg_degree'])
+    assert metrics['degree_distribution']['max_degree'] == expected['max_degree']
+    if not graph.is_directed():
+        assert metrics['clustering_coefficient'] == pytest.approx(expected['clustering_coefficient'])
+        assert metrics['connected_components']['num_components'] == expected['num_components']
+
+
+def test_initial_metrics(any_graph):
+    graph, csr = any_graph
+    _check(IncrementalGraph(csr), graph)
+
+
+@pytest.mark.parametrize('name', ['karate', 'disconnected', 'directed_random', 'empty'])
+def test_batches_match_recompute(name):
+    graph = ALL_GRAPHS[name]()
+    state = IncrementalGraph(CSRGraph.from_networkx(graph))
+    rng = np.random.default_rng(11)
+    for _ in range(5):
+        nodes = list(graph.nodes) + [200, 201]  # insertions may add new nodes
+        added = [tuple(rng.choice(nodes, 2).tolist()) for _ in range(8)]
+        edges = list(graph.edges)
+        picks = rng.choice(len(edges), min(6, len(edges)), replace=False) if edges else []
+        removed = [edges[i] for i in picks]
+        state.apply(added=added, removed=removed)
+        graph.remove_edges_from(removed)
+        graph.add_edges_from(added)
+        _check(state, graph)
+
+
+def test_to_csr_round_trip():
+    graph = nx.karate_club_graph()
+    state = IncrementalGraph(CSRGraph.from_networkx(graph))
+    state.apply(added=[(0, 40), (40, 41)], removed=[(0, 1)])
+    rebuilt = state.to_csr()
+    assert rebuilt.number_of_nodes() == 36
+    assert rebuilt.number_of_edges() == graph.number_of_edges() + 1
+    fresh = IncrementalGraph(rebuilt).metrics()
+    assert fresh['triangles'] == state.metrics()['triangles']
+    assert fresh['clustering_coefficient'] == pytest.approx(state.metrics()['clustering_coefficient'])
+
+
+def test_deleting_missing_edge_is_noop():
+    csr = CSRGraph.from_networkx(nx.path_graph(4))
+    state = IncrementalGraph(csr)
+    before = state.metrics()
+    state.apply(removed=[(0, 3), (7, 8)])
+    after = state.metrics()
+    assert after['density'] == before['density']
+    assert after['connected_components'] == before['connected_components']
@@ -0,0 +1,53 @@
+import networkx as nx
+import numpy as np
+
+from csr_graph import CSRGraph
+from metrics_cache import MetricsCache, graph_fingerprint
+
+
+def test_fingerprint_tracks_content():
+    karate = nx.karate_club_graph()
+    a = graph_fingerprint(CSRGraph.from_networkx(karate))
+    assert a == graph_fingerprint(CSRGraph.from_networkx(nx.karate_club_graph()))
+    assert a != graph_fingerprint(CSRGraph.from_networkx(karate.to_directed()))
+    karate.add_edge(0, 9)
+    assert a != graph_fingerprint(CSRGraph.from_networkx(karate))
+
+
+def test_load_store_invalidate(tmp_path):
+    cache = MetricsCache(str(tmp_path))
+    assert cache.load('graph', 'density') == (False, None)
+    cache.store('graph', 'density', 0.25)
+    cache.store('graph', 'pagerank', np.arange(3), {'alpha': 0.85})
+    cache.store('other', 'density', 0.5)
+    assert cache.load('graph', 'density') == (True, 0.25)
+    assert cache.load('graph', 'pagerank', {'alpha': 0.9}) == (False, None)
+    hit, value = cache.load('graph', 'pagerank', {'alpha': 0.85})
+    assert hit and value.tolist() == [0, 1, 2]
+
+    assert cache.invalidate(metric='density') == 2
+    assert cache.load('graph', 'density') == (False, None)
+    assert cache.invalidate(fingerprint='graph') == 1
+    assert cache.size() == 0
+
+
+def test_eviction_keeps_budget(tmp_path):
+    cache = MetricsCache(str(tmp_path), max_bytes=5000)
+    for i in range(10):
+        cache.store('graph', f'metric{i}', np.zeros(200))
+    assert cache.size() <= 5000
+    assert cache.load('graph', 'metric9')[0]
+
+
+def test_format_version_bump_misses_old_entries(tmp_path, monkeypatch):
+    import metrics_cache
+    cache = MetricsCache(str(tmp_path))
+    cache.store('graph', 'communities', {'modularity': 0.1})
+    monkeypatch.setattr(metrics_cache, 'CACHE_FORMAT_VERSION', metrics_cache.CACHE_FORMAT_VERSION + 1)
+    assert cache.load('graph', 'communities') == (False, None)
+
+
+def test_main_analysis_no_cache_flag():
+    import main_analysis
+    assert main_analysis.parse_args(['--no-cache']).no_cache
+    assert not main_analysis.parse_args([]).no_cache
@@ -0,0 +1,57 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from conftest import to_dict
+from csr_graph import CSRGraph
+from pagerank import pagerank
+
+
+@pytest.mark.parametrize('method', ['power', 'gauss_seidel'])
+def test_pagerank_matches_networkx(any_graph, method):
+    graph, csr = any_graph
+    scores, _ = pagerank(csr, method=method, tol=1e-10, max_iter=500)
+    if not len(graph):
+        assert len(scores) == 0
+        return
+    expected = nx.pagerank(graph, weight=None, tol=1e-10, max_iter=500)
+    for node, value in to_dict(csr, scores).items():
+        assert np.isclose(value, expected[node], atol=1e-7)
+
+
+def test_personalized_pagerank_matches_networkx():
+    graph = nx.gnm_random_graph(40, 160, seed=3, directed=True)
+    csr = CSRGraph.from_networkx(graph)
+    weights = np.zeros(csr.number_of_nodes())
+    weights[:3] = [1.0, 2.0, 3.0]
+    scores, _ = pagerank(csr, personalization=weights, tol=1e-10, max_iter=500)
+    personalization = dict(zip(csr.node_ids.tolist(), weights.tolist()))
+    expected = nx.pagerank(graph, personalization=personalization, tol=1e-10, max_iter=500)
+    for node, value in to_dict(csr, scores).items():
+        assert np.isclose(value, expected[node], atol=1e-7)
+
+
+def test_batched_personalizations_and_warm_start():
+    graph = nx.karate_club_graph()
+    csr = CSRGraph.from_networkx(graph)
+    teleport = np.eye(csr.number_of_nodes())[:, :3]
+    batch, _ = pagerank(csr, personalization=teleport, tol=1e-10, max_iter=500)
+    for column in range(3):
+        single, _ = pagerank(csr, personalization=teleport[:, column], tol=1e-10, max_iter=500)
+        assert np.allclose(batch[:, column], single)
+
+    cold, cold_iterations = pagerank(csr, tol=1e-10, max_iter=500)
+    warm, warm_iterations = pagerank(csr, start=cold, tol=1e-10, max_iter=500)
+    assert np.allclose(cold, warm)
+    assert warm_iterations < cold_iterations
+
+
+def test_weighted_pagerank_matches_networkx():
+    graph = nx.gnm_random_graph(30, 90, seed=4, directed=True)
+    for i, (u, v) in enumerate(graph.edges()):
+        graph[u][v]['weight'] = 1.0 + i % 5
+    csr = CSRGraph.from_networkx(graph)
+    scores, _ = pagerank(csr, weight='weight', tol=1e-10, max_iter=500)
+    expected = nx.pagerank(graph, weight='weight', tol=1e-10, max_iter=500)
+    for node, value in to_dict(csr, scores).items():
+        assert np.isclose(value, expected[node], atol=1e-7)
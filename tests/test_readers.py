@@ -0,0 +1,108 @@
+import gzip
+import warnings
+
+import numpy as np
+import pytest
+
+import edge_reader
+from edge_reader import SIGNED_TEMPORAL_SCHEMA, count_tokens, read_edge_arrays, read_edge_table
+from ego_loader import _read_int_table, load_ego_bundle
+
+
+def _legacy_fromstring(block, dtype=float, sep=' '):
+    """
+    NumPy 1.x behaviour: stop at the first unparsable token with a warning.
+    """
+    values = []
+    for token in block.split():
+        try:
+            values.append(np.dtype(dtype).type(token.decode()))
+        except ValueError:
+            warnings.warn("string or file could not be read to its end", DeprecationWarning)
+            break
+    return np.array(values, dtype=dtype)
+
+
+@pytest.fixture(params=['numpy', 'legacy'])
+def fromstring(request, monkeypatch):
+    if request.param == 'legacy':
+        monkeypatch.setattr(np, 'fromstring', _legacy_fromstring)
+    return request.param
+
+
+def test_count_tokens():
+    assert count_tokens(b'') == 0
+    assert count_tokens(b'  \n\n') == 0
+    assert count_tokens(b'1 2\n3\t4\r\n') == 4
+    assert count_tokens(b' a  b ') == 2
+
+
+def test_integer_edge_list(tmp_path, fromstring):
+    path = tmp_path / 'edges.txt.gz'
+    with gzip.open(path, 'wt') as f:
+        f.write('# comment\n1 2\n2 3\n\n3 1\n')
+    src, dst, node_ids, _ = read_edge_arrays(str(path), verbose=False)
+    assert node_ids.tolist() == [1, 2, 3]
+    assert node_ids[src].tolist() == [1, 2, 3]
+    assert node_ids[dst].tolist() == [2, 3, 1]
+
+
+@pytest.mark.parametrize('text, labels', [
+    ('1 2\n2 x\n', ['1', '2', 'x']),
+    ('1 2\nx 3\n', ['1', '2', '3', 'x']),
+    ('a b\nb c\n', ['a', 'b', 'c']),
+])
+def test_mixed_tokens_are_not_truncated(tmp_path, fromstring, text, labels):
+    path = tmp_path / 'edges.txt'
+    path.write_text(text)
+    src, dst, node_ids, _ = read_edge_arrays(str(path), chunk_bytes=4, verbose=False)
+    assert len(src) == len(dst) == 2
+    assert [str(label) for label in node_ids.tolist()] == [str(label) for label in labels]
+
+
+def test_float_labels_are_rejected(tmp_path, fromstring):
+    path = tmp_path / 'edges.txt'
+    path.write_text('1 2\n2 3.5\n')
+    with pytest.raises(ValueError, match='Non-integer'):
+        read_edge_arrays(str(path), verbose=False)
+
+
+def test_ragged_rows_raise(tmp_path, fromstring):
+    path = tmp_path / 'edges.txt'
+    path.write_text('1 2\n3 4 5\n')
+    with pytest.raises(ValueError):
+        read_edge_arrays(str(path), verbose=False)
+
+
+def test_signed_table(tmp_path, fromstring):
+    path = tmp_path / 'signed.csv'
+    path.write_text('7,8,-1,100\n8,9,10,200\n')
+    src, dst, node_ids, attributes, _ = read_edge_table(str(path), schema=SIGNED_TEMPORAL_SCHEMA,
+                                                        delimiter=',', verbose=False)
+    assert node_ids[src].tolist() == [7, 8]
+    assert attributes['rating'].tolist() == [-1, 10]
+    assert attributes['time'].tolist() == [100, 200]
+
+
+def test_int_table(tmp_path, fromstring):
+    path = tmp_path / '0.feat'
+    path.write_text('1 0 1\n2 1 1\n')
+    assert _read_int_table(str(path)).tolist() == [[1, 0, 1], [2, 1, 1]]
+    path.write_text('1 0 1\n2 1 x\n')
+    with pytest.raises(ValueError):
+        _read_int_table(str(path))
+
+
+def test_ego_bundle(tmp_path):
+    (tmp_path / '0.edges').write_text('1 2\n2 3\n')
+    (tmp_path / '0.circles').write_text('circle0\t1\t2\n')
+    (tmp_path / '0.feat').write_text('1 1 0\n2 0 1\n3 1 1\n')
+    (tmp_path / '0.egofeat').write_text('0 1\n')
+    (tmp_path / '0.featnames').write_text('0 gender;1\n1 school;5\n')
+    bundle = load_ego_bundle(str(tmp_path))
+    graph = bundle.graph
+    assert graph.node_ids.tolist() == [0, 1, 2, 3]
+    # Two listed edges plus the ego's edges to its three friends
+    assert graph.number_of_edges() == 5
+    assert bundle.circle_members(0).tolist() == [1, 2]
+    assert bundle.node_features(3).tolist() == [0, 1]
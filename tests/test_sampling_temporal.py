@@ -0,0 +1,87 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from csr_graph import CSRGraph
+from sampling import estimate_average_clustering, estimate_distance_bounds, estimate_transitivity
+from temporal import window_bounds, windowed_metrics
+
+
+@pytest.fixture
+def clustered():
+    graph = nx.powerlaw_cluster_graph(400, 4, 0.5, seed=9)
+    return graph, CSRGraph.from_networkx(graph)
+
+
+def test_transitivity_interval_covers_truth(clustered):
+    graph, csr = clustered
+    estimate = estimate_transitivity(csr, 20000, np.random.default_rng(0))
+    truth = nx.transitivity(graph)
+    assert estimate['transitivity']['ci_low'] <= truth <= estimate['transitivity']['ci_high']
+    triangles = sum(nx.triangles(graph).values()) / 3
+    assert estimate['triangles']['ci_low'] <= triangles <= estimate['triangles']['ci_high']
+
+
+def test_clustering_interval_covers_truth(clustered):
+    graph, csr = clustered
+    estimate = estimate_average_clustering(csr, 20000, np.random.default_rng(0))
+    assert estimate['ci_low'] <= nx.average_clustering(graph) <= estimate['ci_high']
+
+
+def test_estimators_on_wedge_free_graphs():
+    csr = CSRGraph.from_networkx(nx.empty_graph(5))
+    rng = np.random.default_rng(0)
+    assert estimate_transitivity(csr, 100, rng)['transitivity']['estimate'] == 0.0
+    assert estimate_average_clustering(csr, 100, rng)['estimate'] == 0.0
+
+
+@pytest.mark.parametrize('graph', [nx.path_graph(40), nx.karate_club_graph(),
+                                   nx.balanced_tree(3, 4), nx.connected_watts_strogatz_graph(200, 4, 0.1, seed=1)])
+def test_distance_bounds_are_certain(graph):
+    bounds = estimate_distance_bounds(CSRGraph.from_networkx(graph), 3, np.random.default_rng(0))
+    diameter, radius = nx.diameter(graph), nx.radius(graph)
+    assert bounds['diameter']['ci_low'] <= diameter <= bounds['diameter']['ci_high']
+    assert bounds['radius']['ci_low'] <= radius <= bounds['radius']['ci_high']
+
+
+def _timestamped(directed):
+    rng = np.random.default_rng(3)
+    src, dst = rng.integers(0, 25, 300), rng.integers(0, 25, 300)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    times = rng.integers(0, 1000, len(src)).astype(np.int64)
+    # One timestamp per edge, as from_edges keeps the last duplicate
+    pairs = {}
+    for u, v, t in zip(src.tolist(), dst.tolist(), times.tolist()):
+        pairs[(u, v) if directed else (min(u, v), max(u, v))] = t
+    src, dst = (np.array(x) for x in zip(*pairs))
+    times = np.array(list(pairs.values()), dtype=np.int64)
+    csr = CSRGraph.from_edges(src, dst, num_nodes=25, directed=directed, edge_data={'time': times})
+    return src, dst, times, csr
+
+
+@pytest.mark.parametrize('directed', [False, True])
+@pytest.mark.parametrize('step', [None, 50, 300])
+def test_windowed_metrics_match_snapshots(directed, step):
+    src, dst, times, csr = _timestamped(directed)
+    table = windowed_metrics(csr, 200, step=step)
+    assert len(table) == len(window_bounds(np.sort(csr.edge_data['time']), 200, step))
+    for row in table.itertuples():
+        keep = (times >= row.window_start) & (times < row.window_end)
+        snapshot = (nx.DiGraph if directed else nx.Graph)(zip(src[keep].tolist(), dst[keep].tolist()))
+        simple = snapshot.to_undirected()
+        assert row.nodes == len(snapshot)
+        assert row.edges == snapshot.number_of_edges()
+        assert row.triangles == sum(nx.triangles(simple).values()) // 3
+        if len(snapshot):
+            assert row.density == pytest.approx(nx.density(snapshot))
+            assert row.clustering_coefficient == pytest.approx(nx.average_clustering(simple))
+            components = list(nx.strongly_connected_components(snapshot) if directed
+                              else nx.connected_components(snapshot))
+            assert row.num_components == len(components)
+            assert row.largest_component_size == max(map(len, components))
+
+
+def test_windowed_metrics_requires_time():
+    with pytest.raises(ValueError):
+        windowed_metrics(CSRGraph.from_networkx(nx.path_graph(3)), 10)
@@ -0,0 +1,41 @@
+import networkx as nx
+import pytest
+
+from graph_analysis import GraphAnalyzer
+from scheduler import MetricTask, run_metric_tasks
+
+
+def _fail(self):
+    raise RuntimeError("assortativity failed")
+
+
+@pytest.fixture
+def failing(monkeypatch):
+    monkeypatch.setattr(GraphAnalyzer, 'compute_assortativity', _fail)
+    return GraphAnalyzer(nx.karate_club_graph(), 'karate')
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_task_errors_are_raised(failing, n_jobs):
+    with pytest.raises(RuntimeError, match='assortativity failed'):
+        failing.compute_all_metrics(n_jobs=n_jobs)
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_task_errors_can_be_recorded(failing, n_jobs):
+    metrics = failing.compute_all_metrics(n_jobs=n_jobs, raise_errors=False)
+    assert metrics['errors'] == {'assortativity': 'assortativity failed'}
+    assert 'assortativity' not in metrics
+    assert metrics['triangles'] == 45
+    assert failing.summary_row()['failed_metrics'] == 'assortativity'
+
+
+def test_dependencies_run_in_order():
+    analyzer = GraphAnalyzer(nx.karate_club_graph(), 'karate')
+    tasks = [MetricTask('clustering_coefficient', 'compute_clustering_coefficient',
+                        depends_on=['triangles']),
+             MetricTask('triangles', 'count_triangles', provides=['node_triangles'])]
+    timings = run_metric_tasks(analyzer, tasks)
+    assert list(timings) == ['triangles', 'clustering_coefficient', 'total']
+    with pytest.raises(ValueError):
+        run_metric_tasks(analyzer, [MetricTask('a', 'compute_density', depends_on=['b'])])
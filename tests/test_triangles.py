@@ -0,0 +1,35 @@
+import networkx as nx
+import numpy as np
+
+from conftest import to_dict
+from triangles import count_triangles, enumerate_triangles, local_clustering
+
+
+def test_count_triangles_matches_networkx(any_graph):
+    graph, csr = any_graph
+    simple = nx.Graph(graph.to_undirected())
+    simple.remove_edges_from(nx.selfloop_edges(simple))
+    total, per_node = count_triangles(csr)
+    expected = nx.triangles(simple)
+    assert to_dict(csr, per_node) == expected
+    assert total == sum(expected.values()) // 3
+
+
+def test_local_clustering_matches_networkx(undirected):
+    graph, csr = undirected
+    _, per_node = count_triangles(csr)
+    clustering = to_dict(csr, local_clustering(csr.to_undirected(), per_node))
+    expected = nx.clustering(graph)
+    for node, value in expected.items():
+        assert np.isclose(clustering[node], value)
+
+
+def test_enumerate_triangles_lists_each_once():
+    graph = nx.gnm_random_graph(40, 200, seed=11)
+    from csr_graph import CSRGraph
+    csr = CSRGraph.from_networkx(graph)
+    triangles = enumerate_triangles(csr)
+    found = {frozenset(csr.node_ids[row].tolist()) for row in triangles}
+    expected = {frozenset(c) for c in nx.enumerate_all_cliques(graph) if len(c) == 3}
+    assert len(triangles) == len(found) == len(expected)
+    assert found == expected